@@ -12,7 +12,6 @@ Streaming Architecture:
 from __future__ import annotations
 
 import asyncio
-import json
 import logging
 import time
 import uuid
@@ -48,6 +47,7 @@ from app.repositories.proposal_repository import ProposalRepository, get_proposa
 from app.services.tenant_ticket_fields_cache import TenantTicketFieldsCache, get_tenant_ticket_fields_cache
 from app.services.admin_service import AdminService, get_admin_service
 from app.services.freshdesk_client import FreshdeskClient
+from app.utils.sse import format_sse
 
 logger = logging.getLogger(__name__)
 
@@ -173,19 +173,19 @@ agent_graph = build_graph()
 
 async def sse_generator(
     events: AsyncGenerator[Dict[str, Any], None]
-) -> AsyncGenerator[str, None]:
+) -> AsyncGenerator[bytes, None]:
     """
-    이벤트 스트림을 SSE 포맷으로 변환
+    이벤트 스트림을 SSE 포맷으로 변환 (orjson으로 바로 UTF-8 bytes 직렬화)
     """
     last_heartbeat = time.time()
 
     try:
         async for event in events:
-            yield f"data: {json.dumps(event, ensure_ascii=False)}\n\n"
+            yield format_sse(None, event)
 
             if time.time() - last_heartbeat > 30:
                 heartbeat = {"type": "heartbeat", "timestamp": time.time()}
-                yield f"data: {json.dumps(heartbeat)}\n\n"
+                yield format_sse(None, heartbeat)
                 last_heartbeat = time.time()
 
     except Exception as e:
@@ -195,7 +195,7 @@ async def sse_generator(
             "message": str(e),
             "recoverable": False
         }
-        yield f"data: {json.dumps(error_event)}\n\n"
+        yield format_sse(None, error_event)
 
 
 async def process_analysis_background(
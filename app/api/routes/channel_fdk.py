@@ -1,14 +1,12 @@
 from typing import Any, Dict, List, Optional
 
-import json
-
 from fastapi import APIRouter, Depends, HTTPException, Query, status
-from fastapi.responses import StreamingResponse
 
 from app.core.config import get_settings
 from app.middleware.tenant_auth import TenantContext, get_optional_tenant_context
 from app.models.session import ChatRequest, ChatResponse
 from app.services.chat_usecase import ChatUsecase, get_chat_usecase
+from app.utils.sse import EventSourceResponse, encode_sse_events
 
 
 router = APIRouter(prefix="/fdk/v1", tags=["channel:fdk"])
@@ -153,10 +151,6 @@ def _validate_common_product(common_product: Optional[str]) -> None:
         )
 
 
-def _format_sse(event: str, data: Dict[str, Any]) -> str:
-    return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n"
-
-
 @router.post(
     "/chat",
     response_model=ChatResponse,
@@ -192,7 +186,7 @@ async def fdk_chat_stream(
     clarification_option: Optional[str] = Query(None, alias="clarificationOption"),
     tenant: Optional[TenantContext] = Depends(get_optional_tenant_context),
     usecase: ChatUsecase = Depends(get_chat_usecase),
-) -> StreamingResponse:
+) -> EventSourceResponse:
     normalized_sources = _validate_sources(sources)
     request = ChatRequest(
         sessionId=session_id,
@@ -204,8 +198,4 @@ async def fdk_chat_stream(
     )
     _validate_common_product(request.common_product)
 
-    async def event_stream():
-        async for event in usecase.stream_legacy_chat(request, tenant=tenant):
-            yield _format_sse(event["event"], event["data"])
-
-    return StreamingResponse(event_stream(), media_type="text/event-stream")
+    return EventSourceResponse(encode_sse_events(usecase.stream_legacy_chat(request, tenant=tenant)))
@@ -1,14 +1,12 @@
 from typing import Any, Dict, List, Optional
 
-import json
-
 from fastapi import APIRouter, Depends, HTTPException, Query
-from fastapi.responses import StreamingResponse
 
 from app.middleware.tenant_auth import TenantContext, get_tenant_context, get_optional_tenant_context
 from app.models.session import ChatRequest, ChatResponse
 from app.services.chat_usecase import ChatUsecase, get_chat_usecase
 from app.services.multitenant_chat_handler import MultitenantChatHandler, get_multitenant_chat_handler
+from app.utils.sse import EventSourceResponse, encode_sse_events
 
 
 router = APIRouter(prefix="/web/v1", tags=["channel:web"])
@@ -73,10 +71,6 @@ _WEB_ERROR_RESPONSES: Dict[int, Any] = {
 }
 
 
-def _format_sse(event: str, data: Dict[str, Any]) -> str:
-    return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n"
-
-
 @router.post("/chat", response_model=ChatResponse, responses=_WEB_ERROR_RESPONSES)
 async def web_chat(
     request: ChatRequest,
@@ -102,7 +96,7 @@ async def web_chat_stream(
     product: Optional[str] = Query(None),
     tenant: TenantContext = Depends(get_tenant_context),
     usecase: ChatUsecase = Depends(get_chat_usecase),
-) -> StreamingResponse:
+) -> EventSourceResponse:
     request = ChatRequest(
         sessionId=session_id,
         query=query,
@@ -110,11 +104,7 @@ async def web_chat_stream(
         commonProduct=product,
     )
 
-    async def event_stream():
-        async for event in usecase.stream_multitenant_chat(request, tenant=tenant):
-            yield _format_sse(event["event"], event["data"])
-
-    return StreamingResponse(event_stream(), media_type="text/event-stream")
+    return EventSourceResponse(encode_sse_events(usecase.stream_multitenant_chat(request, tenant=tenant)))
 
 
 @router.get("/tenant/info")
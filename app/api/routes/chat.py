@@ -1,20 +1,15 @@
-from typing import Any, Dict, List, Optional
+from typing import List, Optional
 
 from fastapi import APIRouter, Depends, Query
-from fastapi.responses import StreamingResponse
-import json
 
 from app.models.session import ChatRequest, ChatResponse
 from app.middleware.tenant_auth import TenantContext, get_optional_tenant_context
 from app.services.chat_usecase import ChatUsecase, get_chat_usecase
+from app.utils.sse import EventSourceResponse, encode_sse_events
 
 router = APIRouter(tags=["chat"])
 
 
-def _format_sse(event: str, data: Dict[str, Any]) -> str:
-    return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n"
-
-
 @router.post("/chat", response_model=ChatResponse, response_model_by_alias=True)
 async def chat(
     request: ChatRequest,
@@ -36,20 +31,17 @@ async def chat_stream(
     clarification_option: Optional[str] = Query(None, alias="clarificationOption"),
     tenant: Optional[TenantContext] = Depends(get_optional_tenant_context),
     usecase: ChatUsecase = Depends(get_chat_usecase),
-) -> StreamingResponse:
+) -> EventSourceResponse:
     effective_product = product or legacy_common_product
 
-    request = ChatRequest(
-        sessionId=session_id,
+    # Query 파라미터는 FastAPI가 이미 검증했으므로 재검증 없이 구성
+    request = ChatRequest.model_construct(
+        session_id=session_id,
         query=query,
-        ragStoreName=rag_store_name,
+        rag_store_name=rag_store_name,
         sources=sources or None,
-        commonProduct=effective_product,
-        clarificationOption=clarification_option,
+        common_product=effective_product,
+        clarification_option=clarification_option,
     )
 
-    async def event_stream():
-        async for event in usecase.stream_legacy_chat(request, tenant=tenant):
-            yield _format_sse(event["event"], event["data"])
-
-    return StreamingResponse(event_stream(), media_type="text/event-stream")
+    return EventSourceResponse(encode_sse_events(usecase.stream_legacy_chat(request, tenant=tenant)))
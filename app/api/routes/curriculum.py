@@ -1,17 +1,21 @@
 """커리큘럼 API 라우터."""
 
-import json
+import asyncio
+import hashlib
 import logging
-from typing import List, Optional
+from functools import lru_cache
+from types import MappingProxyType
+from typing import AsyncIterator, List, Mapping, Optional, Tuple
 from uuid import UUID, uuid4
 
-from fastapi import APIRouter, HTTPException, Query, Path
-from fastapi.responses import StreamingResponse
+import orjson
+from fastapi import APIRouter, HTTPException, Query, Path, Request
+from fastapi.responses import Response
+from pydantic import BaseModel
 
 from app.models.curriculum import (
     CurriculumModule,
     QuizQuestion,
-    QuizChoice,
     QuizSubmitRequest,
     QuizSubmitResponse,
     ModuleProgress,
@@ -19,37 +23,172 @@ from app.models.curriculum import (
     ProgressSummary,
     ModuleContent,
     ModuleContentResponse,
+    QuizQuestionListAdapter,
+    ContentLevel,
+    SectionType,
 )
 from app.services.curriculum_repository import (
+    CONTENT_CACHE_TTL_SECONDS,
+    CurriculumRepository,
     get_curriculum_repository,
     CurriculumRepositoryError,
 )
 from app.services.gemini_file_search_client import GeminiFileSearchClient
 from app.services.gemini_client import get_gemini_client
+from app.services.module_chat_history import get_module_chat_history_store
 from app.models.metadata import MetadataFilter
 from app.core.config import get_settings
+from app.utils.cache import TTLCache
+from app.utils.http_cache import conditional_json_response
+from app.utils.json_stream import iter_json_array_items
+from app.utils.sse import EventSourceResponse, format_sse
 
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/curriculum", tags=["curriculum"])
 
+# RAG 프롬프트 템플릿 (모듈 로드 시 한 번만 구성, 요청마다 값만 치환)
+LEARN_QUERY_TEMPLATE = """{product} {name} 모듈 전용 학습 콘텐츠를 생성하세요.
 
-def _get_settings():
-    """설정 가져오기."""
-    return get_settings()
+다음 섹션을 모두 포함하세요:
+1) 개요 및 핵심 개념
+2) 주요 기능과 사용법
+3) 실무 활용 팁
+4) 자주 묻는 질문
+
+모듈 설명: {desc}
+제품/카테고리 외의 내용은 포함하지 마세요."""
+
+SECTION_QUERY_TEMPLATE = """{product} 제품의 '{name}' 모듈 섹션 요청입니다.
+
+{section_prompt}
+
+컨텍스트(모듈 설명): {desc}
+제품/카테고리 범위를 벗어난 내용은 포함하지 마세요."""
+
+INSTRUCTOR_INSTRUCTION_TEMPLATE = (
+    "당신은 {product} 제품의 '{name}' 모듈 강사입니다. "
+    "스토어 메타데이터 product/category에 맞는 문서만 사용하세요. 범위를 벗어나면 에러를 반환하세요."
+)
+
+MENTOR_SYSTEM_PROMPT_TEMPLATE = """당신은 {product_name} {name} 전문 교육 멘토입니다.
+
+현재 학습 제품: {product_name}
+현재 학습 모듈: {name} ({name_en})
+모듈 설명: {desc}
+
+당신의 역할:
+- 신입사원의 {product_name} {name} 관련 질문에 명확하고 실용적인 답변 제공
+- {product_name} 공식 문서와 베스트 프랙티스 기반 설명
+- 실무에서 바로 활용할 수 있는 구체적인 예시 제공
+- 이해를 돕기 위한 단계별 가이드 제공
+
+중요: 반드시 {product_name} 제품에 대해서만 답변하세요. 다른 Freshworks 제품(예: Freshservice, Freshsales 등)의 내용을 혼동하지 마세요.
+
+답변 스타일:
+- 간결하고 본론 중심 (인사말 생략)
+- 한국어로 답변
+- 마크다운 형식 사용"""
+
+QUIZ_GENERATION_PROMPT_TEMPLATE = """Topic: {name}
+Description: {desc}
+
+Reference Content:
+{context}
+
+**IMPORTANT**: You MUST create quiz questions based ONLY on the Reference Content provided above.
+Do NOT use general knowledge or external information.
+If the reference content is insufficient, return an error message instead of generating questions.
+
+Based on the Reference Content above, generate 3 multiple-choice quiz questions to check understanding of this specific module content.
+
+Requirements:
+- Questions must be directly related to the content provided
+- Answers must be found in the reference content
+- Target audience: New employees learning the system
+- Language: Korean
+
+Format: JSON Array of objects.
+Each object must have:
+- question: string (질문)
+- choices: array of objects {{"id": "a", "text": "..."}} (ids should be a, b, c, d)
+- context: string (optional, brief background context from the reference)
+- correct_choice_id: string (id of the correct choice, e.g., "a")
+- explanation: string (explanation of why the answer is correct, referencing the content)
+- learning_point: string (key takeaway from this question)
 
+Output ONLY the JSON array."""
 
-def _build_product_filters(product_id: str, category_slug: Optional[str] = None) -> List[MetadataFilter]:
-    """공용 스토어에서 제품별 문서만 검색하도록 메타데이터 필터를 생성."""
+QUIZ_RAG_QUERY_TEMPLATE = (
+    "[{product}] {name}\n"
+    "설명: {desc}\n"
+    "위 모듈의 '자가 점검(퀴즈) 문항'을 만들기 위해 필요한 핵심 개념/절차를 문서 근거로 요약해 주세요. "
+    "제품 범위를 벗어난 일반 온보딩/회사 정책/업무 규칙 내용은 제외하세요."
+)
+
+QUIZ_RAG_INSTRUCTION_TEMPLATE = (
+    "당신은 {product} 제품의 '{name}' 모듈 퀴즈를 만드는 조교입니다. "
+    "반드시 fileSearch로 찾은 문서의 사실만 요약하세요. "
+    "회사 온보딩/정책/업무 규칙 등 제품 범위를 벗어나면 요약하지 말고 근거 부족으로 답할 수 없다고 말하세요."
+)
+
+# 제품명 매핑 (targetProductId -> 표시명), 요청 간 공유하는 읽기 전용 매핑
+PRODUCT_DISPLAY_NAMES: Mapping[str, str] = MappingProxyType({
+    "freshdesk": "Freshdesk",
+    "freshdesk-omni": "Freshdesk Omni",
+    "freshchat": "Freshchat",
+    "freshsales": "Freshsales",
+    "freshservice": "Freshservice",
+})
+
+
+# get_settings는 이미 @lru_cache 싱글턴이므로 래퍼 함수 없이 그대로 바인딩
+# (테스트에서 monkeypatch할 수 있도록 모듈 속성으로 유지)
+_get_settings = get_settings
+
+
+@lru_cache(maxsize=1024)
+def _build_mentor_system_prompt(product_id: str, name_ko: str, name_en: str, description: str) -> str:
+    """모듈별 AI 멘토 시스템 프롬프트 (모듈 속성이 같으면 캐시된 문자열 재사용)."""
+    return MENTOR_SYSTEM_PROMPT_TEMPLATE.format_map({
+        "product_name": PRODUCT_DISPLAY_NAMES.get(product_id, "Freshworks"),
+        "name": name_ko,
+        "name_en": name_en,
+        "desc": description,
+    })
+
+
+@lru_cache(maxsize=1024)
+def _build_instructor_instruction(product_id: str, name_ko: str) -> str:
+    """학습/섹션 스트림용 강사 시스템 지시문 (모듈 속성이 같으면 캐시된 문자열 재사용)."""
+    return INSTRUCTOR_INSTRUCTION_TEMPLATE.format_map({
+        "product": product_id,
+        "name": name_ko,
+    })
+
+
+@lru_cache(maxsize=256)
+def _build_product_filters(product_id: str, category_slug: Optional[str] = None) -> Tuple[MetadataFilter, ...]:
+    """공용 스토어에서 제품별 문서만 검색하도록 메타데이터 필터를 생성.
+
+    (제품, 카테고리) 조합은 몇 개 되지 않으므로 불변 tuple로 캐시해 요청 간 공유한다.
+    """
     filters: List[MetadataFilter] = []
     if product_id:
         filters.append(MetadataFilter(key="product", value=product_id))
     if category_slug:
         filters.append(MetadataFilter(key="category", value=category_slug))
-    return filters
+    return tuple(filters)
 
 
+def _rag_stores() -> Tuple[str, ...]:
+    """커리큘럼 RAG 검색 대상 스토어 (미설정 시 빈 튜플)."""
+    store = _get_settings().gemini_store_common
+    return (store,) if store else ()
+
+
+@lru_cache(maxsize=1)
 def _get_file_search_client() -> GeminiFileSearchClient:
-    """GeminiFileSearchClient 인스턴스 생성."""
+    """GeminiFileSearchClient 싱글턴 (요청 간 커넥션 풀 공유)."""
     settings = _get_settings()
     return GeminiFileSearchClient(
         api_key=settings.gemini_api_key,
@@ -58,15 +197,6 @@ def _get_file_search_client() -> GeminiFileSearchClient:
     )
 
 
-# ============================================
-# SSE 헬퍼
-# ============================================
-
-def format_sse(event: str, data: dict) -> str:
-    """SSE 포맷으로 변환."""
-    return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n"
-
-
 # ============================================
 # 모듈 조회
 # ============================================
@@ -110,10 +240,100 @@ async def get_module(
 # 학습 콘텐츠 스트리밍 (RAG 기반)
 # ============================================
 
+# 학습/섹션 스트림의 RAG 응답 캐시 (동일 모듈·쿼리 재요청 시 Gemini 호출 생략)
+RAG_RESPONSE_CACHE_MAXSIZE = 1024
+RAG_RESPONSE_CACHE_TTL_SECONDS = 3600
+
+_rag_response_cache: TTLCache[bytes, str] = TTLCache(
+    maxsize=RAG_RESPONSE_CACHE_MAXSIZE,
+    ttl_seconds=RAG_RESPONSE_CACHE_TTL_SECONDS,
+)
+
+
+def _rag_response_cache_key(
+    rag_stores: Tuple[str, ...],
+    metadata_filters: Tuple[MetadataFilter, ...],
+    system_instruction: str,
+    query: str,
+) -> bytes:
+    """검색 입력 전체(스토어·필터·지시문·정규화된 쿼리)의 해시를 캐시 키로 사용."""
+    normalized_query = " ".join(query.lower().split())
+    digest = hashlib.blake2b(digest_size=16)
+    for part in (*rag_stores, repr(metadata_filters), system_instruction, normalized_query):
+        digest.update(part.encode())
+        digest.update(b"\x00")
+    return digest.digest()
+
+
+async def _stream_module_rag_content(
+    module: CurriculumModule,
+    query: str,
+    *,
+    empty_message: str,
+    log_label: str,
+    use_cache: bool = True,
+) -> AsyncIterator[bytes]:
+    """모듈 범위 RAG 검색 결과를 SSE 프레임으로 스트리밍 (학습/섹션 스트림 공용).
+
+    - status 이벤트는 그대로 전달, result는 텍스트가 있을 때 한 번만 전송
+    - result 없이 끝나면 empty_message로 error 이벤트 전송
+    - 같은 입력의 결과가 캐시에 있으면 업스트림 호출 없이 result만 전송 (use_cache=False면 우회)
+    """
+    try:
+        rag_stores = _rag_stores()
+        if not rag_stores:
+            yield format_sse("error", {"message": "RAG store not configured"})
+            return
+
+        metadata_filters = _build_product_filters(module.target_product_id, module.kb_category_slug)
+        system_instruction = _build_instructor_instruction(module.target_product_id, module.name_ko)
+        cache_key = _rag_response_cache_key(rag_stores, metadata_filters, system_instruction, query)
+        if use_cache:
+            cached_text = _rag_response_cache.get(cache_key)
+            if cached_text:
+                yield format_sse("result", {"text": cached_text})
+                return
+
+        client = _get_file_search_client()
+        full_text = ""
+
+        async for chunk in client.stream_search(
+            query=query,
+            store_names=rag_stores,
+            metadata_filters=metadata_filters,
+            system_instruction=system_instruction,
+        ):
+            # stream_search는 항상 event/data 키를 가진 dict를 yield
+            event_type, data = chunk["event"], chunk["data"]
+
+            if event_type == "status":
+                yield format_sse("status", data)
+            elif event_type == "result":
+                text = data.get("text")
+                if text:
+                    full_text = text
+                    # 업스트림이 전체 텍스트를 한 번에 주므로 result 한 번만 전송
+                    yield format_sse("result", {"text": text})
+            elif event_type == "error":
+                yield format_sse("error", data)
+                return
+
+        if not full_text:
+            yield format_sse("error", {"message": empty_message})
+            return
+
+        _rag_response_cache.set(cache_key, full_text)
+
+    except Exception as e:
+        logger.error(f"{log_label} stream error: {e}")
+        yield format_sse("error", {"message": str(e)})
+
+
 @router.get("/modules/{module_id}/learn/stream")
 async def stream_learning_content(
     module_id: UUID = Path(..., description="모듈 ID"),
     session_id: str = Query(..., alias="sessionId", description="세션 ID"),
+    nocache: bool = Query(False, description="캐시된 응답을 무시하고 새로 생성"),
 ):
     """
     모듈 학습 콘텐츠 스트리밍 (RAG 기반).
@@ -132,83 +352,44 @@ async def stream_learning_content(
     # 학습 시작 기록
     await repo.start_learning(session_id, module_id)
     
-    async def event_generator():
-        try:
-            settings = _get_settings()
-            store_product = settings.gemini_store_common
-            
-            # RAG 검색 쿼리 구성 (제품/카테고리 범위 명시)
-            query = f"""{module.target_product_id} {module.name_ko} 모듈 전용 학습 콘텐츠를 생성하세요.
-
-다음 섹션을 모두 포함하세요:
-1) 개요 및 핵심 개념
-2) 주요 기능과 사용법
-3) 실무 활용 팁
-4) 자주 묻는 질문
+    # RAG 검색 쿼리 구성 (제품/카테고리 범위 명시)
+    query = LEARN_QUERY_TEMPLATE.format_map({
+        "product": module.target_product_id,
+        "name": module.name_ko,
+        "desc": module.description or "설명 없음",
+    })
+
+    return EventSourceResponse(_stream_module_rag_content(
+        module,
+        query,
+        empty_message="학습 콘텐츠를 생성하지 못했습니다. 관리자에게 콘텐츠를 추가해 달라고 요청하세요.",
+        log_label="Learning content",
+        use_cache=not nocache,
+    ))
 
-모듈 설명: {module.description or '설명 없음'}
-제품/카테고리 외의 내용은 포함하지 마세요."""
 
-            # RAG 스토어 검색
-            rag_stores = []
-            if store_product:
-                rag_stores.append(store_product)
-            
-            if not rag_stores:
-                yield format_sse("error", {"message": "RAG store not configured"})
-                return
-            
-            # 스트리밍 생성
-            client = _get_file_search_client()
-            
-            full_response = ""
-            product_filters = _build_product_filters(module.target_product_id, module.kb_category_slug)
+# ============================================
+# 모듈 콘텐츠 조회 (정적 콘텐츠 - DB에서 로드)
+# ============================================
 
-            async for chunk in client.stream_search(
-                query=query,
-                store_names=rag_stores,
-                metadata_filters=product_filters,
-                system_instruction=(
-                    f"당신은 {module.target_product_id} 제품의 '{module.name_ko}' 모듈 강사입니다. "
-                    "스토어 메타데이터 product/category에 맞는 문서만 사용하세요. 범위를 벗어나면 에러를 반환하세요."
-                ),
-            ):
-                event_type = chunk.get("event")
-                data = chunk.get("data", {})
-                
-                if event_type == "status":
-                    yield format_sse("status", data)
-                elif event_type == "result":
-                    text = data.get("text", "")
-                    if text:
-                        full_response = text
-                        yield format_sse("chunk", {"text": text})
-                        yield format_sse("result", {"text": text})
-                elif event_type == "error":
-                    yield format_sse("error", data)
-                    return
+# 정적 콘텐츠 응답의 브라우저/CDN 캐시 정책 (ETag로 재검증)
+# - max-age는 리포지토리 콘텐츠 캐시 TTL과 맞춰, 서버 캐시보다 오래된 응답을 신선하다고 보지 않게 함
+# - stale-while-revalidate 구간에는 이전 응답을 먼저 보여주고 백그라운드에서 재검증
+#   (관리자 수정이 클라이언트에 반영되기까지 최대 TTL + 이 구간만큼 늦어질 수 있음)
+CONTENT_CACHE_CONTROL = f"public, max-age={CONTENT_CACHE_TTL_SECONDS}, stale-while-revalidate=300"
 
-            if not full_response:
-                yield format_sse("error", {"message": "학습 콘텐츠를 생성하지 못했습니다. 관리자에게 콘텐츠를 추가해 달라고 요청하세요."})
-            
-        except Exception as e:
-            logger.error(f"Learning content stream error: {e}")
-            yield format_sse("error", {"message": str(e)})
-    
-    return StreamingResponse(
-        event_generator(),
-        media_type="text/event-stream"
-    )
 
+def _cacheable_json_response(request: Request, model: BaseModel) -> Response:
+    """모델을 직렬화해 ETag 조건부 JSON 응답으로 반환."""
+    body = model.model_dump_json(by_alias=True).encode()
+    return conditional_json_response(request, body, cache_control=CONTENT_CACHE_CONTROL)
 
-# ============================================
-# 모듈 콘텐츠 조회 (정적 콘텐츠 - DB에서 로드)
-# ============================================
 
 @router.get("/modules/{module_id}/contents", response_model=ModuleContentResponse)
 async def get_module_contents(
+    request: Request,
     module_id: UUID = Path(..., description="모듈 ID"),
-    level: Optional[str] = Query(None, description="난이도 필터 (basic, intermediate, advanced)"),
+    level: Optional[ContentLevel] = Query(None, description="난이도 필터 (basic, intermediate, advanced)"),
 ):
     """
     모듈의 정적 학습 콘텐츠 조회.
@@ -220,7 +401,7 @@ async def get_module_contents(
     try:
         repo = get_curriculum_repository()
         contents = await repo.get_module_contents(module_id, level)
-        return contents
+        return _cacheable_json_response(request, contents)
     except CurriculumRepositoryError as e:
         logger.error(f"Failed to get module contents: {e}")
         raise HTTPException(status_code=404, detail=str(e))
@@ -228,9 +409,10 @@ async def get_module_contents(
 
 @router.get("/modules/{module_id}/contents/{section_type}", response_model=ModuleContent)
 async def get_section_content(
+    request: Request,
     module_id: UUID = Path(..., description="모듈 ID"),
-    section_type: str = Path(..., description="섹션 타입 (overview, core_concepts, features, practice, faq)"),
-    level: str = Query("basic", description="난이도 (basic, intermediate, advanced)"),
+    section_type: SectionType = Path(..., description="섹션 타입 (overview, concept, core_concepts, features, practice, faq)"),
+    level: ContentLevel = Query("basic", description="난이도 (basic, intermediate, advanced)"),
 ):
     """
     특정 섹션의 콘텐츠 조회.
@@ -246,7 +428,7 @@ async def get_section_content(
                 status_code=404, 
                 detail=f"Content not found for section '{section_type}' at level '{level}'"
             )
-        return content
+        return _cacheable_json_response(request, content)
     except CurriculumRepositoryError as e:
         logger.error(f"Failed to get section content: {e}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -262,6 +444,7 @@ async def stream_section_content(
     session_id: str = Query(..., alias="sessionId", description="세션 ID"),
     section_id: str = Query(..., alias="sectionId", description="섹션 ID"),
     section_prompt: str = Query(..., alias="sectionPrompt", description="섹션 프롬프트"),
+    nocache: bool = Query(False, description="캐시된 응답을 무시하고 새로 생성"),
 ):
     """
     모듈 섹션별 학습 콘텐츠 스트리밍 (RAG 기반).
@@ -277,77 +460,27 @@ async def stream_section_content(
     if not module:
         raise HTTPException(status_code=404, detail="Module not found")
     
-    async def event_generator():
-        try:
-            settings = _get_settings()
-            store_product = settings.gemini_store_common
-            
-            # RAG 검색 쿼리 구성
-            query = f"""{module.target_product_id} 제품의 '{module.name_ko}' 모듈 섹션 요청입니다.
-
-{section_prompt}
-
-컨텍스트(모듈 설명): {module.description or '설명 없음'}
-제품/카테고리 범위를 벗어난 내용은 포함하지 마세요."""
-
-            # RAG 스토어 검색
-            rag_stores = []
-            if store_product:
-                rag_stores.append(store_product)
-            
-            if not rag_stores:
-                yield format_sse("error", {"message": "RAG store not configured"})
-                return
-            
-            # 스트리밍 생성
-            client = _get_file_search_client()
-            
-            product_filters = _build_product_filters(module.target_product_id, module.kb_category_slug)
-
-            async for chunk in client.stream_search(
-                query=query,
-                store_names=rag_stores,
-                metadata_filters=product_filters,
-                system_instruction=(
-                    f"당신은 {module.target_product_id} 제품의 '{module.name_ko}' 모듈 강사입니다. "
-                    "스토어 메타데이터 product/category에 맞는 문서만 사용하세요. 범위를 벗어나면 에러를 반환하세요."
-                ),
-            ):
-                event_type = chunk.get("event")
-                data = chunk.get("data", {})
-                
-                if event_type == "status":
-                    yield format_sse("status", data)
-                elif event_type == "result":
-                    text = data.get("text", "")
-                    if text:
-                        yield format_sse("chunk", {"text": text})
-                        yield format_sse("result", {"text": text})
-                elif event_type == "error":
-                    yield format_sse("error", data)
-                    return
-
-            if not text:
-                yield format_sse("error", {"message": "해당 섹션 콘텐츠를 생성하지 못했습니다. 관리자에게 콘텐츠를 추가해 달라고 요청하세요."})
-            
-        except Exception as e:
-            logger.error(f"Section content stream error: {e}")
-            yield format_sse("error", {"message": str(e)})
-    
-    return StreamingResponse(
-        event_generator(),
-        media_type="text/event-stream"
-    )
+    # RAG 검색 쿼리 구성
+    query = SECTION_QUERY_TEMPLATE.format_map({
+        "product": module.target_product_id,
+        "name": module.name_ko,
+        "section_prompt": section_prompt,
+        "desc": module.description or "설명 없음",
+    })
+
+    return EventSourceResponse(_stream_module_rag_content(
+        module,
+        query,
+        empty_message="해당 섹션 콘텐츠를 생성하지 못했습니다. 관리자에게 콘텐츠를 추가해 달라고 요청하세요.",
+        log_label="Section content",
+        use_cache=not nocache,
+    ))
 
 
 # ============================================
 # AI 멘토 채팅 (모듈 컨텍스트 인식)
 # ============================================
 
-# 모듈별 대화 히스토리 캐시
-_module_chat_cache: dict = {}
-
-
 @router.get("/modules/{module_id}/chat/stream")
 async def stream_module_chat(
     module_id: UUID = Path(..., description="모듈 ID"),
@@ -368,55 +501,27 @@ async def stream_module_chat(
     if not module:
         raise HTTPException(status_code=404, detail="Module not found")
     
-    # 대화 히스토리 조회
-    cache_key = f"{session_id}:{module_id}"
-    history = _module_chat_cache.get(cache_key, [])
+    # 대화 히스토리 조회 (최근 4턴)
+    history_store = await get_module_chat_history_store()
+    history = await history_store.get_recent(session_id, str(module_id), 4)
     
     async def event_generator():
         try:
-            settings = _get_settings()
-            store_product = settings.gemini_store_common
-            
-            # 제품명 매핑 (targetProductId -> 표시명, RAG 필터값)
+            # 제품 ID (RAG 필터값, 표시명 조회 키)
             product_id = module.target_product_id or "freshworks"
-            product_display_names = {
-                "freshdesk": "Freshdesk",
-                "freshdesk-omni": "Freshdesk Omni",
-                "freshchat": "Freshchat",
-                "freshsales": "Freshsales",
-                "freshservice": "Freshservice",
-            }
-            product_name = product_display_names.get(product_id, "Freshworks")
 
             # 시스템 프롬프트 (모듈 컨텍스트 포함)
-            system_prompt = f"""당신은 {product_name} {module.name_ko} 전문 교육 멘토입니다.
-
-현재 학습 제품: {product_name}
-현재 학습 모듈: {module.name_ko} ({module.name_en or ''})
-모듈 설명: {module.description or ''}
-
-당신의 역할:
-- 신입사원의 {product_name} {module.name_ko} 관련 질문에 명확하고 실용적인 답변 제공
-- {product_name} 공식 문서와 베스트 프랙티스 기반 설명
-- 실무에서 바로 활용할 수 있는 구체적인 예시 제공
-- 이해를 돕기 위한 단계별 가이드 제공
-
-중요: 반드시 {product_name} 제품에 대해서만 답변하세요. 다른 Freshworks 제품(예: Freshservice, Freshsales 등)의 내용을 혼동하지 마세요.
-
-답변 스타일:
-- 간결하고 본론 중심 (인사말 생략)
-- 한국어로 답변
-- 마크다운 형식 사용"""
+            system_prompt = _build_mentor_system_prompt(
+                product_id,
+                module.name_ko,
+                module.name_en or "",
+                module.description or "",
+            )
 
             # RAG 스토어 및 메타데이터 필터
-            rag_stores = []
-            if store_product:
-                rag_stores.append(store_product)
+            rag_stores = _rag_stores()
 
-            metadata_filters = _build_product_filters(
-                product_id=product_id,
-                category_slug=module.kb_category_slug,
-            )
+            metadata_filters = _build_product_filters(product_id, module.kb_category_slug)
             
             # 스트리밍 생성
             client = _get_file_search_client()
@@ -426,29 +531,28 @@ async def stream_module_chat(
                 query=query,
                 store_names=rag_stores,
                 metadata_filters=metadata_filters if metadata_filters else None,
-                conversation_history=history[-4:],  # 최근 4턴
+                conversation_history=history,
                 system_instruction=system_prompt,
             ):
-                event_type = chunk.get("event")
-                data = chunk.get("data", {})
+                event_type, data = chunk["event"], chunk["data"]
 
                 if event_type == "status":
                     continue
                 if event_type == "error":
                     yield format_sse("error", data or {"message": "문서를 불러오지 못했습니다."})
                     return
-                if event_type == "result" and data.get("text"):
-                    text = data["text"]
-                    full_response = text
-                    yield format_sse("chunk", {"text": text})
+                if event_type == "result":
+                    text = data.get("text")
+                    if text:
+                        full_response = text
+                        yield format_sse("chunk", {"text": text})
             
             if not full_response:
                 yield format_sse("error", {"message": "모듈 컨텍스트에 맞는 답변을 생성하지 못했습니다. 관리자에게 콘텐츠 보강을 요청하세요."})
                 return
 
-            # 히스토리 업데이트
-            history.append({"user": query, "model": full_response})
-            _module_chat_cache[cache_key] = history[-10:]  # 최근 10턴만 유지
+            # 히스토리 업데이트 (저장소에서 최근 턴만 유지)
+            await history_store.append(session_id, str(module_id), {"user": query, "model": full_response})
 
             yield format_sse("result", {"text": full_response})
             
@@ -456,89 +560,168 @@ async def stream_module_chat(
             logger.error(f"Module chat stream error: {e}")
             yield format_sse("error", {"message": str(e)})
     
-    return StreamingResponse(
-        event_generator(),
-        media_type="text/event-stream"
-    )
+    return EventSourceResponse(event_generator())
 
 
 # ============================================
 # 퀴즈 문제 조회 (자가 점검용)
 # ============================================
 
+# 퀴즈 생성 프롬프트에 넣는 참조 콘텐츠 최대 길이 (토큰 제한 고려)
+QUIZ_CONTEXT_MAX_CHARS = 15000
+
+# 퀴즈 생성에 필요한 최소 참조 콘텐츠 길이 (미만이면 RAG 보완 후에도 부족 시 생성 생략)
+QUIZ_MIN_CONTENT_CHARS = 300
+
+# 퀴즈 생성 프롬프트(QUIZ_GENERATION_PROMPT_TEMPLATE)를 바꾸면 올려서 기존 생성 캐시를 무효화
+QUIZ_PROMPT_VERSION = "v1"
+
+# 유사 콘텐츠 퀴즈 캐시: 임베딩 입력 길이/차원 및 재사용 기준 cosine 유사도
+QUIZ_EMBEDDING_CONTEXT_CHARS = 2000
+QUIZ_EMBEDDING_DIMENSIONS = 768
+QUIZ_SEMANTIC_CACHE_THRESHOLD = 0.95
+
+# 생성 문항 DB 저장 실패 시 재시도 대기 시간(초), 재시도 횟수 = 길이
+QUIZ_PERSIST_RETRY_DELAYS = (0.5, 2.0)
+
+
+def _quiz_content_hash(module_id: UUID, model_name: str, context_text: str) -> str:
+    """퀴즈 생성 캐시 키 (모듈 ID + 프롬프트 버전 + 모델 + 참조 콘텐츠의 sha256)."""
+    key = f"{module_id}:{QUIZ_PROMPT_VERSION}:{model_name}:{context_text}"
+    return hashlib.sha256(key.encode("utf-8")).hexdigest()
+
+
+# 임베딩 입력 텍스트별 결과 캐시 (같은 콘텐츠의 재생성/다른 모듈 복사본에서 임베딩 호출 생략)
+QUIZ_EMBEDDING_CACHE_MAXSIZE = 1024
+QUIZ_EMBEDDING_CACHE_TTL_SECONDS = 3600
+
+_quiz_embedding_cache: TTLCache[bytes, List[float]] = TTLCache(
+    maxsize=QUIZ_EMBEDDING_CACHE_MAXSIZE,
+    ttl_seconds=QUIZ_EMBEDDING_CACHE_TTL_SECONDS,
+)
+
+
+async def _embed_quiz_context(module_name: str, module_desc: str, context_text: str) -> Optional[List[float]]:
+    """유사 콘텐츠 캐시 조회용 임베딩 (실패 시 None)."""
+    text = f"{module_name}\n{module_desc}\n{context_text[:QUIZ_EMBEDDING_CONTEXT_CHARS]}"
+    cache_key = hashlib.sha256(text.encode("utf-8")).digest()
+    cached = _quiz_embedding_cache.get(cache_key)
+    if cached is not None:
+        return cached
+    try:
+        client = get_gemini_client()
+        embedding = await asyncio.to_thread(
+            client.embed_text,
+            text,
+            model=_get_settings().gemini_embedding_model,
+            output_dimensionality=QUIZ_EMBEDDING_DIMENSIONS,
+        )
+    except Exception as e:
+        logger.warning(f"Quiz context embedding failed, skipping semantic cache: {e}")
+        return None
+    if embedding is not None:
+        _quiz_embedding_cache.set(cache_key, embedding)
+    return embedding
+
+
+async def _generate_quiz_items_with_gemini(module_name: str, module_desc: str, context_text: str) -> List[dict]:
+    """Gemini로 퀴즈 문제 JSON 배열 생성 (파싱된 원본 dict 리스트)."""
+    client = get_gemini_client()
+
+    prompt = QUIZ_GENERATION_PROMPT_TEMPLATE.format_map({
+        "name": module_name,
+        "desc": module_desc or module_name,
+        "context": context_text,
+    })
+    
+    response_stream = client.generate_content_stream(contents=prompt)
+    # 전체 응답을 기다렸다 파싱하지 않고 배열 항목이 완성되는 대로 디코딩
+    # (```json 코드 펜스는 무시되며, 스트림이 중간에 끊겨도 완성된 문항은 보존)
+    items = [
+        item
+        async for item in iter_json_array_items(chunk.text async for chunk in response_stream if chunk.text)
+    ]
+    if not items:
+        logger.warning("Gemini quiz response contained no JSON array items.")
+    return items
+
+
+async def _persist_generated_questions(repo: CurriculumRepository, db_questions: List[dict]) -> bool:
+    """AI 생성 문항 DB 저장. 실패하면 QUIZ_PERSIST_RETRY_DELAYS 간격으로 재시도하고 성공 여부 반환."""
+    for attempt, delay in enumerate((0.0, *QUIZ_PERSIST_RETRY_DELAYS), start=1):
+        if delay:
+            await asyncio.sleep(delay)
+        try:
+            await repo.create_questions(db_questions)
+            logger.info(f"Successfully saved {len(db_questions)} generated questions to DB.")
+            return True
+        except Exception as e:
+            logger.warning(f"Failed to save generated questions to DB (attempt {attempt}): {e}")
+    return False
+
+
 async def _generate_quiz_questions(module_id: UUID, module_name: str, module_desc: str = "", module_content: str = "") -> List[QuizQuestion]:
     """Gemini를 사용하여 퀴즈 문제 생성 및 DB 저장."""
     try:
-        # 콘텐츠 검증: 최소 300자 이상 필요
-        MIN_CONTENT_LENGTH = 300
-        if not module_content or len(module_content.strip()) < MIN_CONTENT_LENGTH:
+        # 콘텐츠 검증: Gemini 클라이언트/프롬프트 준비 전에 길이부터 확인
+        if not module_content or len(module_content.strip()) < QUIZ_MIN_CONTENT_CHARS:
             logger.warning(
                 f"Module {module_id} ({module_name}) has insufficient content "
                 f"({len(module_content) if module_content else 0} chars). "
-                f"Minimum {MIN_CONTENT_LENGTH} chars required for quiz generation."
+                f"Minimum {QUIZ_MIN_CONTENT_CHARS} chars required for quiz generation."
             )
             return []
     
-        client = get_gemini_client()
-        
-        # 컨텍스트가 너무 길면 잘라냄 (토큰 제한 고려)
-        context_text = module_content[:15000] if module_content else ""
-        
-        prompt = f"""
-        Topic: {module_name}
-        Description: {module_desc or module_name}
-        
-        Reference Content:
-        {context_text}
-        
-        **IMPORTANT**: You MUST create quiz questions based ONLY on the Reference Content provided above.
-        Do NOT use general knowledge or external information.
-        If the reference content is insufficient, return an error message instead of generating questions.
-        
-        Based on the Reference Content above, generate 3 multiple-choice quiz questions to check understanding of this specific module content.
-        
-        Requirements:
-        - Questions must be directly related to the content provided
-        - Answers must be found in the reference content
-        - Target audience: New employees learning the system
-        - Language: Korean
-        
-        Format: JSON Array of objects.
-        Each object must have:
-        - question: string (질문)
-        - choices: array of objects {{"id": "a", "text": "..."}} (ids should be a, b, c, d)
-        - context: string (optional, brief background context from the reference)
-        - correct_choice_id: string (id of the correct choice, e.g., "a")
-        - explanation: string (explanation of why the answer is correct, referencing the content)
-        - learning_point: string (key takeaway from this question)
-        
-        Output ONLY the JSON array.
-        """
-        
-        response_stream = client.generate_content_stream(contents=prompt)
-        text = ""
-        async for chunk in response_stream:
-            if chunk.text:
-                text += chunk.text
-        
-        # Clean up markdown code blocks if present
-        if text.strip().startswith("```json"):
-            text = text.strip()[7:]
-        if text.strip().endswith("```"):
-            text = text.strip()[:-3]
-            
-        data = json.loads(text)
-        
         repo = get_curriculum_repository()
+
+        # 컨텍스트가 너무 길면 잘라냄 (토큰 제한 고려, RAG 보완분이 앞에 붙은 경우 포함)
+        context_text = module_content[:QUIZ_CONTEXT_MAX_CHARS] if module_content else ""
+
+        # 같은 (모듈, 모델, 참조 콘텐츠)면 이전 생성 결과를 재사용해 LLM 호출 생략
+        model_name = _get_settings().gemini_primary_model
+        content_hash = _quiz_content_hash(module_id, model_name, context_text)
+        # 해시 조회가 빗나갈 때 필요한 임베딩은 조회와 동시에 시작 (적중하면 취소)
+        embedding_task = asyncio.create_task(_embed_quiz_context(module_name, module_desc, context_text))
+        data = None
+        try:
+            data = await repo.get_cached_quiz(content_hash)
+        except CurriculumRepositoryError as e:
+            logger.warning(f"Quiz cache lookup failed, generating with Gemini: {e}")
+        except BaseException:
+            embedding_task.cancel()
+            raise
+        if data is not None:
+            embedding_task.cancel()
+
+        # 해시가 달라도 내용이 거의 같으면(테넌트별 문서 복사본 등) 이전 생성 결과 재사용
+        embedding = None
+        if data is None:
+            embedding = await embedding_task
+            if embedding is not None:
+                try:
+                    data = await repo.match_cached_quiz(embedding, model_name, QUIZ_SEMANTIC_CACHE_THRESHOLD)
+                except CurriculumRepositoryError as e:
+                    logger.warning(f"Quiz semantic cache lookup failed: {e}")
+
+        if data is not None:
+            logger.info(f"Quiz cache hit for module {module_id} ({content_hash[:12]})")
+        else:
+            data = await _generate_quiz_items_with_gemini(module_name, module_desc, context_text)
+            if isinstance(data, list) and data:
+                try:
+                    await repo.save_cached_quiz(content_hash, module_id, model_name, data, embedding)
+                except CurriculumRepositoryError as e:
+                    logger.warning(f"Failed to save quiz cache: {e}")
+
         db_questions = []
         result_questions = []
         
         for i, item in enumerate(data):
-            q_id = str(uuid4())
+            q_id = uuid4()
             
-            # DB 저장용 데이터
+            # DB 저장용 데이터 (Supabase REST는 JSON이므로 여기서만 문자열화)
             db_q = {
-                "id": q_id,
+                "id": str(q_id),
                 "module_id": str(module_id),
                 "question_order": i + 1,
                 "difficulty": "basic",
@@ -552,31 +735,145 @@ async def _generate_quiz_questions(module_id: UUID, module_name: str, module_des
             }
             db_questions.append(db_q)
             
-            # 반환용 데이터 (정답 제외)
-            q = QuizQuestion(
-                id=UUID(q_id),
-                moduleId=module_id,
-                questionOrder=i+1,
-                question=item["question"],
-                context=item.get("context"),
-                choices=[QuizChoice(id=c["id"], text=c["text"]) for c in item["choices"]],
-                relatedDocUrl=None
-            )
-            result_questions.append(q)
-            
-        # DB에 저장 (비동기적으로 처리하거나 기다림)
-        try:
-            await repo.create_questions(db_questions)
-            logger.info(f"Successfully saved {len(db_questions)} generated questions to DB.")
-        except Exception as e:
-            logger.error(f"Failed to save generated questions to DB: {e}")
-            
+            # 반환용 데이터 (정답 제외, 아래에서 일괄 검증)
+            result_questions.append({
+                "id": q_id,
+                "module_id": module_id,
+                "question_order": i + 1,
+                "question": item["question"],
+                "context": item.get("context"),
+                "choices": item["choices"],
+            })
+
+        # LLM 출력이므로 검증은 유지하되 문제 목록 전체를 pydantic-core에서 한 번에 처리
+        result_questions = QuizQuestionListAdapter.validate_python(result_questions)
+
+        # 채점(submit)은 DB 문항으로 하므로 저장이 끝난 문항만 반환
+        if not await _persist_generated_questions(repo, db_questions):
+            logger.error(f"Discarding {len(db_questions)} generated questions for module {module_id}: DB save failed.")
+            return []
+
         return result_questions
     except Exception as e:
         logger.error(f"Failed to generate quiz questions: {e}")
         return []
 
 
+async def _generate_module_quiz(repo: CurriculumRepository, module_id: UUID) -> List[QuizQuestion]:
+    """모듈 정보/콘텐츠(부족 시 RAG 보완)로 컨텍스트를 구성해 퀴즈 생성 및 저장."""
+    logger.info(f"No questions found for module {module_id}. Attempting to generate with AI...")
+    
+    module_name = "Onboarding Knowledge"
+    module_desc = ""
+    module_content = ""
+    
+    # 모듈 정보와 모듈 콘텐츠(섹션)는 서로 독립적이므로 동시에 조회
+    module, contents_resp = await asyncio.gather(
+        repo.get_module_by_id(module_id),
+        repo.get_module_contents(module_id),
+        return_exceptions=True,
+    )
+    if isinstance(module, Exception):
+        logger.warning(f"Failed to get module info for {module_id}: {module}, using default topic.")
+        module = None
+    elif module:
+        module_name = module.name_ko
+        module_desc = module.description
+
+    # 모듈 콘텐츠(섹션)로 컨텍스트 구성
+    if isinstance(contents_resp, Exception):
+        logger.warning(f"Failed to get module contents for context: {contents_resp}")
+    else:
+        # 생성에는 앞 QUIZ_CONTEXT_MAX_CHARS자만 쓰이므로 예산을 채우면 나머지 섹션은 복사하지 않음
+        content_parts = []
+        size = 0
+        for sections in contents_resp.sections.values():
+            for section in sections:
+                if not section.content_md:
+                    continue
+                separator = "\n\n" if content_parts else ""
+                piece = f"{separator}--- Section: {section.title_ko} ---\n{section.content_md}"
+                if size + len(piece) >= QUIZ_CONTEXT_MAX_CHARS:
+                    content_parts.append(piece[:QUIZ_CONTEXT_MAX_CHARS - size])
+                    size = QUIZ_CONTEXT_MAX_CHARS
+                    break
+                content_parts.append(piece)
+                size += len(piece)
+            if size >= QUIZ_CONTEXT_MAX_CHARS:
+                break
+        module_content = "".join(content_parts)
+
+        logger.info(f"Retrieved {len(content_parts)} content sections, context length: {len(module_content)} chars")
+
+    # [Fallback] 콘텐츠가 부족한 경우 RAG 검색으로 보완
+    content_len = len(module_content.strip())
+    if content_len < QUIZ_MIN_CONTENT_CHARS:
+        logger.info(f"Content insufficient for module {module_id}. Attempting RAG search to supplement content...")
+        try:
+            # 제품 지식(Common)만 사용하여 RAG 검색
+            rag_stores = _rag_stores()
+
+            if rag_stores:
+                search_client = _get_file_search_client()
+                product_id = module.target_product_id if module else ""
+                category_slug = module.kb_category_slug if module else None
+                product_filters = _build_product_filters(product_id, category_slug) if product_id else None
+                logger.info(
+                    "RAG quiz supplement: module=%s product=%s category=%s stores=%s filters_applied=%s",
+                    str(module_id),
+                    product_id,
+                    category_slug,
+                    rag_stores,
+                    bool(product_filters),
+                )
+
+                search_query = QUIZ_RAG_QUERY_TEMPLATE.format_map({
+                    "product": product_id,
+                    "name": module_name,
+                    "desc": module_desc,
+                })
+                
+                # 검색 수행 (요약 요청)
+                search_result = await search_client.search(
+                    query=search_query,
+                    store_names=rag_stores,
+                    metadata_filters=product_filters,
+                    system_instruction=QUIZ_RAG_INSTRUCTION_TEMPLATE.format_map({
+                        "product": product_id,
+                        "name": module_name,
+                    }),
+                )
+                
+                if search_result and search_result.get("text"):
+                    rag_content = search_result["text"]
+                    module_content = f"--- RAG Retrieved Content (Supplemented from {', '.join(rag_stores)}) ---\n{rag_content}\n\n" + module_content
+                    content_len = len(module_content.strip())
+                    logger.info(f"Supplemented content with RAG search result ({len(rag_content)} chars).")
+                else:
+                    logger.warning("RAG search returned no text.")
+            else:
+                logger.warning("No Gemini store configured for RAG fallback.")
+        except Exception as e:
+            logger.warning(f"Failed to supplement content with RAG: {e}")
+
+    # RAG 보완 후에도 부족하면 Gemini 캐시/생성 단계에 들어가지 않음
+    if content_len < QUIZ_MIN_CONTENT_CHARS:
+        logger.info(
+            f"Quiz generation skipped for module {module_id} ({module_name}) "
+            f"due to insufficient content ({content_len} chars). Please add curriculum content first."
+        )
+        return []
+
+    # AI로 퀴즈 생성 시도
+    questions = await _generate_quiz_questions(module_id, module_name, module_desc, module_content)
+    
+    # 생성 결과가 비어 있으면 로그 남김
+    if not questions:
+        logger.info(f"Quiz generation returned no questions for module {module_id} ({module_name})")
+
+    return questions
+
+
 @router.get("/modules/{module_id}/questions", response_model=List[QuizQuestion])
 async def get_questions(
     module_id: UUID = Path(..., description="모듈 ID"),
@@ -598,101 +895,44 @@ async def get_questions(
     
     if not questions:
         # 퀴즈가 없으면 AI로 생성 및 저장
-        logger.info(f"No questions found for module {module_id}. Attempting to generate with AI...")
-        
-        module_name = "Onboarding Knowledge"
-        module_desc = ""
-        module_content = ""
-        
+        questions = await _generate_module_quiz(repo, module_id)
+
+    return questions
+
+
+@router.get("/modules/{module_id}/questions/stream")
+async def stream_questions(
+    module_id: UUID = Path(..., description="모듈 ID"),
+):
+    """
+    모듈별 자가 점검 퀴즈 문제 조회 (SSE).
+
+    - 문제가 없어 AI 생성이 필요하면 status 이벤트를 먼저 보내 UI가 즉시 진행 상태를 표시
+    - 생성이 끝나면 result 이벤트로 문제 목록 전송 (/questions와 같은 형태)
+    - 진행 중인 생성 작업은 /questions 요청과 공유
+    """
+    repo = get_curriculum_repository()
+
+    async def event_generator():
         try:
-            # 모듈 정보 조회
-            module = await repo.get_module_by_id(module_id)
-            if module:
-                module_name = module.name_ko
-                module_desc = module.description
-            
-            # 모듈 콘텐츠(섹션) 조회하여 컨텍스트 구성
+            questions: List[QuizQuestion] = []
             try:
-                contents_resp = await repo.get_module_contents(module_id)
-                content_parts = []
-                for level, sections in contents_resp.sections.items():
-                    for section in sections:
-                        if section.content_md:
-                            content_parts.append(f"--- Section: {section.title_ko} ---\n{section.content_md}")
-                module_content = "\n\n".join(content_parts)
-                
-                logger.info(f"Retrieved {len(content_parts)} content sections, total length: {len(module_content)} chars")
+                questions = await repo.get_questions(module_id=module_id)
             except Exception as e:
-                logger.warning(f"Failed to get module contents for context: {e}")
+                logger.warning(f"Failed to get questions from DB (might be missing tables): {e}")
 
-            # [Fallback] 콘텐츠가 부족한 경우 RAG 검색으로 보완
-            if not module_content or len(module_content.strip()) < 300:
-                logger.info(f"Content insufficient for module {module_id}. Attempting RAG search to supplement content...")
-                try:
-                    settings = _get_settings()
-                    # 제품 지식(Common)만 사용하여 RAG 검색
-                    rag_stores = []
-                    if settings.gemini_store_common:
-                        rag_stores.append(settings.gemini_store_common)
-                    
-                    if rag_stores:
-                        search_client = _get_file_search_client()
-                        product_id = module.target_product_id if module else ""
-                        category_slug = module.kb_category_slug if module else None
-                        product_filters = _build_product_filters(product_id, category_slug) if product_id else None
-                        logger.info(
-                            "RAG quiz supplement: module=%s product=%s category=%s stores=%s filters_applied=%s",
-                            str(module_id),
-                            product_id,
-                            category_slug,
-                            rag_stores,
-                            bool(product_filters),
-                        )
-
-                        search_query = (
-                            f"[{product_id}] {module_name}\n"
-                            f"설명: {module_desc}\n"
-                            "위 모듈의 '자가 점검(퀴즈) 문항'을 만들기 위해 필요한 핵심 개념/절차를 문서 근거로 요약해 주세요. "
-                            "제품 범위를 벗어난 일반 온보딩/회사 정책/업무 규칙 내용은 제외하세요."
-                        )
-                        
-                        # 검색 수행 (요약 요청)
-                        search_result = await search_client.search(
-                            query=search_query,
-                            store_names=rag_stores,
-                            metadata_filters=product_filters,
-                            system_instruction=(
-                                f"당신은 {product_id} 제품의 '{module_name}' 모듈 퀴즈를 만드는 조교입니다. "
-                                "반드시 fileSearch로 찾은 문서의 사실만 요약하세요. "
-                                "회사 온보딩/정책/업무 규칙 등 제품 범위를 벗어나면 요약하지 말고 근거 부족으로 답할 수 없다고 말하세요."
-                            ),
-                        )
-                        
-                        if search_result and search_result.get("text"):
-                            rag_content = search_result["text"]
-                            module_content = f"--- RAG Retrieved Content (Supplemented from {', '.join(rag_stores)}) ---\n{rag_content}\n\n" + module_content
-                            logger.info(f"Supplemented content with RAG search result ({len(rag_content)} chars).")
-                        else:
-                            logger.warning("RAG search returned no text.")
-                    else:
-                        logger.warning("No Gemini store configured for RAG fallback.")
-                except Exception as e:
-                    logger.warning(f"Failed to supplement content with RAG: {e}")
-        
+            if not questions:
+                yield format_sse("status", {"message": "퀴즈를 생성하고 있습니다..."})
+                questions = await _generate_module_quiz(repo, module_id)
+
+            yield format_sse("result", {
+                "questions": QuizQuestionListAdapter.dump_python(questions, mode="json", by_alias=True),
+            })
         except Exception as e:
-            logger.warning(f"Failed to get module info for {module_id}: {e}, using default topic.")
-        
-        # AI로 퀴즈 생성 시도
-        questions = await _generate_quiz_questions(module_id, module_name, module_desc, module_content)
-        
-        # 콘텐츠 부족으로 퀴즈를 생성하지 못한 경우 로그 남김
-        if not questions:
-            logger.info(
-                f"Quiz generation skipped for module {module_id} ({module_name}) "
-                f"due to insufficient content. Please add curriculum content first."
-            )
-            
-    return questions
+            logger.error(f"Quiz question stream error: {e}")
+            yield format_sse("error", {"message": str(e)})
+
+    return EventSourceResponse(event_generator())
 
 
 # ============================================
@@ -741,23 +981,34 @@ async def submit_quiz(
 async def get_progress_summary(
     session_id: str = Query(..., alias="sessionId", description="세션 ID"),
     product: str = Query("freshservice", description="제품 ID"),
+    include_modules: bool = Query(True, alias="includeModules", description="모듈별 진도 목록 포함 여부"),
 ):
     """
     전체 학습 진도 요약.
     
-    - 모듈별 진도 상태
+    - 모듈별 진도 상태 (includeModules=false면 생략하고 집계만 조회)
     - 전체 완료율
     """
     try:
         repo = get_curriculum_repository()
-        modules = await repo.get_modules_with_progress(
-            session_id=session_id,
-            product=product,
-        )
-        
-        total = len(modules)
-        completed = sum(1 for m in modules if m.status == "completed")
-        in_progress = sum(1 for m in modules if m.status == "learning")
+        modules = None
+        if include_modules:
+            modules = await repo.get_modules_with_progress(
+                session_id=session_id,
+                product=product,
+            )
+            total = len(modules)
+            completed = in_progress = 0
+            for m in modules:
+                status = m.status
+                if status == "completed":
+                    completed += 1
+                elif status == "learning":
+                    in_progress += 1
+        else:
+            total, status_counts = await repo.get_progress_counts(session_id, product)
+            completed = status_counts.get("completed", 0)
+            in_progress = status_counts.get("learning", 0)
         
         # 진행률 계산: 완료된 모듈은 100%, 진행 중인 모듈은 50%로 반영
         # 예: 완료 2개, 진행 중 1개, 전체 10개 = (2*100% + 1*50%) / 10 = 25%
@@ -777,6 +1028,17 @@ async def get_progress_summary(
         raise HTTPException(status_code=500, detail=str(e))
 
 
+# 진도가 없는 모듈의 기본 응답 (sessionId/moduleId 제외, 직렬화된 alias 형태)
+# 신규 학습자에게 흔한 경로라 요청마다 ModuleProgress 검증/직렬화를 하지 않도록 미리 만들어 둔다.
+_EMPTY_PROGRESS_TEMPLATE: Mapping[str, object] = MappingProxyType(
+    ModuleProgress.model_construct(status="not_started").model_dump(
+        mode="json",
+        by_alias=True,
+        exclude={"session_id", "module_id"},
+    )
+)
+
+
 @router.get("/modules/{module_id}/progress", response_model=ModuleProgress)
 async def get_module_progress(
     module_id: UUID = Path(..., description="모듈 ID"),
@@ -788,17 +1050,10 @@ async def get_module_progress(
         progress = await repo.get_progress(session_id, module_id)
         
         if not progress:
-            # 진도 없으면 기본값 반환
-            return ModuleProgress(
-                sessionId=session_id,
-                moduleId=module_id,
-                status="not_started",
-                learningStartedAt=None,
-                learningCompletedAt=None,
-                quizScore=None,
-                quizAttempts=0,
-                learningTimeMinutes=0,
-                completedAt=None,
+            # 진도 없으면 기본값 반환 (response_model 검증 생략, orjson으로 직접 직렬화)
+            return Response(
+                orjson.dumps({**_EMPTY_PROGRESS_TEMPLATE, "sessionId": session_id, "moduleId": str(module_id)}),
+                media_type="application/json",
             )
         return progress
     except CurriculumRepositoryError as e:
@@ -842,6 +1097,12 @@ async def update_module_progress(
 # 디버그: 퀴즈 시도 조회
 # ============================================
 
+DEBUG_QUIZ_ATTEMPT_COLUMNS = (
+    "session_id, module_id, difficulty, score, total_questions, correct_count, "
+    "started_at, completed_at, duration_seconds, created_at"
+)
+
+
 @router.get("/debug/quiz-attempts")
 async def debug_quiz_attempts(
     session_id: str = Query(None, alias="sessionId", description="세션 ID"),
@@ -850,7 +1111,8 @@ async def debug_quiz_attempts(
     """디버그: quiz_attempts 테이블 조회."""
     try:
         repo = get_curriculum_repository()
-        query = repo.client.table("quiz_attempts").select("*")
+        # answers(JSONB)는 행마다 커서 제외하고 요약 컬럼만 조회
+        query = repo.client.table("quiz_attempts").select(DEBUG_QUIZ_ATTEMPT_COLUMNS)
         
         if session_id:
             query = query.eq("session_id", session_id)
@@ -2,6 +2,7 @@
 
 from typing import List, Optional
 
+import orjson
 from fastapi import APIRouter, HTTPException, UploadFile, File, Form
 from pydantic import BaseModel
 
@@ -103,18 +104,17 @@ async def upload_document(
 ):
     """스토어에 문서 업로드."""
     try:
-        import json
         import traceback
         
         parsed_metadata = []
         if metadata:
-            parsed_metadata = json.loads(metadata)
+            parsed_metadata = orjson.loads(metadata)
         
-        file_content = await file.read()
+        # UploadFile의 SpooledTemporaryFile을 그대로 넘겨 청크 단위로 스트리밍 업로드
         result = await upload_document_to_store(
             store_name=store_name,
             file_name=file.filename or "document.txt",
-            file_content=file_content,
+            file_content=file.file,
             metadata=parsed_metadata,
         )
         return result
@@ -1,14 +1,46 @@
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
 
-from fastapi import APIRouter, Depends, Header, HTTPException
+import orjson
+from fastapi import APIRouter, Depends, Header, HTTPException, Request
+from fastapi.responses import Response
 
 from app.core.config import get_settings
 from app.services.tenant_registry import TenantRegistry, get_tenant_registry
+from app.utils.http_cache import conditional_json_response, make_etag
 
 router = APIRouter(tags=["health"])
 
 
+# store 이름에 포함된 키워드 → 소스 키 (앞쪽 키워드가 우선)
+_STORE_SOURCE_KEYWORDS: Tuple[Tuple[str, str], ...] = (
+    ("ticket", "tickets"),
+    ("article", "articles"),
+    ("common", "common"),
+)
+
+
+@lru_cache(maxsize=32)
+def _classify_store_names(store_names: Tuple[str, ...]) -> Tuple[Tuple[str, str], ...]:
+    """테넌트 store 이름 목록을 (소스 키, store 이름) 쌍으로 분류 (같은 키면 뒤의 store가 우선).
+
+    테넌트 설정은 거의 바뀌지 않으므로 /status 호출마다 다시 분류하지 않도록 캐시한다.
+    """
+    classified: Dict[str, str] = {}
+    for store in store_names:
+        store_lower = store.lower()
+        for keyword, source_key in _STORE_SOURCE_KEYWORDS:
+            if keyword in store_lower:
+                classified[source_key] = store
+                break
+    return tuple(classified.items())
+
+
+# /status는 테넌트별 응답이므로 private 캐시 + X-Tenant-ID 기준 Vary (폴링 시 ETag로 재검증)
+STATUS_CACHE_CONTROL = "private, max-age=5"
+
+
 @router.get("/health")
 def read_health() -> dict:
     return {
@@ -19,13 +51,14 @@ def read_health() -> dict:
 
 @router.get("/status")
 def read_status(
+    request: Request,
     x_tenant_id: Optional[str] = Header(None, alias="X-Tenant-ID"),
     tenant_registry: TenantRegistry = Depends(get_tenant_registry),
-) -> Dict[str, Any]:
+) -> Response:
     """
     시스템 상태 및 사용 가능한 검색 소스 반환
     
-    FDK 앱에서 소스 선택 UI를 렌더링하기 위해 사용
+    FDK 앱에서 소스 선택 UI를 렌더링하기 위해 사용 (ETag가 일치하면 304)
     
     소스 구조:
     - tickets: 테넌트의 티켓 (기본)
@@ -50,14 +83,7 @@ def read_status(
     if tenant_config:
         # 테넌트별 Gemini store 설정
         if tenant_config.gemini.store_names:
-            for store in tenant_config.gemini.store_names:
-                store_lower = store.lower()
-                if "ticket" in store_lower:
-                    rag_store_names["tickets"] = store
-                elif "article" in store_lower:
-                    rag_store_names["articles"] = store
-                elif "common" in store_lower:
-                    rag_store_names["common"] = store
+            rag_store_names.update(_classify_store_names(tuple(tenant_config.gemini.store_names)))
     else:
         # 전역 설정 사용
         if settings.gemini_store_tickets:
@@ -81,12 +107,20 @@ def read_status(
     if legacy_common_store and legacy_common_store not in available_sources:
         available_sources.append(legacy_common_store)
     
-    return {
+    status = {
         "ready": bool(available_sources),
-        "timestamp": datetime.now(timezone.utc).isoformat(),
         "tenantId": x_tenant_id,
         "availableSources": available_sources,
         "availableSourceKeys": available_source_keys,
         "ragStoreNames": rag_store_names,
         "geminiModel": settings.gemini_primary_model,
     }
+    # ETag는 매 호출 달라지는 timestamp를 제외한 상태 값으로 계산하므로 약한 검증자(W/)로 표시
+    body = {**status, "timestamp": datetime.now(timezone.utc).isoformat()}
+    return conditional_json_response(
+        request,
+        orjson.dumps(body),
+        cache_control=STATUS_CACHE_CONTROL,
+        etag=make_etag(orjson.dumps(status), weak=True),
+        headers={"Vary": "X-Tenant-ID"},
+    )
@@ -8,21 +8,16 @@ Used by platform-specific frontends (Freshdesk, Zendesk, etc.)
 from typing import Any, Dict, List, Optional
 
 from fastapi import APIRouter, Depends, HTTPException, Query
-from fastapi.responses import StreamingResponse
-import json
 
 from app.middleware.tenant_auth import TenantContext, get_tenant_context, get_optional_tenant_context
 from app.models.session import ChatRequest, ChatResponse
 from app.services.chat_usecase import ChatUsecase, get_chat_usecase
 from app.services.multitenant_chat_handler import MultitenantChatHandler, get_multitenant_chat_handler
+from app.utils.sse import EventSourceResponse, encode_sse_events
 
 router = APIRouter(tags=["multitenant"])
 
 
-def _format_sse(event: str, data: Dict[str, Any]) -> str:
-    return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n"
-
-
 @router.post("/chat", response_model=ChatResponse)
 async def multitenant_chat(
     request: ChatRequest,
@@ -57,24 +52,21 @@ async def multitenant_chat_stream(
     product: Optional[str] = Query(None),
     tenant: TenantContext = Depends(get_tenant_context),
     usecase: ChatUsecase = Depends(get_chat_usecase),
-) -> StreamingResponse:
+) -> EventSourceResponse:
     """
     Streaming multitenant chat endpoint.
     
     Requires authentication headers (same as POST /chat).
     """
-    request = ChatRequest(
-        sessionId=session_id,
+    # Query 파라미터는 FastAPI가 이미 검증했으므로 재검증 없이 구성
+    request = ChatRequest.model_construct(
+        session_id=session_id,
         query=query,
         sources=sources,
-        commonProduct=product,
+        common_product=product,
     )
 
-    async def event_stream():
-        async for event in usecase.stream_multitenant_chat(request, tenant=tenant):
-            yield _format_sse(event["event"], event["data"])
-    
-    return StreamingResponse(event_stream(), media_type="text/event-stream")
+    return EventSourceResponse(encode_sse_events(usecase.stream_multitenant_chat(request, tenant=tenant)))
 
 
 @router.get("/tenant/info")
@@ -1,12 +1,10 @@
 """온보딩 전용 API 라우터."""
 
-import json
 import logging
 from functools import lru_cache
 from typing import Any, Dict, List, Optional
 
 from fastapi import APIRouter, HTTPException, Query
-from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 from supabase import Client, ClientOptions, create_client
 
@@ -14,6 +12,7 @@ from app.services.gemini_client import get_gemini_client
 from app.services.onboarding_repository import get_onboarding_repository
 from app.services.supabase_kb_client import get_kb_client
 from app.core.config import get_settings
+from app.utils.sse import EventSourceResponse, format_sse
 
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/onboarding", tags=["onboarding"])
@@ -132,15 +131,6 @@ def get_followup_prompt(
 답변은 마크다운 형식으로, 한국어로 해주세요."""
 
 
-# ============================================
-# SSE 헬퍼
-# ============================================
-
-def format_sse(event: str, data: dict) -> str:
-    """SSE 포맷으로 변환."""
-    return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n"
-
-
 # ============================================
 # 세션 관리 (Supabase 영속화, 폴백: 인메모리)
 # ============================================
@@ -298,7 +288,7 @@ async def chat_stream(
                 # tools=tools,
             )
 
-            full_response = ""
+            response_parts: List[str] = []
 
             # 스트리밍 생성
             model_name = client.models[0]
@@ -310,8 +300,10 @@ async def chat_stream(
             
             for chunk in response:
                 if chunk.text:
-                    full_response += chunk.text
+                    response_parts.append(chunk.text)
                     yield format_sse("chunk", {"text": chunk.text})
+
+            full_response = "".join(response_parts)
             
             # 히스토리에 추가 (저장은 원본 쿼리로)
             history.append({"user": query, "model": full_response})
@@ -323,10 +315,7 @@ async def chat_stream(
             logger.error(f"Chat stream error: {e}")
             yield format_sse("error", {"message": str(e)})
     
-    return StreamingResponse(
-        event_generator(),
-        media_type="text/event-stream"
-    )
+    return EventSourceResponse(event_generator())
 
 
 # ============================================
@@ -357,9 +346,8 @@ async def feedback_stream(
                 selected_choice=selectedChoice,
             )
             
-            full_response = ""
-            feedback_text = ""
-            questions_buffer = ""
+            feedback_parts: List[str] = []
+            question_parts: List[str] = []
             separator_found = False
             separator = "%%%QUESTIONS%%%"
             
@@ -369,22 +357,24 @@ async def feedback_stream(
             ):
                 if chunk.text:
                     chunk_text = chunk.text
-                    full_response += chunk_text
                     
                     if separator_found:
-                        questions_buffer += chunk_text
+                        question_parts.append(chunk_text)
                     else:
                         if separator in chunk_text:
                             separator_found = True
                             parts = chunk_text.split(separator)
-                            feedback_text += parts[0]
+                            feedback_parts.append(parts[0])
                             if len(parts) > 1:
-                                questions_buffer += parts[1]
+                                question_parts.append(parts[1])
                             yield format_sse("feedback_chunk", {"text": parts[0]})
                         else:
-                            feedback_text += chunk_text
+                            feedback_parts.append(chunk_text)
                             yield format_sse("feedback_chunk", {"text": chunk_text})
             
+            feedback_text = "".join(feedback_parts)
+            questions_buffer = "".join(question_parts)
+
             # 후속 질문 파싱
             questions = []
             if questions_buffer:
@@ -397,10 +387,7 @@ async def feedback_stream(
             logger.error(f"Feedback stream error: {e}")
             yield format_sse("error", {"message": str(e)})
     
-    return StreamingResponse(
-        event_generator(),
-        media_type="text/event-stream"
-    )
+    return EventSourceResponse(event_generator())
 
 
 # ============================================
@@ -431,15 +418,17 @@ async def followup_stream(
                 question=question,
             )
             
-            full_response = ""
+            response_parts: List[str] = []
             
             async for chunk in client.generate_content_stream(
                 contents=prompt,
                 config={"thinking_config": {"thinking_budget": 0}}
             ):
                 if chunk.text:
-                    full_response += chunk.text
+                    response_parts.append(chunk.text)
                     yield format_sse("chunk", {"text": chunk.text})
+
+            full_response = "".join(response_parts)
             
             yield format_sse("result", {"text": full_response})
             
@@ -447,10 +436,7 @@ async def followup_stream(
             logger.error(f"Follow-up stream error: {e}")
             yield format_sse("error", {"message": str(e)})
     
-    return StreamingResponse(
-        event_generator(),
-        media_type="text/event-stream"
-    )
+    return EventSourceResponse(event_generator())
 
 
 # ============================================
@@ -1236,7 +1222,7 @@ async def stream_category_learning(
                 thinking_config=types.ThinkingConfig(thinking_budget=1024),
             )
 
-            full_response = ""
+            response_parts: List[str] = []
             model_name = client.models[0]
 
             response = client.client.models.generate_content_stream(
@@ -1247,19 +1233,18 @@ async def stream_category_learning(
 
             for chunk in response:
                 if chunk.text:
-                    full_response += chunk.text
+                    response_parts.append(chunk.text)
                     yield format_sse("chunk", {"text": chunk.text})
 
+            full_response = "".join(response_parts)
+
             yield format_sse("result", {"text": full_response})
 
         except Exception as e:
             logger.error(f"Learning content stream error: {e}")
             yield format_sse("error", {"message": str(e)})
 
-    return StreamingResponse(
-        event_generator(),
-        media_type="text/event-stream"
-    )
+    return EventSourceResponse(event_generator())
 
 
 # ============================================
@@ -1342,7 +1327,7 @@ async def stream_product_chat(
                 thinking_config=types.ThinkingConfig(thinking_budget=1024),
             )
 
-            full_response = ""
+            response_parts: List[str] = []
             model_name = client.models[0]
 
             response = client.client.models.generate_content_stream(
@@ -1353,16 +1338,15 @@ async def stream_product_chat(
 
             for chunk in response:
                 if chunk.text:
-                    full_response += chunk.text
+                    response_parts.append(chunk.text)
                     yield format_sse("chunk", {"text": chunk.text})
 
+            full_response = "".join(response_parts)
+
             yield format_sse("result", {"text": full_response})
 
         except Exception as e:
             logger.error(f"Product chat stream error: {e}")
             yield format_sse("error", {"message": str(e)})
 
-    return StreamingResponse(
-        event_generator(),
-        media_type="text/event-stream"
-    )
+    return EventSourceResponse(event_generator())
@@ -9,7 +9,6 @@ chat-based approach with schema-validated JSON input/output.
 """
 from __future__ import annotations
 
-import json
 import logging
 from typing import Any, Dict, List, Optional
 
@@ -23,6 +22,7 @@ from app.services.orchestrator import (
 )
 from app.services.orchestrator.persistence import get_analysis_persistence
 from app.utils.schema_validation import validate_or_raise, validate_output
+from app.utils.sse import format_sse
 
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/tickets", tags=["tickets"])
@@ -259,10 +259,10 @@ async def analyze_ticket_stream(
                 options=orchestrator_options,
                 tenant_id=x_tenant_id,
             ):
-                yield f"data: {json.dumps(event, ensure_ascii=False)}\n\n"
+                yield format_sse(None, event)
         except Exception as e:
             logger.error(f"[tickets.analyze/stream] Unexpected error: {e}", exc_info=True)
-            yield f"data: {json.dumps({'type': 'error', 'message': str(e)})}\n\n"
+            yield format_sse(None, {"type": "error", "message": str(e)})
 
     return StreamingResponse(
         event_stream(),
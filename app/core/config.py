@@ -44,6 +44,7 @@ class Settings(BaseSettings):
     gemini_api_key: Optional[str] = None
     gemini_primary_model: str = Field(default="gemini-2.5-flash")
     gemini_fallback_model: Optional[str] = Field(default="gemini-2.0-flash")
+    gemini_embedding_model: str = Field(default="text-embedding-004")
     gemini_store_tickets: Optional[str] = None
     gemini_store_articles: Optional[str] = None
     gemini_store_common: Optional[str] = None
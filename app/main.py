@@ -1,5 +1,8 @@
+import atexit
 import logging
+import queue
 import warnings
+from logging.handlers import QueueHandler, QueueListener
 from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
@@ -8,6 +11,9 @@ from app.api.router import get_api_router
 from app.core.config import get_settings
 from app.middleware.legacy_observability import LegacyRouteObservabilityMiddleware
 from app.middleware.request_id import RequestIdLogFilter, RequestIdMiddleware
+from app.services.curriculum_repository import close_curriculum_repository
+from app.services.gemini_file_search_client import close_shared_client
+from app.services.pipeline_client import close_pipeline_client
 from app.services.scheduler_service import get_scheduler_service
 
 
@@ -90,8 +96,17 @@ logging.basicConfig(
     format="%(asctime)s - %(name)s - %(levelname)s - %(request_id)s - %(message)s",
 )
 logging.getLogger("app").setLevel(settings.log_level)
-for handler in logging.getLogger().handlers:
-    handler.addFilter(RequestIdLogFilter())
+
+# 로그 I/O를 이벤트 루프 밖으로: 루트 핸들러는 QueueListener 스레드에서 실행하고,
+# 요청 경로에서는 큐에 넣기만 한다. request_id는 contextvar라서 큐에 넣는 시점에 기록한다.
+_root_logger = logging.getLogger()
+_log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+_queue_handler = QueueHandler(_log_queue)
+_queue_handler.addFilter(RequestIdLogFilter())
+_log_listener = QueueListener(_log_queue, *_root_logger.handlers, respect_handler_level=True)
+_root_logger.handlers = [_queue_handler]
+_log_listener.start()
+atexit.register(_log_listener.stop)
 
 # Silence noisy libraries
 logging.getLogger("httpx").setLevel(logging.WARNING)
@@ -129,6 +144,9 @@ async def lifespan(app: FastAPI):
     # Shutdown
     scheduler.shutdown()
     logger.info("Scheduler stopped")
+    await close_shared_client()
+    await close_pipeline_client()
+    close_curriculum_repository()
 
 
 app = FastAPI(title=settings.app_name, lifespan=lifespan)
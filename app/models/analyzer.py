@@ -15,6 +15,15 @@ class AnalyzerClarification:
     field: Optional[str] = None
     pending_filter: Optional[MetadataFilter] = None
 
+    def to_dict(self) -> dict:
+        """asdict()의 재귀 deep copy 없이 필드를 한 번만 순회해 dict로 변환."""
+        data = dict(self.__dict__)
+        if self.options is not None:
+            data["options"] = list(self.options)
+        if self.pending_filter is not None:
+            data["pending_filter"] = dict(self.pending_filter.__dict__)
+        return data
+
 
 @dataclass
 class AnalyzerResult:
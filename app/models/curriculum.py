@@ -1,10 +1,10 @@
 """커리큘럼 및 퀴즈 관련 데이터 모델."""
 
 from datetime import datetime
-from typing import List, Optional, Dict
+from typing import List, Literal, Optional, Dict
 from uuid import UUID
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, TypeAdapter
 
 
 # ============================================
@@ -87,6 +87,10 @@ class QuizQuestion(BaseModel):
         from_attributes = True
 
 
+# 문제 목록을 pydantic-core에서 한 번에 검증 (행/항목마다 모델을 따로 생성하지 않음)
+QuizQuestionListAdapter: TypeAdapter[List[QuizQuestion]] = TypeAdapter(List[QuizQuestion])
+
+
 class QuizQuestionWithAnswer(QuizQuestion):
     """퀴즈 문제 (정답 포함 - 내부용)."""
 
@@ -192,7 +196,7 @@ class ProgressSummary(BaseModel):
     completed_modules: int = Field(..., alias="completedModules")
     in_progress_modules: int = Field(..., alias="inProgressModules")
     completion_rate: float = Field(..., alias="completionRate")
-    modules: List[CurriculumModuleResponse]
+    modules: Optional[List[CurriculumModuleResponse]] = None
 
     class Config:
         populate_by_name = True
@@ -202,6 +206,10 @@ class ProgressSummary(BaseModel):
 # Module Content (학습 콘텐츠)
 # ============================================
 
+# module_contents 테이블에 저장되는 값과 동일하게 유지
+ContentLevel = Literal["basic", "intermediate", "advanced"]
+SectionType = Literal["overview", "concept", "core_concepts", "features", "practice", "faq"]
+
 class ModuleContent(BaseModel):
     """모듈 학습 콘텐츠 (정적 콘텐츠)."""
 
@@ -6,7 +6,7 @@ from typing import Literal
 MetadataOperator = Literal["EQUALS", "GREATER_THAN", "LESS_THAN", "IN"]
 
 
-@dataclass
+@dataclass(frozen=True)
 class MetadataFilter:
     key: str
     value: str
@@ -1,7 +1,8 @@
 from __future__ import annotations
 
+from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Any, List, Optional
+from typing import Any, Dict, List, Optional
 
 from pydantic import AliasChoices, BaseModel, Field
 from pydantic.config import ConfigDict
@@ -32,6 +33,33 @@ class SessionDetailResponse(SessionBase):
     known_context: Optional[dict] = Field(default=None, alias="knownContext")
 
 
+@dataclass
+class SessionView:
+    """chat 경로에서 쓰는 세션 필드만 정규화한 읽기 전용 뷰.
+
+    저장소에서 읽을 때 한 번만 타입을 정리하므로 핸들러는 isinstance 검사 없이 바로 사용한다.
+    """
+
+    conversation_history: List[dict] = field(default_factory=list)
+    question_history: List[str] = field(default_factory=list)
+    clarification_state: Optional[dict] = None
+
+    @classmethod
+    def from_record(cls, record: Dict[str, Any]) -> "SessionView":
+        conversation = record.get("conversationHistory")
+        questions = record.get("questionHistory")
+        clarification = record.get("clarificationState")
+        return cls(
+            conversation_history=[turn for turn in conversation if isinstance(turn, dict)]
+            if isinstance(conversation, list)
+            else [],
+            question_history=[entry for entry in questions if isinstance(entry, str)]
+            if isinstance(questions, list)
+            else [],
+            clarification_state=clarification if isinstance(clarification, dict) else None,
+        )
+
+
 class ChatRequest(BaseModel):
     model_config = ConfigDict(populate_by_name=True)
 
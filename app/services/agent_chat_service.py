@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-from dataclasses import asdict
 from typing import List, Optional, Tuple
 
 from fastapi import HTTPException, status
@@ -84,7 +83,7 @@ class AgentChatService:
             "filters": filter_summaries,
             "filterConfidence": analyzer_result.confidence,
             "clarificationNeeded": analyzer_result.clarification_needed,
-            "clarification": asdict(analyzer_result.clarification) if analyzer_result.clarification else None,
+            "clarification": analyzer_result.clarification.to_dict() if analyzer_result.clarification else None,
             "knownContext": analyzer_result.known_context,
         }
 
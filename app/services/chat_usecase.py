@@ -1,15 +1,17 @@
 from __future__ import annotations
 
-from dataclasses import asdict
 from typing import AsyncIterator, Optional
+import asyncio
 import inspect
 import logging
 
+import httpx
 from fastapi import Depends, HTTPException, status
 
 from app.middleware.tenant_auth import TenantContext
-from app.models.session import ChatRequest, ChatResponse
+from app.models.session import ChatRequest, ChatResponse, SessionView
 from app.services.common_chat_handler import CommonChatHandler, get_common_chat_handler
+from app.services.gemini_client import GeminiClientError
 from app.services.multitenant_chat_handler import MultitenantChatHandler, get_multitenant_chat_handler
 from app.services.pipeline_client import PipelineClient, PipelineClientError, get_pipeline_client
 from app.services.query_filter_analyzer import QueryFilterAnalyzer, get_query_filter_analyzer
@@ -19,6 +21,13 @@ from app.services.ticket_chat_handler import TicketChatHandler, get_ticket_chat_
 
 LOGGER = logging.getLogger(__name__)
 
+# chat 경로에서 세션으로부터 읽는 필드 (전체 레코드 대신 필요한 필드만 조회)
+_STREAM_HISTORY_LIMIT = 4
+
+# analyzer는 응답 보강용(선택)이므로 지연 상한을 두고, 예상된 실패만 무시한다.
+_ANALYZER_TIMEOUT_SECONDS = 3.0
+_ANALYZER_EXPECTED_ERRORS = (GeminiClientError, httpx.HTTPError, asyncio.TimeoutError)
+
 
 async def _maybe_await(value):
     """Await the value if needed to support sync test doubles."""
@@ -27,6 +36,17 @@ async def _maybe_await(value):
     return value
 
 
+def _trusted_chat_response(payload) -> ChatResponse:
+    """같은 프로세스에서 만든 응답 dict(ticket handler 결과)를 재검증 없이 모델로 변환.
+
+    신뢰 경계: 외부 JSON(PipelineClient 응답 등)에는 쓰지 말고 model_validate로 검증한다.
+    형태가 다르면(dict가 아니거나 text 누락) model_validate로 검증한다.
+    """
+    if isinstance(payload, dict) and isinstance(payload.get("text"), str):
+        return ChatResponse.model_construct(**payload)
+    return ChatResponse.model_validate(payload)
+
+
 class ChatUsecase:
     def __init__(
         self,
@@ -52,89 +72,121 @@ class ChatUsecase:
         - common/ticket/pipeline 순서 유지
         - tenant 헤더가 있으면 multitenant handler로 디스패치(하위호환)
         """
-        session = await self._repository.get(request.session_id)
-        if not session:
-            session = {"sessionId": request.session_id, "conversationHistory": [], "questionHistory": []}
-            await self._repository.save(session)
-
-        conversation_history = session.get("conversationHistory", []) if isinstance(session, dict) else []
-
-        if self._common_handler and self._common_handler.can_handle(request):
-            LOGGER.info("🎯 CommonChatHandler handling request for sources: %s", request.sources)
-            response = await _maybe_await(self._common_handler.handle(request, history=conversation_history))
-            await self._repository.append_turn(request.session_id, request.query, response.text or "")
-            return response
-
-        if tenant is not None:
-            return await self._handle_multitenant_chat(
-                request,
-                tenant=tenant,
-                conversation_history=conversation_history,
-                ensure_session_exists=False,  # legacy endpoint already created session above
-            )
+        session = await self._repository.get_view(request.session_id)
+        # 신규 세션은 바로 저장하지 않고, 첫 쓰기(질문 기록 등)와 합쳐 한 번에 저장한다.
+        pending_session: Optional[dict] = None
+        if session is None:
+            session = SessionView()
+            pending_session = {"sessionId": request.session_id, "conversationHistory": [], "questionHistory": []}
 
-        history_texts: list[str] = []
-        if isinstance(session, dict):
-            question_history = session.get("questionHistory", [])
-            if isinstance(question_history, list):
-                history_texts = [str(entry) for entry in question_history if isinstance(entry, str)]
-
-        clarification_state = session.get("clarificationState") if isinstance(session, dict) else None
-        if request.clarification_option and clarification_state and isinstance(session, dict):
-            session.pop("clarificationState", None)
-            await self._repository.save(session)
-
-        if self._ticket_handler and self._ticket_handler.can_handle(request):
-            LOGGER.info("🎫 TicketChatHandler handling request")
-            payload, ticket_result = await _maybe_await(
-                self._ticket_handler.handle(
+        try:
+            conversation_history = session.conversation_history
+
+            if self._common_handler and self._common_handler.can_handle(request):
+                LOGGER.info("🎯 CommonChatHandler handling request for sources: %s", request.sources)
+                response = await _maybe_await(self._common_handler.handle(request, history=conversation_history))
+                if pending_session is not None:
+                    await self._repository.save(pending_session)
+                    pending_session = None
+                await self._repository.append_turn(request.session_id, request.query, response.text or "")
+                return response
+
+            if tenant is not None:
+                if pending_session is not None:
+                    await self._repository.save(pending_session)
+                    pending_session = None
+                return await self._handle_multitenant_chat(
                     request,
-                    history=history_texts,
-                    clarification_state=clarification_state,
+                    tenant=tenant,
+                    conversation_history=conversation_history,
+                    ensure_session_exists=False,  # legacy endpoint already created session above
                 )
-            )
-            if ticket_result:
-                await self._repository.record_analyzer_result(request.session_id, ticket_result)
-            await self._repository.append_question(request.session_id, request.query)
-            return ChatResponse.model_validate(payload)
 
-        analyzer_result = None
-        if self._analyzer:
-            try:
-                analyzer_result = await _maybe_await(
-                    self._analyzer.analyze(
-                        request.query,
-                        clarification_option=request.clarification_option,
+            history_texts = session.question_history
+            clarification_state = session.clarification_state
+            if request.clarification_option and clarification_state:
+                # 부분 조회 결과로 저장하면 다른 필드가 유실되므로 전체 레코드를 다시 읽어 갱신
+                record = await self._repository.get(request.session_id)
+                if record:
+                    record.pop("clarificationState", None)
+                    await self._repository.save(record)
+
+            if self._ticket_handler and self._ticket_handler.can_handle(request):
+                LOGGER.info("🎫 TicketChatHandler handling request")
+                payload, ticket_result = await _maybe_await(
+                    self._ticket_handler.handle(
+                        request,
+                        history=history_texts,
                         clarification_state=clarification_state,
                     )
                 )
-            except Exception:
-                analyzer_result = None
-
-        if analyzer_result:
-            await self._repository.record_analyzer_result(request.session_id, analyzer_result)
-
-        payload = request.model_dump(by_alias=True, exclude_none=True)
-        try:
-            pipeline_result = await _maybe_await(self._pipeline.chat(payload))
-        except PipelineClientError as exc:
-            raise HTTPException(status_code=exc.status_code, detail=exc.details)
-
-        await self._repository.append_question(request.session_id, request.query)
-
-        if isinstance(pipeline_result, dict):
-            pipeline_result.setdefault("sources", request.sources)
+                if ticket_result:
+                    if pending_session is not None:
+                        await self._repository.save(pending_session)
+                        pending_session = None
+                    await self._repository.record_analyzer_result(request.session_id, ticket_result)
+                await self._record_question(request, pending_session)
+                pending_session = None
+                return _trusted_chat_response(payload)
+
+            analyzer_result = None
+            if self._analyzer:
+                try:
+                    analyzer_result = await asyncio.wait_for(
+                        _maybe_await(
+                            self._analyzer.analyze(
+                                request.query,
+                                clarification_option=request.clarification_option,
+                                clarification_state=clarification_state,
+                            )
+                        ),
+                        timeout=_ANALYZER_TIMEOUT_SECONDS,
+                    )
+                except _ANALYZER_EXPECTED_ERRORS as exc:
+                    LOGGER.warning("Query filter analyzer skipped: %r", exc)
+                    analyzer_result = None
 
             if analyzer_result:
-                pipeline_result["filters"] = analyzer_result.summaries or pipeline_result.get("filters") or []
-                pipeline_result["filterConfidence"] = analyzer_result.confidence
-                pipeline_result["clarificationNeeded"] = analyzer_result.clarification_needed
-                pipeline_result["clarification"] = (
-                    asdict(analyzer_result.clarification) if analyzer_result.clarification else None
-                )
-                pipeline_result["knownContext"] = analyzer_result.known_context or {}
+                if pending_session is not None:
+                    await self._repository.save(pending_session)
+                    pending_session = None
+                await self._repository.record_analyzer_result(request.session_id, analyzer_result)
 
-        return ChatResponse.model_validate(pipeline_result)
+            payload = request.model_dump(by_alias=True, exclude_none=True)
+            try:
+                pipeline_result = await _maybe_await(self._pipeline.chat(payload))
+            except PipelineClientError as exc:
+                raise HTTPException(status_code=exc.status_code, detail=exc.details)
+
+            await self._record_question(request, pending_session)
+            pending_session = None
+
+            if isinstance(pipeline_result, dict):
+                pipeline_result.setdefault("sources", request.sources)
+
+                if analyzer_result:
+                    pipeline_result["filters"] = analyzer_result.summaries or pipeline_result.get("filters") or []
+                    pipeline_result["filterConfidence"] = analyzer_result.confidence
+                    pipeline_result["clarificationNeeded"] = analyzer_result.clarification_needed
+                    pipeline_result["clarification"] = (
+                        analyzer_result.clarification.to_dict() if analyzer_result.clarification else None
+                    )
+                    pipeline_result["knownContext"] = analyzer_result.known_context or {}
+
+            # pipeline 응답은 외부 서비스 JSON이므로 항상 검증한다.
+            return ChatResponse.model_validate(pipeline_result)
+        except Exception:
+            # 처리 중 실패해도 신규 세션은 남겨 둔다 (이후 요청이 같은 세션을 이어서 사용).
+            if pending_session is not None:
+                await self._repository.save(pending_session)
+            raise
+
+    async def _record_question(self, request: ChatRequest, pending_session: Optional[dict]) -> None:
+        """질문 기록. 신규 세션이면 세션 저장과 합쳐 한 번의 쓰기로 처리."""
+        if pending_session is not None:
+            await self._repository.save_and_append(pending_session, request.query)
+        else:
+            await self._repository.append_question(request.session_id, request.query)
 
     async def handle_multitenant_chat(self, request: ChatRequest, *, tenant: TenantContext) -> ChatResponse:
         """
@@ -142,8 +194,8 @@ class ChatUsecase:
         - session이 없어도 생성하지 않음(기존 동작 유지)
         - multitenant handler만 사용
         """
-        session = await self._repository.get(request.session_id)
-        conversation_history = session.get("conversationHistory", []) if isinstance(session, dict) else []
+        session = await self._repository.get_view(request.session_id)
+        conversation_history = session.conversation_history if session else []
         return await self._handle_multitenant_chat(
             request,
             tenant=tenant,
@@ -159,18 +211,22 @@ class ChatUsecase:
         - 그 외에는 common handler stream 유지
         - SSE 포맷 자체는 라우트에서 유지(여기서는 event/data dict만 yield)
         """
-        session = await self._repository.get(request.session_id)
-        if not session:
-            session = {"sessionId": request.session_id, "conversationHistory": [], "questionHistory": []}
-            await self._repository.save(session)
+        history_field = "questionHistory" if tenant is not None else "conversationHistory"
+        history = await self._repository.get_recent_history(
+            request.session_id, history_field, _STREAM_HISTORY_LIMIT
+        )
+        if history is None:
+            history = []
+            await self._repository.save(
+                {"sessionId": request.session_id, "conversationHistory": [], "questionHistory": []}
+            )
 
         if tenant is not None:
             if not self._multitenant_handler:
                 yield {"event": "error", "data": {"message": "Chat service not available"}}
                 return
 
-            raw_history = session.get("questionHistory", []) if isinstance(session, dict) else []
-            history_texts = [str(entry) for entry in raw_history if isinstance(entry, str)][-4:]
+            history_texts = [str(entry) for entry in history if isinstance(entry, str)]
 
             response_text = ""
             async for event in self._multitenant_handler.stream_handle(
@@ -188,9 +244,7 @@ class ChatUsecase:
             yield {"event": "error", "data": {"message": f"지원하지 않는 검색 소스입니다: {request.sources}"}}
             return
 
-        conversation_history = session.get("conversationHistory", []) if isinstance(session, dict) else []
-        if len(conversation_history) > 4:
-            conversation_history = conversation_history[-4:]
+        conversation_history = history
 
         terminal_event_sent = False
         response_text = ""
@@ -216,11 +270,10 @@ class ChatUsecase:
             yield {"event": "error", "data": {"message": "Chat service not available"}}
             return
 
-        session = await self._repository.get(request.session_id)
-        history: list[str] = []
-        if session and isinstance(session, dict):
-            raw_history = session.get("questionHistory", [])
-            history = [str(entry) for entry in raw_history if isinstance(entry, str)][-4:]
+        raw_history = await self._repository.get_recent_history(
+            request.session_id, "questionHistory", _STREAM_HISTORY_LIMIT
+        )
+        history = [str(entry) for entry in raw_history or [] if isinstance(entry, str)]
 
         response_text = ""
         async for event in self._multitenant_handler.stream_handle(
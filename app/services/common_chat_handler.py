@@ -3,6 +3,7 @@ from __future__ import annotations
 import logging
 import os
 import time
+from functools import lru_cache
 from typing import Dict, List, Optional
 
 from fastapi import HTTPException, status
@@ -37,28 +38,20 @@ class CommonChatHandler:
     ) -> None:
         self.gemini_client = gemini_client
         self.store_names = store_names  # source -> store_name 매핑
+        # 요청 source와 비교할 이름 (source key + store path)
+        self._known_sources = frozenset(name for item in store_names.items() for name in item)
         self.documents_service = documents_service
 
     def can_handle(self, request: ChatRequest) -> bool:
         """사용 가능한 store가 하나라도 있으면 처리 가능"""
         if not self.store_names:
             return False
-        
         sources = [source.strip() for source in (request.sources or []) if source.strip()]
         if not sources:
             # sources 지정 안되면 기본적으로 처리
             return True
-        
-        # 역방향 매핑: store path -> source key
-        store_to_source = {v: k for k, v in self.store_names.items()}
-        
-        # 요청된 sources 중 하나라도 store_names에 있거나, store path로 매칭되면 처리 가능
-        for source in sources:
-            if source in self.store_names:
-                return True
-            if source in store_to_source:
-                return True
-        return False
+        # 요청된 sources 중 하나라도 source key 또는 store path와 일치하면 처리 가능
+        return any(source in self._known_sources for source in sources)
 
     def _get_store_names_for_request(self, request: ChatRequest) -> List[str]:
         """요청에 맞는 store names 반환"""
@@ -408,6 +401,7 @@ class CommonChatHandler:
 
 
 
+@lru_cache
 def get_common_chat_handler() -> Optional[CommonChatHandler]:
     settings = get_settings()
     api_key = settings.gemini_api_key or os.getenv("GEMINI_API_KEY")
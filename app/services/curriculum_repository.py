@@ -3,13 +3,16 @@
 from __future__ import annotations
 
 import logging
+from collections import Counter
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 from uuid import UUID
 
+import httpx
 from supabase import Client, create_client, ClientOptions
 
 from app.core.config import get_settings
+from app.utils.cache import TTLCache
 from app.models.curriculum import (
     CurriculumModule,
     CurriculumModuleResponse,
@@ -17,6 +20,7 @@ from app.models.curriculum import (
     ModuleContent,
     ModuleContentResponse,
     QuizQuestion,
+    QuizQuestionListAdapter,
     QuizQuestionWithAnswer,
     QuizChoice,
     QuizAnswer,
@@ -32,6 +36,24 @@ TABLE_QUESTIONS = "quiz_questions"
 TABLE_ATTEMPTS = "quiz_attempts"
 TABLE_PROGRESS = "module_progress"
 TABLE_CONTENTS = "module_contents"
+TABLE_QUIZ_CACHE = "quiz_generation_cache"
+
+# 모듈 메타데이터는 스크립트로만 갱신되는 거의 불변 데이터이므로 짧은 TTL로 캐시
+MODULE_CACHE_MAXSIZE = 2048
+MODULE_CACHE_TTL_SECONDS = 300
+
+# 정적 학습 콘텐츠(module_contents)도 관리자만 갱신하므로 짧은 TTL로 캐시
+CONTENT_CACHE_MAXSIZE = 1024
+CONTENT_CACHE_TTL_SECONDS = 60
+
+# 퀴즈 문제는 AI 생성 후 저장되면 거의 바뀌지 않으므로 짧은 TTL로 캐시 (빈 결과는 캐시하지 않음)
+QUESTION_CACHE_MAXSIZE = 1024
+QUESTION_CACHE_TTL_SECONDS = 60
+
+
+# Supabase(PostgREST) HTTP 커넥션 풀: 유휴 연결을 60초간 유지해 요청마다 TLS 핸드셰이크를 하지 않도록 함
+SUPABASE_HTTP_TIMEOUT_SECONDS = 120
+SUPABASE_HTTP_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=50, keepalive_expiry=60)
 
 
 class CurriculumRepositoryError(RuntimeError):
@@ -44,6 +66,38 @@ class CurriculumRepository:
 
     def __init__(self, client: Client) -> None:
         self.client = client
+        self._module_cache: TTLCache[str, CurriculumModule] = TTLCache(
+            maxsize=MODULE_CACHE_MAXSIZE,
+            ttl_seconds=MODULE_CACHE_TTL_SECONDS,
+        )
+        self._content_cache: TTLCache[Tuple[str, ...], Any] = TTLCache(
+            maxsize=CONTENT_CACHE_MAXSIZE,
+            ttl_seconds=CONTENT_CACHE_TTL_SECONDS,
+        )
+        self._question_cache: TTLCache[Tuple[str, bool], List[QuizQuestion]] = TTLCache(
+            maxsize=QUESTION_CACHE_MAXSIZE,
+            ttl_seconds=QUESTION_CACHE_TTL_SECONDS,
+        )
+
+    def invalidate_module_cache(self, module_id: Optional[UUID] = None) -> None:
+        """모듈 캐시 무효화 (module_id 미지정 시 전체)."""
+        if module_id is None:
+            self._module_cache.clear()
+        else:
+            self._module_cache.pop(str(module_id).lower())
+
+    def invalidate_content_cache(self) -> None:
+        """학습 콘텐츠 캐시 전체 무효화."""
+        self._content_cache.clear()
+
+    def invalidate_question_cache(self, module_id: Optional[UUID] = None) -> None:
+        """퀴즈 문제 캐시 무효화 (module_id 미지정 시 전체)."""
+        if module_id is None:
+            self._question_cache.clear()
+            return
+        mid = str(module_id).lower()
+        for active_only in (True, False):
+            self._question_cache.pop((mid, active_only))
 
     # ============================================
     # 모듈 조회
@@ -93,7 +147,11 @@ class CurriculumRepository:
             raise CurriculumRepositoryError(str(e)) from e
 
     async def get_module_by_id(self, module_id: UUID) -> Optional[CurriculumModule]:
-        """모듈 ID로 조회."""
+        """모듈 ID로 조회 (TTL 캐시 우선)."""
+        cache_key = str(module_id).lower()
+        cached = self._module_cache.get(cache_key)
+        if cached is not None:
+            return cached
         try:
             response = (
                 self.client.table(TABLE_MODULES)
@@ -105,7 +163,7 @@ class CurriculumRepository:
             
             if response.data:
                 row = response.data[0]
-                return CurriculumModule(
+                module = CurriculumModule(
                     id=row["id"],
                     targetProductId=row["target_product_id"],
                     targetProductType=row.get("target_product_type", "module"),
@@ -122,6 +180,8 @@ class CurriculumRepository:
                     kbCategorySlug=row.get("kb_category_slug"),
                     createdAt=row.get("created_at"),
                 )
+                self._module_cache.set(cache_key, module)
+                return module
             return None
         except Exception as e:
             LOGGER.error(f"Failed to get module by id: {e}")
@@ -177,6 +237,11 @@ class CurriculumRepository:
         active_only: bool = True,
     ) -> List[QuizQuestion]:
         """모듈별 퀴즈 문제 조회 (정답 제외)."""
+        cache_key = (str(module_id).lower(), active_only)
+        cached = self._question_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
         try:
             query = (
                 self.client.table(TABLE_QUESTIONS)
@@ -189,20 +254,11 @@ class CurriculumRepository:
                 query = query.eq("is_active", True)
             
             response = query.execute()
-            
-            questions = []
-            for row in response.data or []:
-                # choices JSONB를 QuizChoice 리스트로 변환
-                choices = [QuizChoice(**c) for c in row.get("choices", [])]
-                questions.append(QuizQuestion(
-                    id=row["id"],
-                    moduleId=row["module_id"],
-                    questionOrder=row.get("question_order", 0),
-                    question=row["question"],
-                    context=row.get("context"),
-                    choices=choices,
-                    relatedDocUrl=row.get("related_doc_url"),
-                ))
+
+            # 선택한 컬럼명이 필드명과 같으므로 행 목록을 그대로 일괄 검증 (choices JSONB 포함)
+            questions = QuizQuestionListAdapter.validate_python(response.data or [])
+            if questions:
+                self._question_cache.set(cache_key, questions)
             return questions
         except Exception as e:
             LOGGER.error(f"Failed to get quiz questions: {e}")
@@ -215,10 +271,79 @@ class CurriculumRepository:
                 return
             
             self.client.table(TABLE_QUESTIONS).insert(questions).execute()
+            for module_id in {q["module_id"] for q in questions}:
+                self.invalidate_question_cache(module_id)
         except Exception as e:
             LOGGER.error(f"Failed to create questions: {e}")
             raise CurriculumRepositoryError(str(e)) from e
 
+    async def get_cached_quiz(self, content_hash: str) -> Optional[List[Dict[str, Any]]]:
+        """콘텐츠 해시로 이전 AI 생성 퀴즈 조회 (없으면 None)."""
+        try:
+            response = (
+                self.client.table(TABLE_QUIZ_CACHE)
+                .select("questions")
+                .eq("content_hash", content_hash)
+                .limit(1)
+                .execute()
+            )
+            if not response.data:
+                return None
+            return response.data[0]["questions"]
+        except Exception as e:
+            LOGGER.error(f"Failed to get cached quiz: {e}")
+            raise CurriculumRepositoryError(str(e)) from e
+
+    async def match_cached_quiz(
+        self,
+        embedding: List[float],
+        model: str,
+        threshold: float,
+    ) -> Optional[List[Dict[str, Any]]]:
+        """임베딩 유사도(cosine >= threshold)가 가장 높은 캐시 퀴즈 조회 (없으면 None)."""
+        try:
+            response = self.client.rpc(
+                "match_quiz_generation_cache",
+                {
+                    "query_embedding": embedding,
+                    "match_threshold": threshold,
+                    "model_filter": model,
+                },
+            ).execute()
+            if not response.data:
+                return None
+            return response.data[0]["questions"]
+        except Exception as e:
+            LOGGER.error(f"Failed to match cached quiz: {e}")
+            raise CurriculumRepositoryError(str(e)) from e
+
+    async def save_cached_quiz(
+        self,
+        content_hash: str,
+        module_id: UUID,
+        model: str,
+        questions: List[Dict[str, Any]],
+        embedding: Optional[List[float]] = None,
+    ) -> None:
+        """AI 생성 퀴즈 캐시 저장 (같은 해시가 이미 있으면 무시)."""
+        try:
+            row: Dict[str, Any] = {
+                "content_hash": content_hash,
+                "module_id": str(module_id),
+                "model": model,
+                "questions": questions,
+            }
+            if embedding is not None:
+                row["embedding"] = embedding
+            self.client.table(TABLE_QUIZ_CACHE).upsert(
+                row,
+                on_conflict="content_hash",
+                ignore_duplicates=True,
+            ).execute()
+        except Exception as e:
+            LOGGER.error(f"Failed to save cached quiz: {e}")
+            raise CurriculumRepositoryError(str(e)) from e
+
     async def get_questions_with_answers(
         self,
         module_id: UUID,
@@ -638,6 +763,42 @@ class CurriculumRepository:
             LOGGER.error(f"Failed to get modules with progress: {e}", exc_info=True)
             raise CurriculumRepositoryError(str(e)) from e
 
+    async def get_progress_counts(
+        self,
+        session_id: str,
+        product: str = "freshservice",
+    ) -> Tuple[int, Dict[str, int]]:
+        """진도 요약용 집계만 조회 (전체 모듈 수, 상태별 모듈 수).
+
+        모듈/진도 행 전체를 모델로 변환하지 않고 id, status 컬럼만 가져와 센다.
+        """
+        try:
+            modules_response = (
+                self.client.table(TABLE_MODULES)
+                .select("id")
+                .eq("target_product_id", product)
+                .eq("is_active", True)
+                .execute()
+            )
+            module_ids = [row["id"] for row in modules_response.data or []]
+            if not module_ids:
+                return 0, {}
+
+            progress_response = (
+                self.client.table(TABLE_PROGRESS)
+                .select("status")
+                .eq("session_id", session_id)
+                .in_("module_id", module_ids)
+                .execute()
+            )
+            status_counts = Counter(
+                row.get("status") or "not_started" for row in progress_response.data or []
+            )
+            return len(module_ids), dict(status_counts)
+        except Exception as e:
+            LOGGER.error(f"Failed to get progress counts: {e}", exc_info=True)
+            raise CurriculumRepositoryError(str(e)) from e
+
     # ============================================
     # 모듈 콘텐츠 조회
     # ============================================
@@ -657,6 +818,11 @@ class CurriculumRepository:
         Returns:
             레벨별로 그룹화된 콘텐츠
         """
+        cache_key = ("contents", str(module_id).lower(), level or "")
+        cached = self._content_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
         try:
             # 모듈 정보 조회
             module_response = (
@@ -715,12 +881,14 @@ class CurriculumRepository:
             level_order = ["basic", "intermediate", "advanced"]
             sorted_levels = sorted(levels_set, key=lambda x: level_order.index(x) if x in level_order else 99)
             
-            return ModuleContentResponse(
+            contents = ModuleContentResponse(
                 module_id=module_id,
                 module_name=module_data["name_ko"],
                 levels=sorted_levels,
                 sections=sections,
             )
+            self._content_cache.set(cache_key, contents)
+            return contents
             
         except CurriculumRepositoryError:
             raise
@@ -745,6 +913,11 @@ class CurriculumRepository:
         Returns:
             콘텐츠 또는 None
         """
+        cache_key = ("section", str(module_id).lower(), section_type, level)
+        cached = self._content_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
         try:
             response = (
                 self.client.table(TABLE_CONTENTS)
@@ -761,7 +934,7 @@ class CurriculumRepository:
                 return None
             
             row = response.data[0]
-            return ModuleContent(
+            content = ModuleContent(
                 id=row["id"],
                 module_id=row["module_id"],
                 section_type=row["section_type"],
@@ -773,6 +946,9 @@ class CurriculumRepository:
                 estimated_minutes=row.get("estimated_minutes", 5),
                 is_active=row.get("is_active", True),
             )
+            # 없는 섹션(None)은 캐시하지 않아 콘텐츠 추가 직후 바로 조회되도록 함
+            self._content_cache.set(cache_key, content)
+            return content
             
         except Exception as e:
             LOGGER.error(f"Failed to get section content: {e}")
@@ -784,19 +960,41 @@ class CurriculumRepository:
 # ============================================
 
 _repository: Optional[CurriculumRepository] = None
+_http_client: Optional[httpx.Client] = None
 
 
 def get_curriculum_repository() -> CurriculumRepository:
     """커리큘럼 저장소 싱글톤 인스턴스 반환."""
-    global _repository
+    global _repository, _http_client
     
     if _repository is None:
         settings = get_settings()
-        client = create_client(
-            settings.supabase_common_url,
-            settings.supabase_common_service_role_key,
-            options=ClientOptions(schema="onboarding"),
+        # PostgREST 기본 세션과 같은 설정(http2, 리다이렉트 추적)에 keep-alive 풀 크기/유지 시간만 조정
+        http_client = httpx.Client(
+            http2=True,
+            follow_redirects=True,
+            timeout=SUPABASE_HTTP_TIMEOUT_SECONDS,
+            limits=SUPABASE_HTTP_LIMITS,
         )
+        try:
+            client = create_client(
+                settings.supabase_common_url,
+                settings.supabase_common_service_role_key,
+                options=ClientOptions(schema="onboarding", httpx_client=http_client),
+            )
+        except Exception:
+            http_client.close()
+            raise
+        _http_client = http_client
         _repository = CurriculumRepository(client)
     
     return _repository
+
+
+def close_curriculum_repository() -> None:
+    """커리큘럼 저장소의 HTTP 커넥션 풀 종료 (애플리케이션 shutdown 시 호출)."""
+    global _repository, _http_client
+    if _http_client is not None:
+        _http_client.close()
+    _http_client = None
+    _repository = None
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import json
 import logging
+from functools import lru_cache
 from typing import Any, AsyncGenerator, Iterable, List, Optional
 
 from app.core.config import get_settings
@@ -10,8 +11,9 @@ from app.models.metadata import MetadataFilter
 LOGGER = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=1)
 def get_gemini_client() -> "GeminiClient":
-    """싱글톤 GeminiClient 인스턴스 반환."""
+    """싱글톤 GeminiClient 인스턴스 반환 (genai.Client와 HTTP 커넥션 풀을 요청 간 공유)."""
     settings = get_settings()
     return GeminiClient(
         api_key=settings.gemini_api_key,
@@ -204,3 +206,23 @@ class GeminiClient:
         except Exception as exc:
             LOGGER.error("Gemini generation failed: %s", exc)
             raise GeminiClientError("Gemini 생성 실패") from exc
+
+    def embed_text(
+        self,
+        text: str,
+        *,
+        model: str,
+        output_dimensionality: Optional[int] = None,
+    ) -> List[float]:
+        """텍스트 임베딩 벡터 생성 (동기)."""
+        try:
+            config = {"output_dimensionality": output_dimensionality} if output_dimensionality else None
+            response = self.client.models.embed_content(
+                model=model,
+                contents=text,
+                config=config,
+            )
+            return list(response.embeddings[0].values)
+        except Exception as exc:
+            LOGGER.error("Gemini embedding failed: %s", exc)
+            raise GeminiClientError("Gemini 임베딩 실패") from exc
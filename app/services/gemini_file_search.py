@@ -1,8 +1,10 @@
 """Google File Search API 서비스."""
 
+import asyncio
+import os
 import httpx
 import time
-from typing import List, Optional, Dict, Any
+from typing import AsyncIterator, BinaryIO, List, Optional, Dict, Any, Union
 
 from app.core.config import get_settings
 
@@ -152,16 +154,43 @@ async def get_store_documents(
         }
 
 
+# 파일 객체 업로드 시 한 번에 읽어 전송하는 크기
+UPLOAD_CHUNK_SIZE = 1024 * 1024
+
+
+def _content_length(file_content: Union[bytes, BinaryIO]) -> int:
+    """업로드 본문 크기 (파일 객체는 끝으로 seek해서 계산)."""
+    if isinstance(file_content, (bytes, bytearray)):
+        return len(file_content)
+    size = file_content.seek(0, os.SEEK_END)
+    file_content.seek(0)
+    return size
+
+
+async def _iter_file_chunks(file_obj: BinaryIO) -> AsyncIterator[bytes]:
+    """파일 객체를 처음부터 청크 단위로 읽어 전달 (디스크 읽기는 스레드에서 수행)."""
+    file_obj.seek(0)
+    while True:
+        chunk = await asyncio.to_thread(file_obj.read, UPLOAD_CHUNK_SIZE)
+        if not chunk:
+            return
+        yield chunk
+
+
 async def upload_document_to_store(
     store_name: str,
     file_name: str,
-    file_content: bytes,
+    file_content: Union[bytes, BinaryIO],
     metadata: Optional[List[Dict[str, str]]] = None,
     max_retries: int = 3
 ) -> Dict[str, Any]:
-    """스토어에 문서 업로드 (재시도 로직 포함)."""
-    import asyncio
-    
+    """스토어에 문서 업로드 (재시도 로직 포함).
+
+    file_content가 파일 객체(UploadFile.file 등)면 전체를 메모리에 올리지 않고
+    청크 단위로 스트리밍 전송한다 (재시도 시 처음부터 다시 읽음).
+    """
+    content_length = _content_length(file_content)
+
     # 업로드 전용 엔드포인트 사용 (BASE_URL이 아닌 upload 경로)
     upload_base_url = "https://generativelanguage.googleapis.com/upload/v1beta"
     start_url = f"{upload_base_url}/{store_name}:uploadToFileSearchStore"
@@ -169,7 +198,7 @@ async def upload_document_to_store(
         "x-goog-api-key": GEMINI_API_KEY,
         "X-Goog-Upload-Protocol": "resumable",
         "X-Goog-Upload-Command": "start",
-        "X-Goog-Upload-Header-Content-Length": str(len(file_content)),
+        "X-Goog-Upload-Header-Content-Length": str(content_length),
         "X-Goog-Upload-Header-Content-Type": "text/plain; charset=utf-8",
         "Content-Type": "application/json",
     }
@@ -210,12 +239,18 @@ async def upload_document_to_store(
                 # 파일 업로드 (타임아웃 5분)
                 upload_headers = {
                     "Content-Type": "text/plain; charset=utf-8",
+                    "Content-Length": str(content_length),
                     "X-Goog-Upload-Command": "upload, finalize",
                     "X-Goog-Upload-Protocol": "resumable",
                     "X-Goog-Upload-Offset": "0",
                 }
                 
-                upload_response = await client.post(upload_url, headers=upload_headers, content=file_content)
+                upload_body = (
+                    file_content
+                    if isinstance(file_content, (bytes, bytearray))
+                    else _iter_file_chunks(file_content)
+                )
+                upload_response = await client.post(upload_url, headers=upload_headers, content=upload_body)
                 upload_response.raise_for_status()
                 
                 result = upload_response.json()
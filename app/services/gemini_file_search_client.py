@@ -4,7 +4,7 @@ import asyncio
 import json
 import logging
 from dataclasses import asdict
-from typing import Any, Dict, List, Optional, AsyncGenerator
+from typing import Any, Dict, List, Optional, AsyncGenerator, Sequence
 
 import httpx
 
@@ -19,6 +19,30 @@ LOGGER = logging.getLogger(__name__)
 
 RETRYABLE_STATUS_CODES = {429, 500, 503}
 
+# 프로세스 공용 커넥션 풀. 클라이언트 인스턴스는 요청마다 생성되는 경우가 많아
+# 인스턴스별 풀 대신 모듈 단위로 공유한다 (API 키는 요청 헤더로 전달).
+_shared_client: Optional[httpx.AsyncClient] = None
+
+
+def _get_shared_client() -> httpx.AsyncClient:
+    """공용 커넥션 풀 클라이언트 반환 (lazy init)"""
+    global _shared_client
+    if _shared_client is None or _shared_client.is_closed:
+        # http2: 동시 요청을 하나의 TLS 연결에 멀티플렉싱 (h2 패키지 필요, httpx[http2])
+        _shared_client = httpx.AsyncClient(
+            http2=True,
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=100),
+        )
+    return _shared_client
+
+
+async def close_shared_client() -> None:
+    """공용 클라이언트 종료 (애플리케이션 shutdown 시 호출)"""
+    global _shared_client
+    if _shared_client and not _shared_client.is_closed:
+        await _shared_client.aclose()
+    _shared_client = None
+
 
 class GeminiFileSearchClient:
     """Gemini File Search REST client with retry & streaming support."""
@@ -50,7 +74,7 @@ class GeminiFileSearchClient:
         *,
         query: str,
         store_names: List[str],
-        metadata_filters: Optional[List[MetadataFilter]] = None,
+        metadata_filters: Optional[Sequence[MetadataFilter]] = None,
         conversation_history: Optional[List[dict]] = None,
         system_instruction: Optional[str] = None,
     ) -> dict[str, Any]:
@@ -83,7 +107,7 @@ class GeminiFileSearchClient:
         *,
         query: str,
         store_names: List[str],
-        metadata_filters: Optional[List[MetadataFilter]] = None,
+        metadata_filters: Optional[Sequence[MetadataFilter]] = None,
         conversation_history: Optional[List[str]] = None,
         system_instruction: Optional[str] = None,
     ) -> AsyncGenerator[Dict[str, Any], None]:
@@ -163,57 +187,7 @@ class GeminiFileSearchClient:
         }
 
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.post(url, headers=headers, json=body)
-        except httpx.TimeoutException as exc:
-            raise GeminiRetryableError("Gemini REST 요청이 타임아웃되었습니다.") from exc
-        except httpx.HTTPError as exc:
-            raise GeminiRetryableError("Gemini REST 요청 중 네트워크 오류가 발생했습니다.") from exc
-
-        if response.status_code >= 400:
-            message = response.text
-            if response.status_code in RETRYABLE_STATUS_CODES:
-                raise GeminiRetryableError(f"Gemini REST error {response.status_code}: {message}")
-            raise GeminiClientError(f"Gemini REST error {response.status_code}: {message}")
-
-        return response.json()
-
-    async def _execute_request(
-        self,
-        model_name: str,
-        contents: List[Dict[str, Any]],
-        metadata_expression: Optional[str],
-        store_names: List[str],
-        system_instruction: Optional[str],
-    ) -> Dict[str, Any]:
-        if not store_names:
-            raise GeminiClientError("At least one file search store name is required")
-
-        url = f"https://generativelanguage.googleapis.com/v1beta/models/{model_name}:generateContent"
-        body: Dict[str, Any] = {
-            "contents": contents,
-            "tools": [
-                {
-                    "fileSearch": {
-                        "fileSearchStoreNames": store_names,
-                    }
-                }
-            ],
-        }
-        if metadata_expression:
-            body["tools"][0]["fileSearch"]["metadataFilter"] = metadata_expression
-
-        if system_instruction:
-            body["system_instruction"] = {"parts": [{"text": system_instruction}]}
-
-        headers = {
-            "Content-Type": "application/json",
-            "x-goog-api-key": self.api_key,
-        }
-
-        try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.post(url, headers=headers, json=body)
+            response = await _get_shared_client().post(url, headers=headers, json=body, timeout=self.timeout)
         except httpx.TimeoutException as exc:
             raise GeminiRetryableError("Gemini REST 요청이 타임아웃되었습니다.") from exc
         except httpx.HTTPError as exc:
@@ -271,7 +245,7 @@ class GeminiFileSearchClient:
         self,
         data: Dict[str, Any],
         store_names: List[str],
-        metadata_filters: Optional[List[MetadataFilter]],
+        metadata_filters: Optional[Sequence[MetadataFilter]],
     ) -> Dict[str, Any]:
         text = self._extract_text(data)
         grounding_chunks = self._extract_grounding_chunks(data)
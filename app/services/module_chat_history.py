@@ -0,0 +1,119 @@
+"""커리큘럼 모듈 AI 멘토 채팅 히스토리 저장소.
+
+- (session_id, module_id)별 최근 대화 턴을 보관
+- redis_url이 설정되면 Redis 리스트에 저장해 여러 워커/인스턴스가 같은 히스토리를 공유
+- 그 외에는 프로세스 로컬 LRU + TTL 캐시 사용
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+from abc import ABC, abstractmethod
+from collections import deque
+from itertools import islice
+from typing import Deque, List, Optional
+
+import redis.asyncio as redis
+
+from app.core.config import get_settings
+from app.utils.cache import TTLCache
+
+logger = logging.getLogger(__name__)
+
+MODULE_CHAT_HISTORY_TURNS = 10
+MODULE_CHAT_HISTORY_TTL_SECONDS = 3600
+MODULE_CHAT_HISTORY_MAXSIZE = 10_000
+
+
+class ModuleChatHistoryStore(ABC):
+    def __init__(self, max_turns: int, ttl_seconds: int) -> None:
+        self.max_turns = max_turns
+        self.ttl_seconds = ttl_seconds
+
+    @abstractmethod
+    async def get_recent(self, session_id: str, module_id: str, limit: int) -> List[dict]:
+        """최근 limit개 턴 반환 (없으면 빈 리스트)."""
+        ...
+
+    @abstractmethod
+    async def append(self, session_id: str, module_id: str, turn: dict) -> None:
+        """턴을 추가하고 max_turns개만 유지."""
+        ...
+
+
+class InMemoryModuleChatHistoryStore(ModuleChatHistoryStore):
+    def __init__(self, max_turns: int, ttl_seconds: int, maxsize: int = MODULE_CHAT_HISTORY_MAXSIZE) -> None:
+        super().__init__(max_turns, ttl_seconds)
+        self._cache: TTLCache[str, Deque[dict]] = TTLCache(maxsize=maxsize, ttl_seconds=ttl_seconds)
+
+    async def get_recent(self, session_id: str, module_id: str, limit: int) -> List[dict]:
+        history = self._cache.get(f"{session_id}:{module_id}")
+        if not history:
+            return []
+        return list(islice(history, max(0, len(history) - limit), None))
+
+    async def append(self, session_id: str, module_id: str, turn: dict) -> None:
+        # maxlen deque라 append만으로 가장 오래된 턴이 O(1)로 밀려난다.
+        # 읽기~쓰기 사이에 await가 없으므로 같은 키로 동시에 끝난 스트림의 턴을 잃지 않는다.
+        key = f"{session_id}:{module_id}"
+        history = self._cache.get(key)
+        if history is None:
+            history = deque(maxlen=self.max_turns)
+        history.append(turn)
+        self._cache.set(key, history)
+
+
+class RedisModuleChatHistoryStore(ModuleChatHistoryStore):
+    def __init__(self, redis_client: redis.Redis, prefix: str, max_turns: int, ttl_seconds: int) -> None:
+        super().__init__(max_turns, ttl_seconds)
+        self.client = redis_client
+        self.prefix = prefix
+
+    def _key(self, session_id: str, module_id: str) -> str:
+        return f"{self.prefix}:{session_id}:{module_id}"
+
+    async def get_recent(self, session_id: str, module_id: str, limit: int) -> List[dict]:
+        # 필요한 꼬리만 LRANGE로 가져온다.
+        raw_turns = await self.client.lrange(self._key(session_id, module_id), -limit, -1)
+        return [json.loads(raw) for raw in raw_turns]
+
+    async def append(self, session_id: str, module_id: str, turn: dict) -> None:
+        key = self._key(session_id, module_id)
+        # RPUSH + LTRIM + EXPIRE를 한 번의 왕복(MULTI)으로 처리해 서버 측에서 길이를 제한
+        async with self.client.pipeline(transaction=True) as pipe:
+            pipe.rpush(key, json.dumps(turn, ensure_ascii=False))
+            pipe.ltrim(key, -self.max_turns, -1)
+            pipe.expire(key, self.ttl_seconds)
+            await pipe.execute()
+
+
+_store_instance: Optional[ModuleChatHistoryStore] = None
+
+
+async def get_module_chat_history_store() -> ModuleChatHistoryStore:
+    global _store_instance
+    if _store_instance:
+        return _store_instance
+
+    settings = get_settings()
+    if settings.redis_url:
+        try:
+            client = redis.from_url(settings.redis_url, decode_responses=True)
+            await client.ping()
+            _store_instance = RedisModuleChatHistoryStore(
+                client,
+                f"{settings.redis_session_prefix}:module-chat",
+                MODULE_CHAT_HISTORY_TURNS,
+                MODULE_CHAT_HISTORY_TTL_SECONDS,
+            )
+        except Exception as exc:  # pragma: no cover
+            logger.warning(
+                "Redis 연결 실패, 인메모리 모듈 채팅 히스토리 사용: %s (redis_url 설정됨)",
+                exc,
+                exc_info=False,
+            )
+            _store_instance = InMemoryModuleChatHistoryStore(MODULE_CHAT_HISTORY_TURNS, MODULE_CHAT_HISTORY_TTL_SECONDS)
+    else:
+        _store_instance = InMemoryModuleChatHistoryStore(MODULE_CHAT_HISTORY_TURNS, MODULE_CHAT_HISTORY_TTL_SECONDS)
+    return _store_instance
@@ -9,6 +9,7 @@ from __future__ import annotations
 import logging
 import os
 import time
+from functools import lru_cache
 from typing import List, Optional
 
 from fastapi import HTTPException, status
@@ -265,6 +266,7 @@ class MultitenantChatHandler:
             }
 
 
+@lru_cache
 def get_multitenant_chat_handler() -> Optional[MultitenantChatHandler]:
     """Factory function to create MultitenantChatHandler."""
     settings = get_settings()
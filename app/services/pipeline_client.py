@@ -23,11 +23,29 @@ class PipelineClient:
         self.base_url = base_url.rstrip('/')
         self.timeout = timeout
 
+        # 커넥션 풀 (요청마다 TCP/TLS 핸드셰이크를 반복하지 않도록 재사용)
+        self._client: Optional[httpx.AsyncClient] = None
+
+    async def _get_client(self) -> httpx.AsyncClient:
+        """커넥션 풀 클라이언트 반환 (lazy init)"""
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                timeout=self.timeout,
+                limits=httpx.Limits(max_connections=500, max_keepalive_connections=200),
+            )
+        return self._client
+
+    async def close(self) -> None:
+        """클라이언트 종료"""
+        if self._client and not self._client.is_closed:
+            await self._client.aclose()
+            self._client = None
+
     async def _request(self, method: str, path: str, json: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         url = f"{self.base_url}{path}"
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.request(method, url, json=json)
+            client = await self._get_client()
+            response = await client.request(method, url, json=json)
         except httpx.RequestError as exc:
             raise PipelineClientError(status.HTTP_502_BAD_GATEWAY, f"Pipeline 서버에 연결할 수 없습니다: {exc}") from exc
 
@@ -69,3 +87,9 @@ def get_pipeline_client() -> PipelineClient:
     if not settings.pipeline_base_url:
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Pipeline base URL이 설정되지 않았습니다")
     return PipelineClient(settings.pipeline_base_url)
+
+
+async def close_pipeline_client() -> None:
+    """싱글턴 클라이언트가 생성된 경우에만 커넥션 풀 종료 (애플리케이션 shutdown 시 호출)"""
+    if get_pipeline_client.cache_info().currsize:
+        await get_pipeline_client().close()
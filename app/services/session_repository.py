@@ -5,18 +5,51 @@ import logging
 from abc import ABC, abstractmethod
 from datetime import datetime, timedelta, timezone
 from dataclasses import asdict
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 import redis.asyncio as redis
 
 from app.core.config import get_settings
 from app.models.analyzer import AnalyzerResult
+from app.models.session import SessionView
 
 logger = logging.getLogger(__name__)
 
 
 SessionRecord = Dict[str, Any]
 
+_SESSION_VIEW_FIELDS = ("conversationHistory", "questionHistory", "clarificationState")
+# Redis 백엔드에서 별도 리스트 키로 저장하는 히스토리 필드 (LRANGE로 꼬리만 조회)
+_HISTORY_FIELDS = ("conversationHistory", "questionHistory")
+# Keep last 10 turns (5 Q&A pairs) to avoid context overflow
+_CONVERSATION_HISTORY_TURNS = 10
+
+# 세션이 있을 때만 히스토리 항목을 추가하고 갱신된 레코드를 반환 (EXISTS~쓰기 사이 경합 방지)
+# KEYS: 필드 해시, 히스토리 리스트들(_HISTORY_FIELDS 순서)
+# ARGV: ttl, 최대 항목 수(0이면 제한 없음), updatedAt JSON, 대상 리스트 KEYS 인덱스, 추가할 항목들
+_APPEND_HISTORY_SCRIPT = """
+if redis.call("EXISTS", KEYS[1]) == 0 then
+    return false
+end
+local target = KEYS[tonumber(ARGV[4])]
+for i = 5, #ARGV do
+    redis.call("RPUSH", target, ARGV[i])
+end
+local max_items = tonumber(ARGV[2])
+if max_items > 0 then
+    redis.call("LTRIM", target, -max_items, -1)
+end
+redis.call("HSET", KEYS[1], "updatedAt", ARGV[3])
+for i = 1, #KEYS do
+    redis.call("EXPIRE", KEYS[i], ARGV[1])
+end
+local result = {redis.call("HGETALL", KEYS[1])}
+for i = 2, #KEYS do
+    table.insert(result, redis.call("LRANGE", KEYS[i], 0, -1))
+end
+return result
+"""
+
 
 class SessionRepository(ABC):
     def __init__(self, ttl_seconds: int) -> None:
@@ -30,10 +63,34 @@ class SessionRepository(ABC):
     async def get(self, session_id: str) -> Optional[SessionRecord]:
         ...
 
+    @abstractmethod
+    async def get_fields(self, session_id: str, fields: Iterable[str]) -> Optional[SessionRecord]:
+        """세션에서 요청한 필드만 조회해 반환 (세션이 없으면 None)."""
+        ...
+
+    async def get_view(self, session_id: str) -> Optional[SessionView]:
+        """chat 경로용 세션 뷰 반환 (세션이 없으면 None)."""
+        record = await self.get_fields(session_id, _SESSION_VIEW_FIELDS)
+        if record is None:
+            return None
+        return SessionView.from_record(record)
+
+    @abstractmethod
+    async def get_recent_history(self, session_id: str, field: str, limit: int) -> Optional[List[Any]]:
+        """history 필드에서 최근 limit개 항목만 반환 (세션이 없으면 None)."""
+        ...
+
     @abstractmethod
     async def append_question(self, session_id: str, question: str) -> Optional[SessionRecord]:
         ...
 
+    async def save_and_append(self, record: SessionRecord, question: str) -> SessionRecord:
+        """신규 세션 저장과 질문 기록을 한 번의 쓰기로 처리 (save + append_question 왕복 절감)."""
+        record = dict(record)
+        record["questionHistory"] = [*record.get("questionHistory", []), question]
+        record["updatedAt"] = datetime.now(timezone.utc).isoformat()
+        return await self.save(record)
+
     @abstractmethod
     async def append_turn(self, session_id: str, question: str, answer: str) -> Optional[SessionRecord]:
         """Append a complete conversation turn (user question + model answer)."""
@@ -83,6 +140,21 @@ class InMemorySessionRepository(SessionRepository):
             self._touch(session_id)
         return record
 
+    async def get_fields(self, session_id: str, fields: Iterable[str]) -> Optional[SessionRecord]:
+        record = await self.get(session_id)
+        if record is None:
+            return None
+        return {field: record[field] for field in fields if field in record}
+
+    async def get_recent_history(self, session_id: str, field: str, limit: int) -> Optional[List[Any]]:
+        record = await self.get(session_id)
+        if record is None:
+            return None
+        history = record.get(field)
+        if not isinstance(history, list):
+            return []
+        return history[-limit:]
+
     async def append_question(self, session_id: str, question: str) -> Optional[SessionRecord]:
         record = await self.get(session_id)
         if not record:
@@ -100,9 +172,8 @@ class InMemorySessionRepository(SessionRepository):
         turns = record.setdefault("conversationHistory", [])
         turns.append({"role": "user", "text": question})
         turns.append({"role": "model", "text": answer})
-        # Keep last 10 turns (5 Q&A pairs) to avoid context overflow
-        if len(turns) > 10:
-            record["conversationHistory"] = turns[-10:]
+        if len(turns) > _CONVERSATION_HISTORY_TURNS:
+            record["conversationHistory"] = turns[-_CONVERSATION_HISTORY_TURNS:]
         record["updatedAt"] = datetime.now(timezone.utc).isoformat()
         await self.save(record)
         return record
@@ -118,13 +189,13 @@ class InMemorySessionRepository(SessionRepository):
             "summaries": result.summaries,
             "confidence": result.confidence,
             "clarificationNeeded": result.clarification_needed,
-            "clarification": asdict(result.clarification) if result.clarification else None,
+            "clarification": result.clarification.to_dict() if result.clarification else None,
         }
         responses.append(snapshot)
         record["knownContext"] = result.known_context
         if result.clarification_needed and result.clarification:
             record["clarificationState"] = {
-                "clarification": asdict(result.clarification),
+                "clarification": result.clarification.to_dict(),
                 "updatedAt": datetime.now(timezone.utc).isoformat(),
             }
         else:
@@ -133,76 +204,217 @@ class InMemorySessionRepository(SessionRepository):
 
 
 class RedisSessionRepository(SessionRepository):
+    """세션을 Redis 해시 + 히스토리 리스트로 저장.
+
+    - `{prefix}:{session_id}:fields`: 히스토리를 제외한 최상위 필드 (필드별 JSON, HMGET으로 부분 조회)
+    - `{prefix}:{session_id}:{history field}`: 히스토리 항목 리스트 (LRANGE로 꼬리만 조회)
+
+    chat 경로는 필요한 필드/꼬리만 읽으므로 긴 히스토리 전체를 역직렬화하지 않는다.
+    세 키는 같은 TTL을 쓰며 조회할 때마다 함께 갱신된다.
+
+    이전 형식(`{prefix}:{session_id}`에 레코드 전체 JSON)으로 저장된 세션은 조회 시
+    새 형식으로 옮기고 이전 키를 삭제한다.
+    """
+
     def __init__(self, redis_client: redis.Redis, prefix: str, ttl_seconds: int) -> None:
         super().__init__(ttl_seconds)
         self.client = redis_client
         self.prefix = prefix
+        self._append_history_script = redis_client.register_script(_APPEND_HISTORY_SCRIPT)
 
     def _key(self, session_id: str) -> str:
+        return f"{self.prefix}:{session_id}:fields"
+
+    def _legacy_key(self, session_id: str) -> str:
         return f"{self.prefix}:{session_id}"
 
+    def _history_key(self, session_id: str, field: str) -> str:
+        return f"{self.prefix}:{session_id}:{field}"
+
+    def _keys(self, session_id: str) -> List[str]:
+        return [self._key(session_id), *(self._history_key(session_id, field) for field in _HISTORY_FIELDS)]
+
+    def _touch(self, pipe: Any, session_id: str) -> None:
+        for key in self._keys(session_id):
+            pipe.expire(key, self.ttl_seconds)
+
+    def _queue_read(self, pipe: Any, session_id: str) -> None:
+        pipe.hgetall(self._key(session_id))
+        for field in _HISTORY_FIELDS:
+            pipe.lrange(self._history_key(session_id, field), 0, -1)
+
+    @staticmethod
+    def _build_record(fields: Dict[str, str], histories: List[List[str]]) -> Optional[SessionRecord]:
+        if not fields:
+            return None
+        record: SessionRecord = {field: json.loads(raw) for field, raw in fields.items()}
+        for field, items in zip(_HISTORY_FIELDS, histories):
+            record[field] = [json.loads(item) for item in items]
+        return record
+
+    def _queue_save(self, pipe: Any, record: SessionRecord) -> None:
+        session_id = record["sessionId"]
+        fields = {field: json.dumps(value) for field, value in record.items() if field not in _HISTORY_FIELDS}
+        pipe.delete(self._legacy_key(session_id), *self._keys(session_id))
+        pipe.hset(self._key(session_id), mapping=fields)
+        for field in _HISTORY_FIELDS:
+            items = record.get(field)
+            if isinstance(items, list) and items:
+                pipe.rpush(self._history_key(session_id, field), *(json.dumps(item) for item in items))
+        self._touch(pipe, session_id)
+
     async def save(self, record: SessionRecord) -> SessionRecord:
         record = self.normalize(record)
-        key = self._key(record["sessionId"])
-        await self.client.setex(key, self.ttl_seconds, json.dumps(record))
+        # 기존 키를 지우고 다시 쓰는 전체 교체를 MULTI 한 번으로 처리
+        async with self.client.pipeline(transaction=True) as pipe:
+            self._queue_save(pipe, record)
+            await pipe.execute()
         return record
 
+    async def _migrate_legacy(self, session_id: str) -> bool:
+        """이전 형식 세션이 있으면 새 형식으로 옮기고 True 반환.
+
+        이전 키를 WATCH하므로 동시에 옮기는 다른 요청과 겹치면 한쪽만 쓰고,
+        다른 쪽은 이미 옮겨진 것으로 보고 새 형식을 다시 읽는다.
+        """
+        legacy_key = self._legacy_key(session_id)
+        async with self.client.pipeline(transaction=True) as pipe:
+            try:
+                await pipe.watch(legacy_key)
+                raw = await pipe.get(legacy_key)
+                if not raw:
+                    return False
+                pipe.multi()
+                self._queue_save(pipe, self.normalize(json.loads(raw)))
+                await pipe.execute()
+            except redis.WatchError:
+                pass
+        return True
+
     async def get(self, session_id: str) -> Optional[SessionRecord]:
-        raw = await self.client.get(self._key(session_id))
-        if not raw:
-            return None
-        record = json.loads(raw)
-        # touch TTL
-        await self.client.expire(self._key(session_id), self.ttl_seconds)
+        record = await self._read(session_id)
+        if record is None and await self._migrate_legacy(session_id):
+            return await self._read(session_id)
         return record
 
-    async def append_question(self, session_id: str, question: str) -> Optional[SessionRecord]:
-        record = await self.get(session_id)
-        if not record:
-            return None
-        history = record.setdefault("questionHistory", [])
-        history.append(question)
-        record["updatedAt"] = datetime.now(timezone.utc).isoformat()
-        await self.save(record)
+    async def _read(self, session_id: str) -> Optional[SessionRecord]:
+        # 조회와 TTL 갱신(touch)을 한 번의 왕복으로 처리
+        async with self.client.pipeline(transaction=True) as pipe:
+            self._queue_read(pipe, session_id)
+            self._touch(pipe, session_id)
+            fields, *histories = (await pipe.execute())[: 1 + len(_HISTORY_FIELDS)]
+        return self._build_record(fields, histories)
+
+    async def get_fields(self, session_id: str, fields: Iterable[str]) -> Optional[SessionRecord]:
+        fields = tuple(fields)
+        record = await self._read_fields(session_id, fields)
+        if record is None and await self._migrate_legacy(session_id):
+            return await self._read_fields(session_id, fields)
         return record
 
-    async def append_turn(self, session_id: str, question: str, answer: str) -> Optional[SessionRecord]:
-        record = await self.get(session_id)
-        if not record:
+    async def _read_fields(self, session_id: str, fields: Tuple[str, ...]) -> Optional[SessionRecord]:
+        # 일반 필드는 HMGET, 히스토리는 LRANGE로 요청한 필드만 읽는다.
+        hash_fields = [field for field in fields if field not in _HISTORY_FIELDS]
+        history_fields = [field for field in fields if field in _HISTORY_FIELDS]
+        async with self.client.pipeline(transaction=True) as pipe:
+            pipe.exists(self._key(session_id))
+            if hash_fields:
+                pipe.hmget(self._key(session_id), hash_fields)
+            for field in history_fields:
+                pipe.lrange(self._history_key(session_id, field), 0, -1)
+            self._touch(pipe, session_id)
+            exists, *results = await pipe.execute()
+        if not exists:
             return None
-        turns = record.setdefault("conversationHistory", [])
-        turns.append({"role": "user", "text": question})
-        turns.append({"role": "model", "text": answer})
-        # Keep last 10 turns (5 Q&A pairs) to avoid context overflow
-        if len(turns) > 10:
-            record["conversationHistory"] = turns[-10:]
-        record["updatedAt"] = datetime.now(timezone.utc).isoformat()
-        await self.save(record)
+        record: SessionRecord = {}
+        if hash_fields:
+            values = results.pop(0)
+            record.update({field: json.loads(raw) for field, raw in zip(hash_fields, values) if raw is not None})
+        for field, items in zip(history_fields, results):
+            record[field] = [json.loads(item) for item in items]
         return record
 
+    async def get_recent_history(self, session_id: str, field: str, limit: int) -> Optional[List[Any]]:
+        if field not in _HISTORY_FIELDS:
+            record = await self.get_fields(session_id, (field,))
+            if record is None:
+                return None
+            history = record.get(field)
+            return history[-limit:] if isinstance(history, list) else []
+        history = await self._read_history_tail(session_id, field, limit)
+        if history is None and await self._migrate_legacy(session_id):
+            return await self._read_history_tail(session_id, field, limit)
+        return history
+
+    async def _read_history_tail(self, session_id: str, field: str, limit: int) -> Optional[List[Any]]:
+        # 필요한 꼬리만 LRANGE로 가져온다.
+        async with self.client.pipeline(transaction=True) as pipe:
+            pipe.exists(self._key(session_id))
+            pipe.lrange(self._history_key(session_id, field), -limit, -1)
+            self._touch(pipe, session_id)
+            exists, items = (await pipe.execute())[:2]
+        if not exists:
+            return None
+        return [json.loads(item) for item in items]
+
+    async def _append_history(
+        self, session_id: str, field: str, items: List[Any], max_items: Optional[int] = None
+    ) -> Optional[SessionRecord]:
+        keys = self._keys(session_id)
+        args = [
+            self.ttl_seconds,
+            max_items or 0,
+            json.dumps(datetime.now(timezone.utc).isoformat()),
+            keys.index(self._history_key(session_id, field)) + 1,
+            *(json.dumps(item) for item in items),
+        ]
+        # 세션 존재 확인, RPUSH(+LTRIM), 갱신된 레코드 조회를 스크립트 한 번(한 번의 왕복)으로 처리
+        result = await self._append_history_script(keys=keys, args=args)
+        if result is None and await self._migrate_legacy(session_id):
+            result = await self._append_history_script(keys=keys, args=args)
+        if result is None:
+            return None
+        flat_fields, *histories = result
+        return self._build_record(dict(zip(flat_fields[::2], flat_fields[1::2])), histories)
+
+    async def append_question(self, session_id: str, question: str) -> Optional[SessionRecord]:
+        return await self._append_history(session_id, "questionHistory", [question])
+
+    async def append_turn(self, session_id: str, question: str, answer: str) -> Optional[SessionRecord]:
+        turns = [{"role": "user", "text": question}, {"role": "model", "text": answer}]
+        return await self._append_history(
+            session_id, "conversationHistory", turns, max_items=_CONVERSATION_HISTORY_TURNS
+        )
+
     async def record_analyzer_result(self, session_id: str, result: AnalyzerResult) -> None:
-        record = await self.get(session_id)
-        if not record:
+        record = await self.get_fields(session_id, ("analyzerResponses",))
+        if record is None:
             return
-        responses = record.setdefault("analyzerResponses", [])
+        responses = record.get("analyzerResponses") or []
         snapshot = {
             "timestamp": datetime.now(timezone.utc).isoformat(),
             "filters": [asdict(filter_) for filter_ in result.filters],
             "summaries": result.summaries,
             "confidence": result.confidence,
             "clarificationNeeded": result.clarification_needed,
-            "clarification": asdict(result.clarification) if result.clarification else None,
+            "clarification": result.clarification.to_dict() if result.clarification else None,
         }
         responses.append(snapshot)
-        record["knownContext"] = result.known_context
-        if result.clarification_needed and result.clarification:
-            record["clarificationState"] = {
-                "clarification": asdict(result.clarification),
-                "updatedAt": datetime.now(timezone.utc).isoformat(),
-            }
-        else:
-            record.pop("clarificationState", None)
-        await self.save(record)
+        now = datetime.now(timezone.utc).isoformat()
+        updates: Dict[str, Any] = {
+            "analyzerResponses": responses,
+            "knownContext": result.known_context,
+            "updatedAt": now,
+        }
+        # 히스토리는 건드리지 않고 해시 필드만 갱신
+        async with self.client.pipeline(transaction=True) as pipe:
+            if result.clarification_needed and result.clarification:
+                updates["clarificationState"] = {"clarification": result.clarification.to_dict(), "updatedAt": now}
+            else:
+                pipe.hdel(self._key(session_id), "clarificationState")
+            pipe.hset(self._key(session_id), mapping={field: json.dumps(value) for field, value in updates.items()})
+            self._touch(pipe, session_id)
+            await pipe.execute()
 
 
 _repo_instance: Optional[SessionRepository] = None
@@ -1,7 +1,6 @@
 from __future__ import annotations
 
 import asyncio
-from dataclasses import asdict
 from typing import List, Optional, Tuple
 
 from functools import lru_cache
@@ -32,15 +31,18 @@ class TicketChatHandler:
         self.gemini_client = gemini_client
         self.analyzer = analyzer
         self.ticket_store_names = ticket_store_names
+        # 요청 source와 비교할 티켓 store 이름
+        self._ticket_store_set = frozenset(ticket_store_names)
         self.search_service = search_service
 
     def can_handle(self, request: ChatRequest) -> bool:
         if not self.ticket_store_names or not self.analyzer.llm_client:
             return False
-        sources = request.sources or []
+        # 요청 sources가 모두 티켓 store일 때만 처리
+        sources = request.sources
         if not sources:
             return False
-        return all(source in self.ticket_store_names for source in sources)
+        return all(source in self._ticket_store_set for source in sources)
 
     async def handle(
         self,
@@ -88,7 +90,7 @@ class TicketChatHandler:
             "filters": analyzer_result.summaries,
             "filterConfidence": analyzer_result.confidence,
             "clarificationNeeded": analyzer_result.clarification_needed,
-            "clarification": asdict(analyzer_result.clarification) if analyzer_result.clarification else None,
+            "clarification": analyzer_result.clarification.to_dict() if analyzer_result.clarification else None,
             "freshdeskTickets": freshdesk_tickets,
             "freshdeskSearchPlan": search_plan,
         }
@@ -0,0 +1,61 @@
+"""프로세스 로컬 LRU + TTL 캐시."""
+
+from __future__ import annotations
+
+import time
+from collections import OrderedDict
+from typing import Callable, Generic, Hashable, Optional, Tuple, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class TTLCache(Generic[K, V]):
+    """OrderedDict 기반 LRU 캐시에 항목별 만료 시간을 더한 캐시.
+
+    - 조회 시 만료된 항목은 제거하고, 살아있는 항목은 가장 최근 위치로 이동
+    - maxsize 초과 시 가장 오래 사용되지 않은 항목부터 제거 (O(1))
+    - asyncio 단일 이벤트 루프에서 사용하는 것을 전제로 하며 별도 락은 두지 않음
+    """
+
+    def __init__(
+        self,
+        maxsize: int,
+        ttl_seconds: float,
+        *,
+        timer: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if maxsize <= 0:
+            raise ValueError("maxsize must be positive")
+        self.maxsize = maxsize
+        self.ttl_seconds = ttl_seconds
+        self._timer = timer
+        self._data: "OrderedDict[K, Tuple[float, V]]" = OrderedDict()
+
+    def get(self, key: K, default: Optional[V] = None) -> Optional[V]:
+        entry = self._data.get(key)
+        if entry is None:
+            return default
+        expires_at, value = entry
+        if expires_at <= self._timer():
+            del self._data[key]
+            return default
+        self._data.move_to_end(key)
+        return value
+
+    def set(self, key: K, value: V) -> None:
+        self._data[key] = (self._timer() + self.ttl_seconds, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            # last=False: 가장 오래 사용되지 않은(LRU) 항목 제거
+            self._data.popitem(last=False)
+
+    def pop(self, key: K, default: Optional[V] = None) -> Optional[V]:
+        entry = self._data.pop(key, None)
+        return default if entry is None else entry[1]
+
+    def clear(self) -> None:
+        self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
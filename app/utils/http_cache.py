@@ -0,0 +1,52 @@
+"""ETag/If-None-Match 기반 HTTP 조건부 응답 유틸리티."""
+
+from __future__ import annotations
+
+import hashlib
+from typing import Mapping, Optional
+
+from fastapi import Request
+from fastapi.responses import Response
+
+
+def make_etag(payload: bytes, *, weak: bool = False) -> str:
+    """페이로드 해시로 ETag 값을 만든다.
+
+    - 응답 본문이 바이트 단위로 같지 않아도(timestamp 등) 의미상 같으면 weak=True
+    """
+    tag = f'"{hashlib.md5(payload, usedforsecurity=False).hexdigest()}"'
+    return f"W/{tag}" if weak else tag
+
+
+def _opaque_tag(tag: str) -> str:
+    tag = tag.strip()
+    return tag[2:] if tag.startswith("W/") else tag
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """If-None-Match 헤더가 etag와 일치하는지 확인 (RFC 9110 약한 비교: W/ 접두사 무시)."""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    target = _opaque_tag(etag)
+    return any(_opaque_tag(tag) == target for tag in if_none_match.split(","))
+
+
+def conditional_json_response(
+    request: Request,
+    body: bytes,
+    *,
+    cache_control: str,
+    etag: Optional[str] = None,
+    headers: Optional[Mapping[str, str]] = None,
+) -> Response:
+    """ETag/Cache-Control을 붙인 JSON 응답 (If-None-Match가 일치하면 304).
+
+    - etag를 생략하면 body 해시로 계산
+    """
+    etag = etag or make_etag(body)
+    response_headers = {"ETag": etag, "Cache-Control": cache_control, **(headers or {})}
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers=response_headers)
+    return Response(body, media_type="application/json", headers=response_headers)
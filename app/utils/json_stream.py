@@ -0,0 +1,50 @@
+"""스트리밍 LLM 출력에서 JSON 배열 항목을 점진적으로 파싱하는 유틸리티."""
+
+from __future__ import annotations
+
+import json
+from typing import Any, AsyncIterable, AsyncIterator
+
+_SKIP_CHARS = " \t\r\n,"
+
+
+async def iter_json_array_items(chunks: AsyncIterable[str]) -> AsyncIterator[Any]:
+    """텍스트 청크 스트림에서 최상위 JSON 배열의 항목을 완성되는 대로 yield.
+
+    - 첫 `[` 이전의 텍스트(```json 코드 펜스 등)는 무시
+    - 항목이 아직 덜 도착했으면 다음 청크를 기다렸다가 다시 디코딩
+    - 닫는 `]`를 만나면 종료하며, 스트림이 중간에 끊겨도 이미 완성된 항목은 전달됨
+    """
+    decoder = json.JSONDecoder()
+    buffer = ""
+    pos = 0
+    in_array = False
+
+    async for chunk in chunks:
+        buffer += chunk
+        while True:
+            if not in_array:
+                start = buffer.find("[", pos)
+                if start < 0:
+                    pos = len(buffer)
+                    break
+                pos = start + 1
+                in_array = True
+
+            while pos < len(buffer) and buffer[pos] in _SKIP_CHARS:
+                pos += 1
+            if pos >= len(buffer):
+                break
+            if buffer[pos] == "]":
+                return
+
+            try:
+                item, pos = decoder.raw_decode(buffer, pos)
+            except json.JSONDecodeError:
+                # 항목이 아직 완성되지 않음 → 다음 청크 대기
+                break
+            yield item
+
+        # 소비한 앞부분은 버려 버퍼가 전체 응답 크기로 커지지 않도록 함
+        buffer = buffer[pos:]
+        pos = 0
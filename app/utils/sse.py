@@ -0,0 +1,161 @@
+"""SSE(Server-Sent Events) 프레임 직렬화 유틸리티."""
+
+from __future__ import annotations
+
+import asyncio
+import sys
+from functools import partial
+from typing import Any, AsyncIterable, AsyncIterator, Awaitable, Callable, Dict, Mapping, Optional, Union
+
+import anyio
+import orjson
+from starlette.background import BackgroundTask
+from starlette.requests import ClientDisconnect
+from starlette.responses import Response
+from starlette.types import Receive, Scope, Send
+
+if sys.version_info < (3, 11):  # pragma: no cover
+    from exceptiongroup import BaseExceptionGroup
+
+SSE_PING_INTERVAL_SECONDS = 15.0
+SSE_KEEPALIVE = b": ping\n\n"
+# no-transform: 프록시/CDN이 압축 등으로 본문을 변형(버퍼링)하지 않도록 함
+SSE_HEADERS = {"Cache-Control": "no-cache, no-transform", "X-Accel-Buffering": "no"}
+
+_SSE_EVENT_PREFIX = b"event: "
+_SSE_DATA_SEP = b"\ndata: "
+_SSE_DATA_PREFIX = b"data: "
+_SSE_END = b"\n\n"
+_SSE_EVENT_NAMES = {name: name.encode() for name in ("status", "result", "error", "chunk")}
+
+
+def format_sse(event: Optional[str], data: Dict[str, Any]) -> bytes:
+    """event/data를 SSE 프레임 bytes로 변환 (event가 없으면 data만 있는 프레임).
+
+    json.dumps와 같이 비문자열 키도 허용한다.
+    """
+    data_bytes = orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
+    if event is None:
+        return b"".join((_SSE_DATA_PREFIX, data_bytes, _SSE_END))
+    event_bytes = _SSE_EVENT_NAMES.get(event) or event.encode()
+    return b"".join((_SSE_EVENT_PREFIX, event_bytes, _SSE_DATA_SEP, data_bytes, _SSE_END))
+
+
+async def encode_sse_events(events: AsyncIterator[Dict[str, Any]]) -> AsyncIterator[bytes]:
+    """{"event", "data"} 형태의 유스케이스 이벤트를 SSE 프레임 bytes로 변환."""
+    async for event in events:
+        yield format_sse(event["event"], event["data"])
+
+
+async def _yield_each(content: AsyncIterable[Union[str, bytes]]) -> AsyncIterator[Union[str, bytes]]:
+    """프레임마다 이벤트 루프에 제어를 넘겨 전송 버퍼가 즉시 비워지도록 한다.
+
+    업스트림이 같은 IO 콜백에서 여러 프레임을 연달아 내면 소켓 쓰기가 몰려서
+    한꺼번에 전송되므로, 각 프레임 뒤에 sleep(0)으로 writer에 차례를 준다.
+    스트림이 중간에 끝나면(연결 끊김 등) 업스트림 생성기도 함께 닫는다.
+    """
+    iterator = content.__aiter__()
+    try:
+        async for frame in iterator:
+            yield frame
+            await asyncio.sleep(0)
+    finally:
+        aclose = getattr(iterator, "aclose", None)
+        if aclose is not None:
+            # 취소된 스트림에서도 업스트림 정리(finally/cancel scope 종료)가 끝까지 실행되도록 보호
+            with anyio.CancelScope(shield=True):
+                await aclose()
+
+
+def _collapse_excgroup(exc: BaseException) -> BaseException:
+    """태스크 그룹의 단일 예외 그룹을 원래 예외로 푼다 (StreamingResponse와 같은 전파 형태)."""
+    while isinstance(exc, BaseExceptionGroup) and len(exc.exceptions) == 1:
+        exc = exc.exceptions[0]
+    return exc
+
+
+class EventSourceResponse(Response):
+    """SSE 전용 스트리밍 응답.
+
+    - 프록시(nginx 등) 버퍼링을 막는 헤더를 기본으로 설정
+    - ping_interval 동안 이벤트가 없으면 keep-alive 코멘트(`: ping`)를 전송
+    - 프레임마다 이벤트 루프에 양보해 청크가 몰려서 전송되지 않도록 함
+    - 클라이언트 연결이 끊기면 즉시 생성기를 취소해 업스트림(Gemini) 호출을 중단
+
+    본문 전송, keep-alive, 연결 끊김 감지는 태스크 그룹 하나에서 돈다. 본문 생성기는
+    전송 태스크에서만 진행되므로 yield 사이에 cancel scope나 contextvar를 유지해도 안전하다.
+    """
+
+    media_type = "text/event-stream"
+
+    def __init__(
+        self,
+        content: AsyncIterable[Union[str, bytes]],
+        *,
+        ping_interval: Optional[float] = SSE_PING_INTERVAL_SECONDS,
+        status_code: int = 200,
+        headers: Optional[Mapping[str, str]] = None,
+        background: Optional[BackgroundTask] = None,
+    ) -> None:
+        self.body_iterator = _yield_each(content)
+        self.status_code = status_code
+        self.background = background
+        self.ping_interval = ping_interval
+        self.init_headers({**SSE_HEADERS, **(headers or {})})
+
+    async def _send_body(self, send: Send, body: bytes, more_body: bool = True) -> None:
+        async with self._send_lock:
+            await send({"type": "http.response.body", "body": body, "more_body": more_body})
+            self._last_sent_at = anyio.current_time()
+
+    async def _stream(self, send: Send) -> None:
+        async for chunk in self.body_iterator:
+            if not isinstance(chunk, (bytes, memoryview)):
+                chunk = chunk.encode(self.charset)
+            await self._send_body(send, chunk)
+        await self._send_body(send, b"", more_body=False)
+
+    async def _send_keepalive(self, send: Send) -> None:
+        """마지막 전송 후 ping_interval 동안 조용하면 keep-alive 코멘트를 보낸다."""
+        while True:
+            idle_for = anyio.current_time() - self._last_sent_at
+            if idle_for < self.ping_interval:
+                await anyio.sleep(self.ping_interval - idle_for)
+                continue
+            await self._send_body(send, SSE_KEEPALIVE)
+
+    @staticmethod
+    async def _wait_for_disconnect(receive: Receive) -> None:
+        while True:
+            message = await receive()
+            if message["type"] == "http.disconnect":
+                return
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        self._send_lock = anyio.Lock()
+        try:
+            await send({"type": "http.response.start", "status": self.status_code, "headers": self.raw_headers})
+            self._last_sent_at = anyio.current_time()
+            # 본문 전송이 끝나거나 클라이언트가 끊기면(ASGI 스펙 버전과 무관) 그룹 전체를 취소해
+            # 업스트림 호출까지 즉시 중단한다.
+            async with anyio.create_task_group() as task_group:
+
+                async def run_until_done(func: Callable[[], Awaitable[None]]) -> None:
+                    await func()
+                    task_group.cancel_scope.cancel()
+
+                task_group.start_soon(run_until_done, partial(self._stream, send))
+                if self.ping_interval:
+                    task_group.start_soon(self._send_keepalive, send)
+                await run_until_done(partial(self._wait_for_disconnect, receive))
+        except BaseException as exc:
+            # 단일 예외 그룹은 원래 예외로 풀고, 전송 실패(OSError)는 연결 끊김으로 알린다.
+            collapsed = _collapse_excgroup(exc)
+            if isinstance(collapsed, OSError):
+                raise ClientDisconnect() from collapsed
+            if collapsed is exc:
+                raise
+            raise collapsed
+
+        if self.background is not None:
+            await self.background()
@@ -0,0 +1,24 @@
+-- Migration: Cache AI-generated quiz questions by content hash
+-- Date: 2026-10-16
+-- Description: Reuse Gemini quiz generation results for identical (module, content, model) inputs
+
+-- ============================================
+-- Quiz Generation Cache Table
+-- ============================================
+
+CREATE TABLE IF NOT EXISTS onboarding.quiz_generation_cache (
+    -- sha256(module_id + model + reference content)
+    content_hash VARCHAR(64) PRIMARY KEY,
+    module_id UUID NOT NULL REFERENCES onboarding.curriculum_modules(id) ON DELETE CASCADE,
+    model VARCHAR(100) NOT NULL,
+
+    -- Parsed Gemini output (array of question objects incl. correct_choice_id)
+    questions JSONB NOT NULL,
+
+    created_at TIMESTAMPTZ DEFAULT NOW()
+);
+
+CREATE INDEX IF NOT EXISTS idx_quiz_generation_cache_module
+    ON onboarding.quiz_generation_cache(module_id);
+
+GRANT ALL ON TABLE onboarding.quiz_generation_cache TO service_role;
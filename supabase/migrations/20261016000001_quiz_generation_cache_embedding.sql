@@ -0,0 +1,51 @@
+-- Migration: Semantic lookup for quiz generation cache
+-- Date: 2026-10-16
+-- Description: Reuse generated quizzes across modules whose reference content is near-identical
+--              (e.g. tenant copies of the same product docs) via pgvector cosine similarity
+
+-- ============================================
+-- Embedding column + HNSW index
+-- ============================================
+
+ALTER TABLE onboarding.quiz_generation_cache
+    ADD COLUMN IF NOT EXISTS embedding vector(768);
+
+CREATE INDEX IF NOT EXISTS idx_quiz_generation_cache_embedding
+    ON onboarding.quiz_generation_cache
+    USING hnsw (embedding vector_cosine_ops);
+
+-- ============================================
+-- Nearest cached quiz above similarity threshold
+-- ============================================
+
+CREATE OR REPLACE FUNCTION onboarding.match_quiz_generation_cache(
+    query_embedding vector(768),
+    match_threshold float DEFAULT 0.95,
+    model_filter text DEFAULT NULL
+)
+RETURNS TABLE (
+    content_hash varchar,
+    questions jsonb,
+    similarity float
+)
+LANGUAGE plpgsql
+AS $$
+BEGIN
+  RETURN QUERY
+  SELECT
+    c.content_hash,
+    c.questions,
+    1 - (c.embedding <=> query_embedding) AS similarity
+  FROM onboarding.quiz_generation_cache c
+  WHERE
+    c.embedding IS NOT NULL
+    AND (model_filter IS NULL OR c.model = model_filter)
+    AND 1 - (c.embedding <=> query_embedding) >= match_threshold
+  ORDER BY c.embedding <=> query_embedding
+  LIMIT 1;
+END;
+$$;
+
+COMMENT ON FUNCTION onboarding.match_quiz_generation_cache IS 'Semantic lookup for cached AI-generated quizzes';
+
+GRANT EXECUTE ON FUNCTION onboarding.match_quiz_generation_cache TO service_role;
@@ -0,0 +1,7 @@
+-- Migration: Composite index for recent quiz attempts per session/module
+-- Date: 2026-10-16
+-- Description: Serve "latest attempts for (session, module)" lookups with an index scan
+--              instead of sorting the whole quiz_attempts table by created_at
+
+CREATE INDEX IF NOT EXISTS idx_quiz_attempts_session_module_created
+    ON onboarding.quiz_attempts(session_id, module_id, created_at DESC);
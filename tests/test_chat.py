@@ -1,4 +1,6 @@
+import pytest
 from fastapi.testclient import TestClient
+from pydantic import ValidationError
 
 from app.main import app
 from app.models.analyzer import AnalyzerClarification, AnalyzerResult
@@ -148,3 +150,93 @@ def test_ticket_handler_path(test_client: TestClient, override_pipeline_client):
     assert response.json()["text"] == "ticket response"
 
     app.dependency_overrides.pop(get_ticket_chat_handler, None)
+
+
+def test_chat_ignores_slow_analyzer(test_client: TestClient, override_pipeline_client, monkeypatch):
+    import asyncio
+
+    from app.services import chat_usecase as chat_usecase_module
+
+    session_id = test_client.post("/api/session").json()["sessionId"]
+    override_pipeline_client.sessions[session_id] = {
+        "sessionId": session_id,
+        "createdAt": "2025-01-01T00:00:00Z",
+        "updatedAt": "2025-01-01T00:00:00Z",
+        "questionHistory": [],
+    }
+
+    class SlowAnalyzer:
+        async def analyze(self, query, **kwargs):  # pragma: no cover - simple stub
+            await asyncio.sleep(1)
+
+    monkeypatch.setattr(chat_usecase_module, "_ANALYZER_TIMEOUT_SECONDS", 0.01)
+    app.dependency_overrides[get_query_filter_analyzer] = lambda: SlowAnalyzer()
+    try:
+        response = test_client.post("/api/chat", json={"sessionId": session_id, "query": "질문", "sources": ["store-a"]})
+        assert response.status_code == 200
+        assert response.json()["text"] == "stub response"
+        assert response.json().get("clarificationNeeded") is None
+    finally:
+        app.dependency_overrides.pop(get_query_filter_analyzer, None)
+
+
+def test_chat_creates_session_with_first_question(test_client: TestClient, override_pipeline_client):
+    session_id = "s-new-chat"
+    override_pipeline_client.sessions[session_id] = {
+        "sessionId": session_id,
+        "createdAt": "2025-01-01T00:00:00Z",
+        "updatedAt": "2025-01-01T00:00:00Z",
+        "questionHistory": [],
+    }
+
+    response = test_client.post("/api/chat", json={"sessionId": session_id, "query": "첫 질문", "sources": ["store-a"]})
+    assert response.status_code == 200
+
+    detail = test_client.get(f"/api/session/{session_id}").json()
+    assert detail["questionHistory"] == ["첫 질문"]
+
+
+def test_chat_validates_pipeline_response(test_client: TestClient, override_pipeline_client, monkeypatch):
+    session_id = test_client.post("/api/session").json()["sessionId"]
+    override_pipeline_client.sessions[session_id] = {
+        "sessionId": session_id,
+        "createdAt": "2025-01-01T00:00:00Z",
+        "updatedAt": "2025-01-01T00:00:00Z",
+        "questionHistory": [],
+    }
+    monkeypatch.setattr(override_pipeline_client, "chat", lambda payload: {"text": "ok", "filters": "not-a-list"})
+
+    with pytest.raises(ValidationError):
+        test_client.post("/api/chat", json={"sessionId": session_id, "query": "질문", "sources": ["store-a"]})
+
+
+def test_chat_keeps_new_session_when_pipeline_fails(test_client: TestClient):
+    session_id = "s-pipeline-error"
+
+    # DummyPipelineClient는 모르는 세션에 404 PipelineClientError를 낸다.
+    response = test_client.post("/api/chat", json={"sessionId": session_id, "query": "질문", "sources": ["store-a"]})
+    assert response.status_code == 404
+
+    detail = test_client.get(f"/api/session/{session_id}")
+    assert detail.status_code == 200
+    assert detail.json()["questionHistory"] == []
+
+
+def test_chat_keeps_new_session_when_common_handler_fails(test_client: TestClient):
+    session_id = "s-common-error"
+
+    class FailingHandler:
+        def can_handle(self, _request):  # pragma: no cover - simple stub
+            return True
+
+        def handle(self, request, history=None):  # pragma: no cover - simple stub
+            raise RuntimeError("handler failed")
+
+    app.dependency_overrides[get_common_chat_handler] = lambda: FailingHandler()
+    try:
+        with pytest.raises(RuntimeError):
+            test_client.post("/api/chat", json={"sessionId": session_id, "query": "질문", "sources": ["store-common"]})
+    finally:
+        app.dependency_overrides.pop(get_common_chat_handler, None)
+
+    assert test_client.get(f"/api/session/{session_id}").status_code == 200
@@ -26,7 +26,7 @@ def test_legacy_chat_stream_routes_through_multitenant_handler_when_tenant_heade
         assert res.status_code == 200
         assert "text/event-stream" in res.headers.get("content-type", "")
         assert "event: result" in res.text
-        assert '"text": "ok"' in res.text
+        assert '"text":"ok"' in res.text
     finally:
         app.dependency_overrides.pop(get_multitenant_chat_handler, None)
 
@@ -56,7 +56,7 @@ def test_multitenant_chat_stream_uses_multitenant_handler(test_client: TestClien
         assert res.status_code == 200
         assert "text/event-stream" in res.headers.get("content-type", "")
         assert "event: result" in res.text
-        assert '"text": "ok"' in res.text
+        assert '"text":"ok"' in res.text
     finally:
         app.dependency_overrides.pop(get_multitenant_chat_handler, None)
 
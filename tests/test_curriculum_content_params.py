@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+from uuid import uuid4
+
+from app.api.routes import curriculum as curriculum_routes
+
+
+def test_section_content_rejects_unknown_section_type_and_level(test_client, monkeypatch):
+    class _DummyRepo:
+        async def get_section_content(self, *_args):
+            raise AssertionError("잘못된 파라미터는 라우트 진입 전에 422로 거절되어야 합니다.")
+
+    monkeypatch.setattr(curriculum_routes, "get_curriculum_repository", lambda: _DummyRepo(), raising=True)
+
+    module_id = uuid4()
+    response = test_client.get(f"/api/curriculum/modules/{module_id}/contents/unknown")
+    assert response.status_code == 422
+
+    response = test_client.get(
+        f"/api/curriculum/modules/{module_id}/contents/overview",
+        params={"level": "expert"},
+    )
+    assert response.status_code == 422
+
+
+def test_section_content_sets_etag_and_honours_if_none_match(test_client, monkeypatch):
+    from app.models.curriculum import ModuleContent
+
+    module_id = uuid4()
+    content = ModuleContent(
+        id=uuid4(),
+        moduleId=module_id,
+        sectionType="overview",
+        level="basic",
+        titleKo="개요",
+        contentMd="# 개요",
+    )
+
+    class _DummyRepo:
+        async def get_section_content(self, *_args):
+            return content
+
+    monkeypatch.setattr(curriculum_routes, "get_curriculum_repository", lambda: _DummyRepo(), raising=True)
+
+    url = f"/api/curriculum/modules/{module_id}/contents/overview"
+    response = test_client.get(url)
+    assert response.status_code == 200
+    assert response.json()["titleKo"] == "개요"
+    assert response.headers["cache-control"].startswith("public, max-age=60")
+    etag = response.headers["etag"]
+
+    revalidated = test_client.get(url, headers={"If-None-Match": etag})
+    assert revalidated.status_code == 304
+    assert revalidated.headers["etag"] == etag
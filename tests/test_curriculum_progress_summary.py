@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+from app.api.routes import curriculum as curriculum_routes
+
+
+def test_progress_summary_counts_only_skips_module_hydration(test_client, monkeypatch):
+    class _DummyRepo:
+        async def get_modules_with_progress(self, **_kwargs):
+            raise AssertionError("includeModules=false에서는 모듈 목록을 조회하지 않아야 합니다.")
+
+        async def get_progress_counts(self, session_id: str, product: str):
+            assert (session_id, product) == ("s-1", "freshdesk")
+            return 4, {"completed": 1, "learning": 2}
+
+    monkeypatch.setattr(curriculum_routes, "get_curriculum_repository", lambda: _DummyRepo(), raising=True)
+
+    response = test_client.get(
+        "/api/curriculum/progress",
+        params={"sessionId": "s-1", "product": "freshdesk", "includeModules": "false"},
+    )
+    assert response.status_code == 200
+    payload = response.json()
+    assert payload["totalModules"] == 4
+    assert payload["completedModules"] == 1
+    assert payload["inProgressModules"] == 2
+    assert payload["completionRate"] == 50.0
+    assert payload["modules"] is None
+
+
+def test_module_progress_defaults_when_no_progress(test_client, monkeypatch):
+    class _DummyRepo:
+        async def get_progress(self, session_id, module_id):
+            return None
+
+    monkeypatch.setattr(curriculum_routes, "get_curriculum_repository", lambda: _DummyRepo(), raising=True)
+
+    module_id = "00000000-0000-0000-0000-000000000001"
+    response = test_client.get(f"/api/curriculum/modules/{module_id}/progress", params={"sessionId": "s-1"})
+    assert response.status_code == 200
+    assert response.json() == {
+        "id": None,
+        "sessionId": "s-1",
+        "moduleId": module_id,
+        "status": "not_started",
+        "learningStartedAt": None,
+        "learningCompletedAt": None,
+        "quizScore": None,
+        "quizAttempts": 0,
+        "totalTimeSeconds": 0,
+        "completedAt": None,
+    }
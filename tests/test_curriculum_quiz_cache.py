@@ -0,0 +1,284 @@
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+from uuid import UUID
+
+from app.api.routes import curriculum as curriculum_routes
+
+MODULE_ID = UUID("33333333-3333-3333-3333-333333333333")
+MODULE_CONTENT = "티켓 상태와 우선순위 설명. " * 40
+ITEMS = [
+    {
+        "question": "티켓 우선순위 중 가장 높은 것은?",
+        "choices": [{"id": "a", "text": "Low"}, {"id": "b", "text": "Urgent"}],
+        "correct_choice_id": "b",
+        "explanation": "Urgent가 가장 높습니다.",
+    }
+]
+
+
+class _DummySettings:
+    gemini_primary_model = "gemini-test"
+
+
+class _DummyRepo:
+    def __init__(self, cached=None, similar=None):
+        self.cached = cached
+        self.similar = similar
+        self.saved: list[tuple[Any, ...]] = []
+        self.created: list[dict] = []
+
+    async def get_cached_quiz(self, content_hash: str):
+        return self.cached
+
+    async def match_cached_quiz(self, embedding, model, threshold):
+        return self.similar
+
+    async def save_cached_quiz(self, content_hash, module_id, model, questions, embedding=None):
+        self.saved.append((content_hash, module_id, model, questions, embedding))
+
+    async def create_questions(self, questions):
+        self.created.extend(questions)
+
+
+def _patch(monkeypatch, repo, generate, embedding=None):
+    async def _embed(*_args):
+        return embedding
+
+    monkeypatch.setattr(curriculum_routes, "get_curriculum_repository", lambda: repo, raising=True)
+    monkeypatch.setattr(curriculum_routes, "_get_settings", lambda: _DummySettings(), raising=True)
+    monkeypatch.setattr(curriculum_routes, "_generate_quiz_items_with_gemini", generate, raising=True)
+    monkeypatch.setattr(curriculum_routes, "_embed_quiz_context", _embed, raising=True)
+
+
+async def _generate_and_persist():
+    return await curriculum_routes._generate_quiz_questions(MODULE_ID, "티켓 기본", "", MODULE_CONTENT)
+
+
+def test_generate_quiz_questions_uses_cached_items_without_gemini(monkeypatch):
+    repo = _DummyRepo(cached=ITEMS)
+
+    async def _fail(*_args):
+        raise AssertionError("캐시 히트 시 Gemini를 호출하지 않아야 합니다.")
+
+    _patch(monkeypatch, repo, _fail)
+
+    questions = asyncio.run(_generate_and_persist())
+    assert [q.question for q in questions] == [ITEMS[0]["question"]]
+    assert repo.created[0]["correct_choice_id"] == "b"
+    assert repo.saved == []
+
+
+def test_generate_quiz_questions_stores_generated_items_on_miss(monkeypatch):
+    repo = _DummyRepo()
+    calls = []
+
+    async def _generate(*args):
+        calls.append(args)
+        return ITEMS
+
+    _patch(monkeypatch, repo, _generate, embedding=[0.1, 0.2])
+
+    questions = asyncio.run(_generate_and_persist())
+    assert len(questions) == 1
+    assert len(calls) == 1
+    content_hash, module_id, model, saved_items, embedding = repo.saved[0]
+    assert content_hash == curriculum_routes._quiz_content_hash(MODULE_ID, "gemini-test", MODULE_CONTENT)
+    assert (module_id, model, saved_items, embedding) == (MODULE_ID, "gemini-test", ITEMS, [0.1, 0.2])
+
+
+def test_generate_quiz_questions_reuses_semantically_similar_items(monkeypatch):
+    repo = _DummyRepo(similar=ITEMS)
+
+    async def _fail(*_args):
+        raise AssertionError("유사 콘텐츠 캐시 히트 시 Gemini를 호출하지 않아야 합니다.")
+
+    _patch(monkeypatch, repo, _fail, embedding=[0.1, 0.2])
+
+    questions = asyncio.run(_generate_and_persist())
+    assert len(questions) == 1
+    assert repo.created[0]["module_id"] == str(MODULE_ID)
+    assert repo.saved == []
+
+
+def test_generate_quiz_questions_cosine_hit_embeds_concurrently_with_exact_lookup(monkeypatch):
+    events = []
+
+    class _SemanticRepo(_DummyRepo):
+        async def get_cached_quiz(self, content_hash: str):
+            events.append("exact:start")
+            await asyncio.sleep(0.01)
+            events.append("exact:miss")
+            return None
+
+        async def match_cached_quiz(self, embedding, model, threshold):
+            events.append(("match", tuple(embedding), model, threshold))
+            return ITEMS
+
+    async def _embed(*_args):
+        events.append("embed:start")
+        return [0.3, 0.4]
+
+    async def _fail(*_args):
+        raise AssertionError("유사 콘텐츠 캐시 히트 시 Gemini를 호출하지 않아야 합니다.")
+
+    repo = _SemanticRepo()
+    _patch(monkeypatch, repo, _fail)
+    monkeypatch.setattr(curriculum_routes, "_embed_quiz_context", _embed, raising=True)
+
+    questions = asyncio.run(_generate_and_persist())
+    assert [q.question for q in questions] == [ITEMS[0]["question"]]
+    # 임베딩은 해시 조회가 끝나기 전에 시작된다
+    assert events.index("embed:start") < events.index("exact:miss")
+    assert events[-1] == ("match", (0.3, 0.4), "gemini-test", curriculum_routes.QUIZ_SEMANTIC_CACHE_THRESHOLD)
+    assert repo.saved == []
+    assert repo.created[0]["module_id"] == str(MODULE_ID)
+
+
+def test_generate_quiz_questions_exact_hit_cancels_embedding(monkeypatch):
+    cancelled = []
+
+    async def _embed(*_args):
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.append(True)
+            raise
+
+    async def _fail(*_args):
+        raise AssertionError("캐시 히트 시 Gemini를 호출하지 않아야 합니다.")
+
+    class _SlowLookupRepo(_DummyRepo):
+        async def get_cached_quiz(self, content_hash: str):
+            await asyncio.sleep(0.01)
+            return ITEMS
+
+    repo = _SlowLookupRepo()
+    _patch(monkeypatch, repo, _fail)
+    monkeypatch.setattr(curriculum_routes, "_embed_quiz_context", _embed, raising=True)
+
+    async def run():
+        questions = await _generate_and_persist()
+        await asyncio.sleep(0)
+        return questions
+
+    assert len(asyncio.run(asyncio.wait_for(run(), timeout=1))) == 1
+    assert cancelled == [True]
+
+
+def test_embed_quiz_context_reuses_embedding_for_same_text(monkeypatch):
+    calls = []
+
+    class _EmbedClient:
+        def embed_text(self, text, *, model, output_dimensionality):
+            calls.append(text)
+            return [0.5] * 3
+
+    class _EmbedSettings(_DummySettings):
+        gemini_embedding_model = "embedding-test"
+
+    monkeypatch.setattr(curriculum_routes, "get_gemini_client", lambda: _EmbedClient(), raising=True)
+    monkeypatch.setattr(curriculum_routes, "_get_settings", lambda: _EmbedSettings(), raising=True)
+    monkeypatch.setattr(
+        curriculum_routes,
+        "_quiz_embedding_cache",
+        curriculum_routes.TTLCache(maxsize=8, ttl_seconds=60),
+        raising=True,
+    )
+
+    async def run():
+        first = await curriculum_routes._embed_quiz_context("티켓 기본", "", MODULE_CONTENT)
+        second = await curriculum_routes._embed_quiz_context("티켓 기본", "", MODULE_CONTENT)
+        return first, second
+
+    first, second = asyncio.run(run())
+    assert first == second == [0.5] * 3
+    assert len(calls) == 1
+
+
+def test_generated_questions_are_saved_before_they_are_returned(monkeypatch):
+    class _EmptyDbRepo(_DummyRepo):
+        async def get_questions(self, *, module_id: UUID, active_only: bool = True):  # noqa: ARG002
+            return []
+
+    async def _fail(*_args):
+        raise AssertionError("캐시 히트 시 Gemini를 호출하지 않아야 합니다.")
+
+    async def _generate_module_quiz(_repo, module_id):
+        return await curriculum_routes._generate_quiz_questions(module_id, "티켓 기본", "", MODULE_CONTENT)
+
+    repo = _EmptyDbRepo(cached=ITEMS)
+    _patch(monkeypatch, repo, _fail)
+    monkeypatch.setattr(curriculum_routes, "_generate_module_quiz", _generate_module_quiz, raising=True)
+
+    questions = asyncio.run(curriculum_routes.get_questions(MODULE_ID))
+    # 반환 시점에 이미 DB에 있어 바로 채점(submit)할 수 있다
+    assert [q["id"] for q in repo.created] == [str(q.id) for q in questions]
+
+
+def test_generated_questions_are_dropped_when_save_keeps_failing(monkeypatch):
+    attempts = []
+
+    class _FailingSaveRepo(_DummyRepo):
+        async def create_questions(self, questions):
+            attempts.append(len(questions))
+            raise RuntimeError("db unavailable")
+
+    async def _fail(*_args):
+        raise AssertionError("캐시 히트 시 Gemini를 호출하지 않아야 합니다.")
+
+    repo = _FailingSaveRepo(cached=ITEMS)
+    _patch(monkeypatch, repo, _fail)
+    monkeypatch.setattr(curriculum_routes, "QUIZ_PERSIST_RETRY_DELAYS", (0.0, 0.0), raising=True)
+
+    # 채점할 수 없는 문항 ID를 내려주지 않는다
+    assert asyncio.run(_generate_and_persist()) == []
+    assert attempts == [1, 1, 1]
+
+
+def test_generated_questions_survive_a_transient_save_failure(monkeypatch):
+    class _FlakySaveRepo(_DummyRepo):
+        failures = 1
+
+        async def create_questions(self, questions):
+            if self.failures:
+                self.failures -= 1
+                raise RuntimeError("db unavailable")
+            await super().create_questions(questions)
+
+    async def _fail(*_args):
+        raise AssertionError("캐시 히트 시 Gemini를 호출하지 않아야 합니다.")
+
+    repo = _FlakySaveRepo(cached=ITEMS)
+    _patch(monkeypatch, repo, _fail)
+    monkeypatch.setattr(curriculum_routes, "QUIZ_PERSIST_RETRY_DELAYS", (0.0,), raising=True)
+
+    questions = asyncio.run(_generate_and_persist())
+    assert [q["id"] for q in repo.created] == [str(q.id) for q in questions]
+
+
+def test_question_stream_reports_generation_status_before_result(test_client, monkeypatch):
+    class _EmptyRepo:
+        async def get_questions(self, *, module_id: UUID, active_only: bool = True):  # noqa: ARG002
+            return []
+
+    async def _generate_module_quiz(_repo, module_id):
+        return [
+            curriculum_routes.QuizQuestion(
+                id=UUID("44444444-4444-4444-4444-444444444444"),
+                moduleId=module_id,
+                question="티켓 우선순위 중 가장 높은 것은?",
+                choices=[{"id": "b", "text": "Urgent"}],
+            )
+        ]
+
+    monkeypatch.setattr(curriculum_routes, "get_curriculum_repository", lambda: _EmptyRepo(), raising=True)
+    monkeypatch.setattr(curriculum_routes, "_generate_module_quiz", _generate_module_quiz, raising=True)
+
+    response = test_client.get(f"/api/curriculum/modules/{MODULE_ID}/questions/stream")
+    assert response.status_code == 200
+    status_at = response.text.index("event: status")
+    result_at = response.text.index("event: result")
+    assert status_at < result_at
+    assert f'"moduleId":"{MODULE_ID}"' in response.text[result_at:]
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 from dataclasses import dataclass
 from typing import Any, Optional
 from uuid import UUID
@@ -82,3 +83,92 @@ def test_quiz_rag_supplement_applies_product_metadata_filters(test_client, monke
 
     module_content = captured.get("module_content", "")
     assert "RAG Retrieved Content" in module_content
+
+
+def test_quiz_generation_uses_contents_even_if_module_lookup_fails(test_client, monkeypatch):
+    module_id = UUID("11111111-1111-1111-1111-111111111111")
+    captured: dict[str, Any] = {}
+
+    @dataclass
+    class _Section:
+        title_ko: str
+        content_md: str
+
+    class _DummyRepo:
+        async def get_questions(self, *, module_id: UUID, active_only: bool = True):  # noqa: ARG002
+            return []
+
+        async def get_module_by_id(self, _module_id: UUID):
+            raise RuntimeError("module lookup failed")
+
+        async def get_module_contents(self, _module_id: UUID):
+            return _DummyContents(sections={"basic": [_Section(title_ko="개요", content_md="본문 " * 200)]})
+
+    async def _stub_generate_quiz_questions(
+        _module_id: UUID, _module_name: str, _module_desc: str = "", _module_content: str = ""
+    ):
+        captured["module_name"] = _module_name
+        captured["module_content"] = _module_content
+        return []
+
+    monkeypatch.setattr(curriculum_routes, "get_curriculum_repository", lambda: _DummyRepo(), raising=True)
+    monkeypatch.setattr(curriculum_routes, "_generate_quiz_questions", _stub_generate_quiz_questions, raising=True)
+
+    response = test_client.get(f"/api/curriculum/modules/{module_id}/questions")
+    assert response.status_code == 200
+    assert captured["module_name"] == "Onboarding Knowledge"
+    assert "--- Section: 개요 ---" in captured["module_content"]
+
+
+def test_quiz_context_stops_copying_sections_at_budget(monkeypatch):
+    module_id = UUID("11111111-1111-1111-1111-111111111111")
+    captured: dict[str, Any] = {}
+
+    @dataclass
+    class _Section:
+        title_ko: str
+        content_md: str
+
+    class _DummyRepo:
+        async def get_module_by_id(self, _module_id: UUID):
+            return None
+
+        async def get_module_contents(self, _module_id: UUID):
+            sections = [_Section(title_ko=f"섹션 {i}", content_md="가" * 4000) for i in range(10)]
+            return _DummyContents(sections={"basic": sections})
+
+    async def _stub_generate_quiz_questions(_module_id, _module_name, _module_desc="", _module_content=""):
+        captured["module_content"] = _module_content
+        return []
+
+    monkeypatch.setattr(curriculum_routes, "_generate_quiz_questions", _stub_generate_quiz_questions, raising=True)
+
+    asyncio.run(curriculum_routes._generate_module_quiz(_DummyRepo(), module_id))
+
+    module_content = captured["module_content"]
+    assert len(module_content) == curriculum_routes.QUIZ_CONTEXT_MAX_CHARS
+    assert module_content.startswith("--- Section: 섹션 0 ---\n")
+    assert "\n\n--- Section: 섹션 1 ---\n" in module_content
+    assert "섹션 4" not in module_content
+
+
+def test_quiz_generation_skipped_when_content_stays_insufficient(monkeypatch):
+    module_id = UUID("11111111-1111-1111-1111-111111111111")
+
+    class _DummyRepo:
+        async def get_module_by_id(self, _module_id: UUID):
+            return None
+
+        async def get_module_contents(self, _module_id: UUID):
+            return _DummyContents(sections={})
+
+    class _DummySettings:
+        gemini_store_common = None
+
+    async def _fail(*_args, **_kwargs):
+        raise AssertionError("콘텐츠가 부족하면 퀴즈 생성을 호출하지 않아야 합니다.")
+
+    monkeypatch.setattr(curriculum_routes, "_get_settings", lambda: _DummySettings(), raising=True)
+    monkeypatch.setattr(curriculum_routes, "_generate_quiz_questions", _fail, raising=True)
+
+    assert asyncio.run(curriculum_routes._generate_module_quiz(_DummyRepo(), module_id)) == []
@@ -0,0 +1,155 @@
+import asyncio
+from uuid import UUID
+
+from app.services.curriculum_repository import CurriculumRepository
+
+MODULE_ID = UUID("22222222-2222-2222-2222-222222222222")
+
+
+class _FakeResponse:
+    def __init__(self, data):
+        self.data = data
+
+
+class _FakeQuery:
+    def __init__(self, client):
+        self._client = client
+
+    def select(self, *_args, **_kwargs):
+        return self
+
+    def eq(self, *_args, **_kwargs):
+        return self
+
+    def limit(self, *_args, **_kwargs):
+        return self
+
+    def execute(self):
+        self._client.calls += 1
+        return _FakeResponse(
+            [
+                {
+                    "id": str(MODULE_ID),
+                    "target_product_id": "freshdesk",
+                    "name_ko": "티켓 기초",
+                    "slug": "ticket-basics",
+                }
+            ]
+        )
+
+
+class _FakeClient:
+    def __init__(self):
+        self.calls = 0
+
+    def table(self, *_args, **_kwargs):
+        return _FakeQuery(self)
+
+
+def test_get_module_by_id_serves_repeat_lookups_from_cache():
+    client = _FakeClient()
+    repo = CurriculumRepository(client)
+
+    first = asyncio.run(repo.get_module_by_id(MODULE_ID))
+    second = asyncio.run(repo.get_module_by_id(MODULE_ID))
+    assert first is second
+    assert client.calls == 1
+
+    repo.invalidate_module_cache(MODULE_ID)
+    asyncio.run(repo.get_module_by_id(MODULE_ID))
+    assert client.calls == 2
+
+
+class _FakeContentsClient:
+    def __init__(self):
+        self.calls = 0
+
+    def table(self, name, *_args, **_kwargs):
+        client = self
+        rows = {
+            "curriculum_modules": [{"id": str(MODULE_ID), "name_ko": "티켓 기초"}],
+            "module_contents": [
+                {
+                    "id": "33333333-3333-3333-3333-333333333333",
+                    "module_id": str(MODULE_ID),
+                    "section_type": "overview",
+                    "level": "basic",
+                    "title_ko": "개요",
+                    "content_md": "# 개요",
+                    "display_order": 1,
+                }
+            ],
+        }[name]
+
+        class _Query(_FakeQuery):
+            def order(self, *_args, **_kwargs):
+                return self
+
+            def execute(self):
+                client.calls += 1
+                return _FakeResponse(rows)
+
+        return _Query(client)
+
+
+def test_get_module_contents_serves_repeat_lookups_from_cache():
+    client = _FakeContentsClient()
+    repo = CurriculumRepository(client)
+
+    first = asyncio.run(repo.get_module_contents(MODULE_ID, "basic"))
+    second = asyncio.run(repo.get_module_contents(MODULE_ID, "basic"))
+    assert first is second
+    assert first.levels == ["basic"]
+    assert client.calls == 2  # 모듈 + 콘텐츠 조회 한 번씩
+
+    repo.invalidate_content_cache()
+    asyncio.run(repo.get_module_contents(MODULE_ID, "basic"))
+    assert client.calls == 4
+
+
+class _FakeQuestionsClient:
+    def __init__(self):
+        self.calls = 0
+        self.rows = []
+
+    def table(self, *_args, **_kwargs):
+        client = self
+
+        class _Query(_FakeQuery):
+            def order(self, *_args, **_kwargs):
+                return self
+
+            def insert(self, rows):
+                client.rows = list(rows)
+                return self
+
+            def execute(self):
+                client.calls += 1
+                return _FakeResponse(client.rows)
+
+        return _Query(client)
+
+
+def test_get_questions_caches_non_empty_results_until_new_questions_are_saved():
+    client = _FakeQuestionsClient()
+    repo = CurriculumRepository(client)
+
+    # 빈 결과는 캐시하지 않아 생성 후 바로 조회 가능
+    assert asyncio.run(repo.get_questions(MODULE_ID)) == []
+    asyncio.run(
+        repo.create_questions(
+            [
+                {
+                    "id": "44444444-4444-4444-4444-444444444444",
+                    "module_id": str(MODULE_ID),
+                    "question": "가장 높은 우선순위는?",
+                    "choices": [{"id": "b", "text": "Urgent"}],
+                }
+            ]
+        )
+    )
+    first = asyncio.run(repo.get_questions(MODULE_ID))
+    second = asyncio.run(repo.get_questions(MODULE_ID))
+    assert [q.question for q in first] == ["가장 높은 우선순위는?"]
+    assert first is second
+    assert client.calls == 3  # 빈 조회 + insert + 조회 한 번
@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Optional
+from uuid import UUID
+
+from app.api.routes import curriculum as curriculum_routes
+
+
+@dataclass
+class _DummyModule:
+    name_ko: str
+    description: str
+    target_product_id: str
+    kb_category_slug: Optional[str]
+
+
+def test_section_stream_reports_missing_content_without_result(test_client, monkeypatch):
+    module_id = UUID("22222222-2222-2222-2222-222222222222")
+
+    class _DummyRepo:
+        async def get_module_by_id(self, _module_id: UUID):
+            return _DummyModule(
+                name_ko="티켓 기본",
+                description="티켓 처리 흐름",
+                target_product_id="freshdesk",
+                kb_category_slug=None,
+            )
+
+    class _DummySearchClient:
+        async def stream_search(self, **_kwargs):
+            # result 없이 상태 이벤트만 보내고 끝나는 업스트림
+            yield {"event": "status", "data": {"message": "검색 중"}}
+
+    class _DummySettings:
+        gemini_store_common = "store-common"
+
+    monkeypatch.setattr(curriculum_routes, "get_curriculum_repository", lambda: _DummyRepo(), raising=True)
+    monkeypatch.setattr(curriculum_routes, "_get_file_search_client", lambda: _DummySearchClient(), raising=True)
+    monkeypatch.setattr(curriculum_routes, "_get_settings", lambda: _DummySettings(), raising=True)
+
+    response = test_client.get(
+        f"/api/curriculum/modules/{module_id}/section/stream",
+        params={"sessionId": "s-1", "sectionId": "overview", "sectionPrompt": "개요"},
+    )
+    assert response.status_code == 200
+    assert "해당 섹션 콘텐츠를 생성하지 못했습니다" in response.text
+    assert "is not defined" not in response.text
+
+
+def test_section_stream_serves_repeat_request_from_cache(test_client, monkeypatch):
+    module_id = UUID("33333333-3333-3333-3333-333333333333")
+    calls = []
+
+    class _DummyRepo:
+        async def get_module_by_id(self, _module_id: UUID):
+            return _DummyModule(
+                name_ko="자산 관리",
+                description="자산 등록 흐름",
+                target_product_id="freshservice",
+                kb_category_slug="assets",
+            )
+
+    class _DummySearchClient:
+        async def stream_search(self, **kwargs):
+            calls.append(kwargs["query"])
+            yield {"event": "result", "data": {"text": f"응답 {len(calls)}"}}
+
+    class _DummySettings:
+        gemini_store_common = "store-common"
+
+    monkeypatch.setattr(curriculum_routes, "get_curriculum_repository", lambda: _DummyRepo(), raising=True)
+    monkeypatch.setattr(curriculum_routes, "_get_file_search_client", lambda: _DummySearchClient(), raising=True)
+    monkeypatch.setattr(curriculum_routes, "_get_settings", lambda: _DummySettings(), raising=True)
+    monkeypatch.setattr(
+        curriculum_routes,
+        "_rag_response_cache",
+        curriculum_routes.TTLCache(maxsize=8, ttl_seconds=60),
+        raising=True,
+    )
+
+    url = f"/api/curriculum/modules/{module_id}/section/stream"
+    params = {"sessionId": "s-1", "sectionId": "overview", "sectionPrompt": "개요"}
+
+    first = test_client.get(url, params=params)
+    second = test_client.get(url, params={**params, "sectionPrompt": "  개요 "})
+    bypassed = test_client.get(url, params={**params, "nocache": "true"})
+
+    assert "응답 1" in first.text
+    assert "응답 1" in second.text
+    assert "응답 2" in bypassed.text
+    assert len(calls) == 2
@@ -0,0 +1,20 @@
+from app.utils.http_cache import etag_matches, make_etag
+
+
+def test_etag_matches_handles_lists_wildcard_and_weak_prefix():
+    etag = make_etag(b"payload")
+
+    assert etag_matches(etag, etag)
+    assert etag_matches(f'"other", {etag}', etag)
+    assert etag_matches("*", etag)
+    assert etag_matches(f"W/{etag}", etag)
+    assert not etag_matches(None, etag)
+    assert not etag_matches('"other"', etag)
+
+
+def test_weak_etag_matches_strong_and_weak_if_none_match():
+    etag = make_etag(b"payload", weak=True)
+
+    assert etag.startswith('W/"')
+    assert etag_matches(etag, etag)
+    assert etag_matches(etag[2:], etag)
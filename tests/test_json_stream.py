@@ -0,0 +1,29 @@
+import asyncio
+
+from app.utils.json_stream import iter_json_array_items
+
+
+async def _chunks(*parts):
+    for part in parts:
+        yield part
+
+
+def _collect(*parts):
+    async def run():
+        return [item async for item in iter_json_array_items(_chunks(*parts))]
+
+    return asyncio.run(run())
+
+
+def test_iter_json_array_items_parses_items_split_across_chunks():
+    items = _collect('```json\n[{"question": "첫', ' 번째", "choices": [1, 2]},', ' {"question": "두 번째"}]\n```')
+    assert items == [{"question": "첫 번째", "choices": [1, 2]}, {"question": "두 번째"}]
+
+
+def test_iter_json_array_items_keeps_completed_items_when_stream_is_truncated():
+    items = _collect('[{"question": "a"}, {"question": "b"}, {"question": "c', '"')
+    assert items == [{"question": "a"}, {"question": "b"}]
+
+
+def test_iter_json_array_items_yields_nothing_without_array():
+    assert _collect("참조 콘텐츠가 부족합니다.") == []
@@ -0,0 +1,21 @@
+import asyncio
+
+from app.services.module_chat_history import InMemoryModuleChatHistoryStore
+
+
+def test_in_memory_history_keeps_only_recent_turns():
+    store = InMemoryModuleChatHistoryStore(max_turns=3, ttl_seconds=60)
+
+    async def scenario():
+        for i in range(5):
+            await store.append("s-1", "m-1", {"user": f"q{i}", "model": f"a{i}"})
+        return (
+            await store.get_recent("s-1", "m-1", 2),
+            await store.get_recent("s-1", "m-1", 10),
+            await store.get_recent("s-1", "m-2", 2),
+        )
+
+    recent, all_kept, other_module = asyncio.run(scenario())
+    assert [turn["user"] for turn in recent] == ["q3", "q4"]
+    assert [turn["user"] for turn in all_kept] == ["q2", "q3", "q4"]
+    assert other_module == []
@@ -17,6 +17,17 @@ def test_status_endpoint(test_client: TestClient):
     settings.gemini_common_store_name = original_store
 
 
+def test_status_endpoint_revalidates_with_etag(test_client: TestClient):
+    first = test_client.get("/api/status")
+    etag = first.headers["etag"]
+    assert etag.startswith('W/"')
+    assert "X-Tenant-ID" in first.headers["vary"]
+
+    revalidated = test_client.get("/api/status", headers={"If-None-Match": etag})
+    assert revalidated.status_code == 304
+    assert revalidated.headers["etag"] == etag
+
+
 def test_sync_endpoint(test_client: TestClient):
     payload = {
         "includeTickets": True,
@@ -0,0 +1,108 @@
+import asyncio
+import json
+
+import pytest
+
+from app.models.analyzer import AnalyzerResult
+from app.services.session_repository import RedisSessionRepository
+
+fakeredis = pytest.importorskip("fakeredis")
+pytest.importorskip("lupa")
+
+PREFIX = "test-session"
+
+
+def _repo():
+    client = fakeredis.FakeAsyncRedis(decode_responses=True)
+    return client, RedisSessionRepository(client, PREFIX, ttl_seconds=60)
+
+
+def test_redis_session_reads_fields_and_history_tail():
+    async def scenario():
+        client, repo = _repo()
+        await repo.save({"sessionId": "s1", "questionHistory": ["q0"], "knownContext": {"a": 1}})
+        for i in range(7):
+            await repo.append_turn("s1", f"q{i}", f"a{i}")
+        record = await repo.append_question("s1", "q1")
+
+        assert record["questionHistory"] == ["q0", "q1"]
+        assert len(record["conversationHistory"]) == 10
+        assert await repo.get_recent_history("s1", "conversationHistory", 2) == [
+            {"role": "user", "text": "q6"},
+            {"role": "model", "text": "a6"},
+        ]
+        assert await repo.get_fields("s1", ("questionHistory", "knownContext", "clarificationState")) == {
+            "questionHistory": ["q0", "q1"],
+            "knownContext": {"a": 1},
+        }
+        assert 0 < await client.ttl(f"{PREFIX}:s1:conversationHistory") <= 60
+
+    asyncio.run(scenario())
+
+
+def test_redis_session_append_does_not_create_missing_session():
+    async def scenario():
+        client, repo = _repo()
+        assert await repo.append_question("missing", "q") is None
+        assert await repo.append_turn("missing", "q", "a") is None
+        assert await client.keys("*") == []
+        assert await repo.get("missing") is None
+        assert await repo.get_recent_history("missing", "questionHistory", 4) is None
+
+    asyncio.run(scenario())
+
+
+def test_redis_session_migrates_legacy_json_record():
+    async def scenario():
+        client, repo = _repo()
+        legacy = {
+            "sessionId": "s-legacy",
+            "createdAt": "2025-01-01T00:00:00+00:00",
+            "updatedAt": "2025-01-01T00:00:00+00:00",
+            "questionHistory": ["q1", "q2"],
+            "conversationHistory": [{"role": "user", "text": "q1"}, {"role": "model", "text": "a1"}],
+            "knownContext": {"product": "x"},
+        }
+        await client.setex(f"{PREFIX}:s-legacy", 60, json.dumps(legacy))
+
+        assert await repo.get_recent_history("s-legacy", "questionHistory", 1) == ["q2"]
+        assert await client.exists(f"{PREFIX}:s-legacy") == 0
+        assert await repo.get("s-legacy") == legacy
+
+    asyncio.run(scenario())
+
+
+def test_redis_session_append_migrates_legacy_record_first():
+    async def scenario():
+        client, repo = _repo()
+        legacy = {"sessionId": "s-old", "questionHistory": ["q1"]}
+        await client.setex(f"{PREFIX}:s-old", 60, json.dumps(legacy))
+
+        record = await repo.append_question("s-old", "q2")
+        assert record["questionHistory"] == ["q1", "q2"]
+        assert await client.exists(f"{PREFIX}:s-old") == 0
+
+    asyncio.run(scenario())
+
+
+def test_redis_session_analyzer_result_keeps_history():
+    async def scenario():
+        _client, repo = _repo()
+        await repo.save({"sessionId": "s2", "questionHistory": ["q1"]})
+        result = AnalyzerResult(
+            filters=[],
+            summaries=["x"],
+            success=True,
+            confidence="high",
+            clarification_needed=False,
+            clarification=None,
+            known_context={"b": 2},
+        )
+        await repo.record_analyzer_result("s2", result)
+
+        record = await repo.get("s2")
+        assert record["knownContext"] == {"b": 2}
+        assert len(record["analyzerResponses"]) == 1
+        assert record["questionHistory"] == ["q1"]
+
+    asyncio.run(scenario())
@@ -18,3 +18,47 @@ def test_get_session(test_client: TestClient):
     payload = response.json()
     assert payload["sessionId"] == session_id
     assert payload["questionHistory"] == []
+
+
+def test_get_fields_returns_only_requested_fields(override_session_repository):
+    import asyncio
+
+    repo = override_session_repository
+    asyncio.run(repo.save({"sessionId": "s-fields", "questionHistory": ["q1"], "knownContext": {"a": 1}}))
+
+    fields = asyncio.run(repo.get_fields("s-fields", ("questionHistory", "clarificationState")))
+    assert fields == {"questionHistory": ["q1"]}
+    assert asyncio.run(repo.get_fields("missing", ("questionHistory",))) is None
+
+
+def test_get_recent_history_returns_tail_only(override_session_repository):
+    import asyncio
+
+    repo = override_session_repository
+    asyncio.run(repo.save({"sessionId": "s-tail", "questionHistory": ["q1", "q2", "q3"]}))
+
+    assert asyncio.run(repo.get_recent_history("s-tail", "questionHistory", 2)) == ["q2", "q3"]
+    assert asyncio.run(repo.get_recent_history("s-tail", "conversationHistory", 2)) == []
+    assert asyncio.run(repo.get_recent_history("missing", "questionHistory", 2)) is None
+
+
+def test_get_view_normalizes_chat_fields(override_session_repository):
+    import asyncio
+
+    repo = override_session_repository
+    asyncio.run(
+        repo.save(
+            {
+                "sessionId": "s-view",
+                "questionHistory": ["q1", 3, "q2"],
+                "conversationHistory": [{"role": "user", "text": "q1"}, "broken"],
+                "clarificationState": "invalid",
+            }
+        )
+    )
+
+    view = asyncio.run(repo.get_view("s-view"))
+    assert view.question_history == ["q1", "q2"]
+    assert view.conversation_history == [{"role": "user", "text": "q1"}]
+    assert view.clarification_state is None
+    assert asyncio.run(repo.get_view("missing")) is None
@@ -0,0 +1,140 @@
+import asyncio
+
+import anyio
+import pytest
+from starlette.requests import ClientDisconnect
+
+from app.utils.sse import SSE_KEEPALIVE, EventSourceResponse, encode_sse_events, format_sse
+
+
+def test_format_sse_frames_event_and_json_payload():
+    frame = format_sse("result", {"text": "안녕"})
+    assert frame == 'event: result\ndata: {"text":"안녕"}\n\n'.encode()
+
+
+def test_format_sse_without_event_frames_data_only_payload_with_non_str_keys():
+    frame = format_sse(None, {"type": "result", 1: "안녕"})
+    assert frame == 'data: {"type":"result","1":"안녕"}\n\n'.encode()
+
+
+def test_encode_sse_events_yields_frames():
+    async def events():
+        yield {"event": "status", "data": {"step": 1}}
+        yield {"event": "result", "data": {"text": "ok"}}
+
+    async def collect():
+        return [frame async for frame in encode_sse_events(events())]
+
+    assert asyncio.run(collect()) == [format_sse("status", {"step": 1}), format_sse("result", {"text": "ok"})]
+
+
+def test_event_source_response_sets_no_buffering_headers():
+    async def events():
+        yield format_sse("result", {"text": "ok"})
+
+    response = EventSourceResponse(events())
+    assert response.media_type == "text/event-stream"
+    assert response.headers["cache-control"] == "no-cache, no-transform"
+    assert response.headers["x-accel-buffering"] == "no"
+
+
+async def _run_response(response):
+    sent = []
+    disconnected = asyncio.Event()
+
+    async def receive():
+        await disconnected.wait()
+        return {"type": "http.disconnect"}
+
+    async def send(message):
+        sent.append(message)
+
+    scope = {"type": "http", "asgi": {"spec_version": "2.4"}}
+    try:
+        await asyncio.wait_for(response(scope, receive, send), timeout=1)
+    finally:
+        disconnected.set()
+    return [message["body"] for message in sent if message["type"] == "http.response.body"]
+
+
+def test_event_source_response_emits_keepalive_while_upstream_is_silent():
+    async def slow_events():
+        await asyncio.sleep(0.05)
+        yield format_sse("result", {"text": "ok"})
+
+    bodies = asyncio.run(_run_response(EventSourceResponse(slow_events(), ping_interval=0.01)))
+    assert bodies[0] == SSE_KEEPALIVE
+    assert [body for body in bodies if body != SSE_KEEPALIVE] == [format_sse("result", {"text": "ok"}), b""]
+
+
+def test_event_source_response_allows_cancel_scope_across_yield():
+    async def scoped_events():
+        with anyio.fail_after(1):
+            yield format_sse("status", {"step": 1})
+            await asyncio.sleep(0.03)
+            yield format_sse("result", {"text": "ok"})
+
+    bodies = asyncio.run(_run_response(EventSourceResponse(scoped_events(), ping_interval=0.01)))
+    frames = [body for body in bodies if body not in (SSE_KEEPALIVE, b"")]
+    assert frames == [format_sse("status", {"step": 1}), format_sse("result", {"text": "ok"})]
+    assert SSE_KEEPALIVE in bodies
+
+
+def test_event_source_response_cancels_stream_on_client_disconnect():
+    cancelled = asyncio.Event()
+
+    async def never_ending_upstream():
+        try:
+            await asyncio.sleep(60)
+            yield format_sse("result", {"text": "late"})
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+
+    async def run():
+        sent = []
+
+        async def receive():
+            await asyncio.sleep(0.01)
+            return {"type": "http.disconnect"}
+
+        async def send(message):
+            sent.append(message)
+
+        scope = {"type": "http", "asgi": {"spec_version": "2.4"}}
+        response = EventSourceResponse(never_ending_upstream(), ping_interval=None)
+        await asyncio.wait_for(response(scope, receive, send), timeout=1)
+        return sent
+
+    sent = asyncio.run(run())
+    assert cancelled.is_set()
+    assert all(message.get("body", b"") != format_sse("result", {"text": "late"}) for message in sent)
+
+
+def test_event_source_response_propagates_original_exception_type():
+    async def failing_events():
+        yield format_sse("status", {"step": 1})
+        raise ValueError("upstream failed")
+
+    with pytest.raises(ValueError, match="upstream failed"):
+        asyncio.run(_run_response(EventSourceResponse(failing_events(), ping_interval=0.01)))
+
+
+def test_event_source_response_reports_send_failure_as_client_disconnect():
+    async def events():
+        yield format_sse("result", {"text": "ok"})
+
+    async def run():
+        async def receive():
+            await asyncio.sleep(1)
+            return {"type": "http.disconnect"}
+
+        async def send(message):
+            if message["type"] == "http.response.body":
+                raise OSError("broken pipe")
+
+        scope = {"type": "http", "asgi": {"spec_version": "2.4"}}
+        await EventSourceResponse(events(), ping_interval=None)(scope, receive, send)
+
+    with pytest.raises(ClientDisconnect):
+        asyncio.run(run())
@@ -0,0 +1,34 @@
+from app.utils.cache import TTLCache
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_ttl_cache_evicts_least_recently_used():
+    cache = TTLCache(maxsize=2, ttl_seconds=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1  # a가 최근 사용으로 이동
+    cache.set("c", 3)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    assert len(cache) == 2
+
+
+def test_ttl_cache_expires_entries():
+    clock = _Clock()
+    cache = TTLCache(maxsize=10, ttl_seconds=5, timer=clock)
+    cache.set("a", [1])
+
+    clock.now = 4.9
+    assert cache.get("a") == [1]
+    clock.now = 5.0
+    assert cache.get("a", []) == []
+    assert len(cache) == 0